@@ -0,0 +1,164 @@
+"""
+Benchmarks how operator results are built: through List.__init__ on a copy of an already built list,
+as the operators used to, against List._new() filling the result directly.
+Reports the time per call, and the peak memory allocated by a call in bytes per element:
+about 8 bytes for the result alone, about 16 when an intermediate list is copied into it.
+
+Usage:
+    python benchmarks/bench_construction.py [--sizes 10,1e5] [--repeat 3]
+"""
+import argparse
+import sys
+import timeit
+import tracemalloc
+
+from linqit import (
+    List,
+)
+
+# The minimal duration of a timed run, repeated calls are grouped until it is reached.
+_MIN_RUN_SECONDS = 0.02
+
+
+def _cases(size):
+    """
+    Returns the cases: (name, the former way of building the result, the current one).
+    """
+    numbers = List(range(size))
+    other = List(range(size))
+    half = size // 2
+    return [
+        (
+            "construct",
+            lambda: List(numbers),
+            lambda: List._new(numbers),
+        ),
+        (
+            "map",
+            lambda: List(map(abs, numbers)),
+            lambda: List._new(map(abs, numbers)),
+        ),
+        (
+            "slice",
+            lambda: List(list.__getitem__(numbers, slice(None, half))),
+            lambda: numbers[:half],
+        ),
+        (
+            "add",
+            lambda: List(list.__add__(numbers, other)),
+            lambda: numbers + other,
+        ),
+        (
+            "concat",
+            lambda: List(List(list.__add__(numbers, other))),
+            lambda: numbers.concat(other),
+        ),
+        (
+            "mul",
+            lambda: List(list.__mul__(numbers, 3)),
+            lambda: numbers * 3,
+        ),
+        # order_by() also keeps what then_by() needs, which small lists pay for.
+        (
+            "order_by",
+            lambda: List(sorted(numbers)),
+            lambda: numbers.order_by(),
+        ),
+    ]
+
+
+def _time(case, repeat):
+    """
+    Times a case, grouping calls until a run lasts long enough to be measured.
+
+    :return: The best time per call, in seconds.
+    :rtype: float
+    """
+    timer = timeit.Timer(case)
+    number = 1
+    while timer.timeit(number) < _MIN_RUN_SECONDS and number < 10 ** 6:
+        number *= 10
+    return (
+        min(
+            timer.repeat(
+                number=number,
+                repeat=repeat,
+            )
+        )
+        / number
+    )
+
+
+def _peak_memory(case):
+    """
+    Measures the peak memory allocated by a single call of a case, in bytes.
+    """
+    tracemalloc.start()
+    try:
+        case()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes, repeat=3):
+    """
+    Runs the benchmarks and prints their results.
+    """
+    for size in sizes:
+        for name, before, after in _cases(size):
+            before_seconds = _time(
+                before,
+                repeat,
+            )
+            after_seconds = _time(
+                after,
+                repeat,
+            )
+            elements = max(
+                len(after()),
+                1,
+            )
+            print(
+                "{size:>8} {name:<10}{before:>12.3f}us ->{after:>10.3f}us "
+                "{before_memory:>8.1f} -> {after_memory:>5.1f} B/element".format(
+                    size=size,
+                    name=name,
+                    before=before_seconds * 1e6,
+                    after=after_seconds * 1e6,
+                    before_memory=_peak_memory(before) / elements,
+                    after_memory=_peak_memory(after) / elements,
+                )
+            )
+
+
+def _sizes(text):
+    return [int(float(size)) for size in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmarks how operator results are built.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_sizes,
+        default=[10, 100000],
+        help="Comma separated list sizes (default: 10,1e5).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timed runs per case, the best one is kept (default: 3).",
+    )
+    args = parser.parse_args(argv)
+    run(
+        args.sizes,
+        args.repeat,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,406 @@
+"""
+Benchmarks the List operators and common chains over a sweep of list sizes,
+on plain ints, small objects and objects with nested attributes.
+Reports the time per call, the throughput and the peak memory allocated by each case,
+and compares them with a saved baseline, failing when a case got slower, or allocated more memory at its peak,
+than the thresholds.
+Baselines are only comparable on the same machine and Python version.
+
+Usage:
+    python benchmarks/bench_operators.py [--sizes 1e3,1e4,1e5] [--datasets ints,objects,nested]
+        [-k where] [--repeat 3] [--save-baseline baseline.json]
+        [--compare baseline.json] [--threshold 0.25] [--memory-threshold 0.25]
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+
+from linqit import (
+    List,
+    X,
+)
+
+# The minimal duration of a timed run, repeated calls are grouped until it is reached.
+_MIN_RUN_SECONDS = 0.02
+
+# Peak memory differences below this many bytes are noise, not regressions.
+_MIN_MEMORY_REGRESSION = 1024
+
+
+class Address(object):
+    def __init__(self, city, zip_code):
+        self.city = city
+        self.zip_code = zip_code
+
+
+class Person(object):
+    def __init__(self, name, age, address=None):
+        self.name = name
+        self.age = age
+        self.address = address
+
+
+def _ints(size):
+    numbers = list(range(size))
+    random.Random(0).shuffle(numbers)
+    return List(numbers)
+
+
+def _objects(size):
+    rng = random.Random(0)
+    return List(
+        Person(
+            "person{i}".format(i=i),
+            rng.randrange(100),
+        )
+        for i in range(size)
+    )
+
+
+def _nested(size):
+    rng = random.Random(0)
+    return List(
+        Person(
+            "person{i}".format(i=i),
+            rng.randrange(100),
+            Address(
+                "city{c}".format(c=rng.randrange(50)),
+                rng.randrange(1000),
+            ),
+        )
+        for i in range(size)
+    )
+
+
+def _int_cases(numbers):
+    other = numbers[: len(numbers) // 2]
+    mixed = List(numbers + [str(number) for number in other])
+    half = len(numbers) // 2
+    is_even = lambda x: x % 2 == 0
+    return [
+        ("where", lambda: numbers.where(is_even)),
+        ("select", lambda: numbers.select(lambda x: x * 2)),
+        ("except_for", lambda: numbers.except_for(is_even)),
+        ("of_type", lambda: mixed.of_type(int)),
+        ("skip", lambda: numbers.skip(half)),
+        ("take", lambda: numbers.take(half)),
+        ("first", lambda: numbers.first(lambda x: x < 10)),
+        ("last", lambda: numbers.last(lambda x: x < 10)),
+        ("any", lambda: numbers.any(lambda x: x < 0)),
+        ("all", lambda: numbers.all(lambda x: x >= 0)),
+        ("contains", lambda: numbers.contains(-1)),
+        ("distinct", lambda: numbers.select(lambda x: x % 1000).distinct()),
+        ("intersect", lambda: numbers.intersect(other)),
+        ("union", lambda: numbers.union(other)),
+        ("except_items", lambda: numbers.except_items(other)),
+        ("concat", lambda: numbers.concat(other)),
+        ("order_by", lambda: numbers.order_by()),
+        ("order_by_descending", lambda: numbers.order_by_descending()),
+        ("order_by.then_by", lambda: numbers.order_by(lambda x: x % 10).then_by()),
+        (
+            "order_by.then_by_descending",
+            lambda: numbers.order_by(lambda x: x % 10).then_by_descending(),
+        ),
+        ("top", lambda: numbers.top(10)),
+        ("bottom", lambda: numbers.bottom(10)),
+        ("sum", lambda: numbers.sum),
+        ("min", lambda: numbers.min),
+        ("max", lambda: numbers.max),
+        ("avg", lambda: numbers.avg),
+        ("var", lambda: numbers.var),
+        ("std", lambda: numbers.std),
+        ("median", lambda: numbers.median),
+        ("percentile", lambda: numbers.percentile(90)),
+        ("stats", lambda: numbers.stats()),
+        ("chunk", lambda: numbers.chunk(100).to_list()),
+        ("window", lambda: numbers.window(10, step=10).to_list()),
+        ("view.skip.take", lambda: numbers.view().skip(half).take(10).to_list()),
+        ("where.select", lambda: numbers.where(is_even).select(lambda x: x * 2)),
+        (
+            "lazy.where.select.take",
+            lambda: numbers.lazy().where(is_even).select(lambda x: x * 2).take(10).to_list(),
+        ),
+    ]
+
+
+def _object_cases(people):
+    is_old = lambda p: p.age > 50
+    by_age = lambda p: p.age
+    ages = List(range(0, 100, 2))
+    return [
+        ("where", lambda: people.where(is_old)),
+        ("where(**filters)", lambda: people.where(age__gt=50)),
+        ("where(X)", lambda: people.where(X.age > 50)),
+        ("select", lambda: people.select(lambda p: p.age)),
+        ("projection", lambda: people.age),
+        ("distinct", lambda: people.distinct(lambda p: p.age)),
+        ("order_by", lambda: people.order_by(lambda p: p.age)),
+        (
+            "order_by.then_by",
+            lambda: people.order_by(lambda p: p.age).then_by(lambda p: p.name),
+        ),
+        ("top", lambda: people.top(10, lambda p: p.age)),
+        ("first", lambda: people.first(lambda p: p.age < 0, None)),
+        ("last", lambda: people.last(lambda p: p.age < 0, None)),
+        ("any", lambda: people.any(lambda p: p.age < 0)),
+        ("all", lambda: people.all(lambda p: p.age >= 0)),
+        ("get_by_attr", lambda: people.get_by_attr("age")),
+        ("max_by", lambda: people.max_by(lambda p: p.age)),
+        ("min_by", lambda: people.min_by(lambda p: p.age)),
+        ("to_lookup", lambda: people.to_lookup(by_age)),
+        ("join", lambda: people.join(ages, by_age, lambda age: age)),
+        ("join(how=left)", lambda: people.join(ages, by_age, lambda age: age, how="left")),
+        ("group_join", lambda: people.group_join(ages, by_age, lambda age: age)),
+        ("projection.sum", lambda: people.age.sum),
+        ("projection.avg", lambda: people.age.avg),
+        ("group_by.aggregate", lambda: people.group_by(lambda p: p.age).aggregate(n="count")),
+        ("where.order_by.take", lambda: people.where(is_old).order_by(lambda p: p.name).take(10)),
+        (
+            "lazy.where.order_by.take",
+            lambda: people.lazy().where(is_old).order_by(lambda p: p.name).take(10).to_list(),
+        ),
+    ]
+
+
+def _nested_cases(people):
+    return [
+        ("where", lambda: people.where(lambda p: p.address.zip_code > 500)),
+        ("select", lambda: people.select(lambda p: p.address.city)),
+        ("projection", lambda: people.address.city),
+        ("distinct", lambda: people.distinct(lambda p: p.address.city)),
+        ("order_by", lambda: people.order_by(lambda p: p.address.zip_code)),
+        ("group_by", lambda: people.group_by(lambda p: p.address.city).to_list()),
+        ("projection.max", lambda: people.address.zip_code.max),
+    ]
+
+
+# The datasets, by name: (builder of a List of a given size, its cases).
+_DATASETS = {
+    "ints": (_ints, _int_cases),
+    "objects": (_objects, _object_cases),
+    "nested": (_nested, _nested_cases),
+}
+
+
+def _time(case, repeat):
+    """
+    Times a case, grouping calls until a run lasts long enough to be measured.
+
+    :return: The best time per call, in seconds.
+    :rtype: float
+    """
+    timer = timeit.Timer(case)
+    number = 1
+    while timer.timeit(number) < _MIN_RUN_SECONDS and number < 10 ** 6:
+        number *= 10
+    return (
+        min(
+            timer.repeat(
+                number=number,
+                repeat=repeat,
+            )
+        )
+        / number
+    )
+
+
+def _peak_memory(case):
+    """
+    Measures the peak memory allocated by a single call of a case, in bytes.
+    It is measured apart from the timed runs, which tracing would slow down.
+    """
+    tracemalloc.start()
+    try:
+        case()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes, datasets, keyword=None, repeat=3):
+    """
+    Runs the benchmarks and prints their results.
+
+    :return: The results by "dataset/size/case": seconds per call and peak memory in bytes.
+    :rtype: dict
+    """
+    results = {}
+    for dataset in datasets:
+        build, cases = _DATASETS[dataset]
+        for size in sizes:
+            objects = build(size)
+            for name, case in cases(objects):
+                if keyword and keyword not in name:
+                    continue
+                seconds = _time(
+                    case,
+                    repeat,
+                )
+                memory = _peak_memory(case)
+                key = "{dataset}/{size}/{name}".format(
+                    dataset=dataset,
+                    size=size,
+                    name=name,
+                )
+                results[key] = {
+                    "seconds": seconds,
+                    "memory": memory,
+                }
+                print(
+                    "{key:<48}{seconds:>12.6f}s {throughput:>14,.0f}/s {memory:>12,}B".format(
+                        key=key,
+                        seconds=seconds,
+                        throughput=size / seconds,
+                        memory=memory,
+                    )
+                )
+    return results
+
+
+def compare(results, baseline, threshold, memory_threshold):
+    """
+    Compares results with a baseline, and prints the cases that got slower,
+    or allocated more memory at their peak, than the thresholds.
+
+    :param threshold: The allowed slowdown, as a fraction of the baseline time.
+    :type threshold: float
+    :param memory_threshold: The allowed peak memory growth, as a fraction of the baseline peak memory.
+    :type memory_threshold: float
+    :return: The regressed cases.
+    :rtype: list
+    """
+    regressions = []
+    for key, result in sorted(results.items()):
+        if key not in baseline:
+            continue
+        regressed = False
+        ratio = result["seconds"] / baseline[key]["seconds"]
+        if ratio > 1 + threshold:
+            regressed = True
+            print(
+                "REGRESSION {key}: {ratio:.2f}x the baseline time".format(
+                    key=key,
+                    ratio=ratio,
+                )
+            )
+        memory, baseline_memory = result["memory"], baseline[key]["memory"]
+        if (
+            memory > baseline_memory * (1 + memory_threshold)
+            and memory - baseline_memory >= _MIN_MEMORY_REGRESSION
+        ):
+            regressed = True
+            print(
+                "REGRESSION {key}: {memory:,}B peak memory, against {baseline_memory:,}B in the baseline".format(
+                    key=key,
+                    memory=memory,
+                    baseline_memory=baseline_memory,
+                )
+            )
+        if regressed:
+            regressions.append(key)
+    return regressions
+
+
+def _sizes(text):
+    return [int(float(size)) for size in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the List operators over a sweep of sizes.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_sizes,
+        default=[1000, 10000, 100000],
+        help="Comma separated list sizes, up to 1e7 (default: 1e3,1e4,1e5).",
+    )
+    parser.add_argument(
+        "--datasets",
+        type=lambda text: text.split(","),
+        default=list(_DATASETS),
+        help="Comma separated datasets, among: {datasets}.".format(
+            datasets=", ".join(_DATASETS),
+        ),
+    )
+    parser.add_argument(
+        "-k",
+        dest="keyword",
+        help="Only run the cases whose name contains this keyword.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timed runs per case, the best one is kept (default: 3).",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        metavar="PATH",
+        help="Save the results as a JSON baseline.",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="PATH",
+        help="Compare the results with a JSON baseline, and fail on regressions.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="The allowed slowdown against the baseline, as a fraction (default: 0.25).",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=0.25,
+        help="The allowed peak memory growth against the baseline, as a fraction (default: 0.25).",
+    )
+    args = parser.parse_args(argv)
+    unknown = set(args.datasets) - set(_DATASETS)
+    if unknown:
+        parser.error(
+            "unknown datasets: {datasets}".format(
+                datasets=", ".join(sorted(unknown)),
+            )
+        )
+
+    results = run(
+        args.sizes,
+        args.datasets,
+        args.keyword,
+        args.repeat,
+    )
+    if args.save_baseline:
+        with open(
+            args.save_baseline,
+            "w",
+        ) as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        if compare(
+            results,
+            baseline,
+            args.threshold,
+            args.memory_threshold,
+        ):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
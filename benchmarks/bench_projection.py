@@ -0,0 +1,164 @@
+"""
+Benchmarks attribute projection (List.__getattr__) over homogeneous objects: the former implementation,
+which walked the objects and their values in four passes (hasattr, getattr, then the iterable
+and callable checks on every value), against the current single pass that checks each value type once.
+
+Usage:
+    python benchmarks/bench_projection.py [--sizes 1e6] [--repeat 5]
+"""
+import argparse
+import sys
+import timeit
+from itertools import (
+    chain,
+)
+
+from linqit import (
+    List,
+)
+
+
+class Person(object):
+    def __init__(self, age):
+        self.age = age
+        self.phones = [age, age + 1]
+
+    def greet(self, greeting):
+        return greeting
+
+
+def _former_projection(objects, item):
+    """
+    Projects an attribute the way List.__getattr__ used to.
+    """
+    relevant_objects = list(
+        filter(
+            lambda obj: hasattr(
+                obj,
+                item,
+            ),
+            objects,
+        )
+    )
+    if not relevant_objects:
+        raise AttributeError(item)
+
+    attributes_values = List(
+        [
+            getattr(
+                obj,
+                item,
+            )
+            for obj in relevant_objects
+        ]
+    )
+
+    if all(
+        hasattr(
+            attr_value,
+            "__iter__",
+        )
+        and not isinstance(
+            attr_value,
+            str,
+        )
+        for attr_value in attributes_values
+    ):
+        return List(chain.from_iterable(attributes_values))
+    elif all(callable(attr_value) for attr_value in attributes_values):
+        return lambda *args: List(
+            [
+                attr_value(*args)
+                for obj, attr_value in zip(
+                    relevant_objects,
+                    attributes_values,
+                )
+            ]
+        )
+
+    return attributes_values
+
+
+def _cases(size):
+    """
+    Returns the cases: (name, the former projection, the current one).
+    """
+    people = List._new(Person(i) for i in range(size))
+    return [
+        (
+            "plain value",
+            lambda: _former_projection(people, "age"),
+            lambda: people.age,
+        ),
+        (
+            "iterable value",
+            lambda: _former_projection(people, "phones"),
+            lambda: people.phones,
+        ),
+        (
+            "method",
+            lambda: _former_projection(people, "greet")("hi"),
+            lambda: people.greet("hi"),
+        ),
+    ]
+
+
+def run(sizes, repeat=5):
+    """
+    Runs the benchmarks and prints their results.
+    """
+    for size in sizes:
+        for name, before, after in _cases(size):
+            if before() != after():
+                raise AssertionError("The projections of {} differ".format(name))
+            before_seconds, after_seconds = (
+                min(
+                    timeit.repeat(
+                        case,
+                        number=1,
+                        repeat=repeat,
+                    )
+                )
+                for case in (before, after)
+            )
+            print(
+                "{size:>8} {name:<16}{before:>8.3f}s ->{after:>7.3f}s {speedup:>6.1f}x".format(
+                    size=size,
+                    name=name,
+                    before=before_seconds,
+                    after=after_seconds,
+                    speedup=before_seconds / after_seconds,
+                )
+            )
+
+
+def _sizes(text):
+    return [int(float(size)) for size in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmarks attribute projection.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_sizes,
+        default=[1000000],
+        help="Comma separated list sizes (default: 1e6).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timed runs per case, the best one is kept (default: 5).",
+    )
+    args = parser.parse_args(argv)
+    run(
+        args.sizes,
+        args.repeat,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,21 @@
 from linqit.linq_list import (
     List,
 )
+from linqit.enumerable import (
+    Enumerable,
+)
+from linqit.list_view import (
+    ListView,
+)
+from linqit.async_list import (
+    AsyncList,
+)
+from linqit.columnar import (
+    ColumnarList,
+)
+from linqit.expressions import (
+    X,
+    Expression,
+)
 
-__all__ = ["List"]
+__all__ = ["List", "Enumerable", "ListView", "AsyncList", "ColumnarList", "X", "Expression"]
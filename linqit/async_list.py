@@ -0,0 +1,278 @@
+import asyncio
+import inspect
+
+from linqit.linq_list import (
+    _NO_EXPR,
+    _NONE,
+    List,
+    _where_predicate,
+)
+
+
+async def _resolve(value):
+    """
+    Awaits the value if it is awaitable, so expressions may be plain functions or coroutine functions.
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _map_bounded(expression, objects, concurrency, stop=None):
+    """
+    Evaluates the expression on every object, awaiting at most `concurrency` results at once.
+    A fixed set of workers pulls the objects in order, so no task is created per object.
+    If an expression raises, the other workers are cancelled and the exception is raised.
+
+    :param expression: The expression, a function or a coroutine function.
+    :type expression: function
+    :param objects: The objects to evaluate.
+    :type objects: list
+    :param concurrency: The maximal number of expressions awaited at once.
+    :type concurrency: int
+    :param stop: Called with (index, result) after each evaluation, returns True to stop pulling
+        objects after that index.
+    :type stop: function or None
+    :return: The results, by object index. Objects that were not evaluated are left as _NONE.
+    :rtype: list
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    results = [_NONE] * len(objects)
+    pending = iter(enumerate(objects))
+    stop_after = [len(objects)]
+
+    async def worker():
+        for index, obj in pending:
+            if index > stop_after[0]:
+                return
+            result = results[index] = await _resolve(expression(obj))
+            if stop is not None and stop(index, result):
+                stop_after[0] = min(
+                    stop_after[0],
+                    index,
+                )
+
+    workers = [
+        asyncio.ensure_future(worker())
+        for _ in range(
+            min(
+                concurrency,
+                len(objects),
+            )
+        )
+    ]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        # When an expression raises, or the caller is cancelled, the other workers stop pulling objects.
+        for task in workers:
+            task.cancel()
+    return results
+
+
+async def _aiter(source):
+    if hasattr(
+        source,
+        "__aiter__",
+    ):
+        async for obj in source:
+            yield obj
+    else:
+        for obj in source:
+            yield obj
+
+
+async def _select(objects, expression):
+    async for obj in objects:
+        yield await _resolve(expression(obj))
+
+
+async def _where(objects, expression):
+    async for obj in objects:
+        if await _resolve(expression(obj)):
+            yield obj
+
+
+async def _skip(objects, count):
+    async for obj in objects:
+        if count > 0:
+            count -= 1
+        else:
+            yield obj
+
+
+async def _take(objects, count):
+    if count <= 0:
+        return
+    async for obj in objects:
+        yield obj
+        count -= 1
+        if not count:
+            return
+
+
+_OPERATORS = {
+    "select": _select,
+    "where": _where,
+    "skip": _skip,
+    "take": _take,
+}
+
+
+class AsyncList(object):
+    """
+    A deferred query over a synchronous or asynchronous iterable source.
+    Objects are streamed through the chained operators one at a time, so the source is never loaded as a whole.
+    Expressions may be plain functions or coroutine functions.
+    """
+
+    def __init__(self, source, steps=()):
+        """
+        Initializes a new AsyncList instance.
+
+        :param source: The iterable or async iterable to query.
+        :type source: iterable or async iterable
+        :param steps: The recorded (operator name, argument) steps.
+        :type steps: tuple
+        """
+        self._source = source
+        self._steps = tuple(steps)
+
+    def __aiter__(self):
+        """
+        Runs the recorded chain over the source.
+
+        :return: An async iterator over the query results.
+        :rtype: async iterator
+        """
+        objects = _aiter(self._source)
+        for name, argument in self._steps:
+            objects = _OPERATORS[name](
+                objects,
+                argument,
+            )
+        return objects
+
+    def _chain(self, name, argument):
+        return AsyncList(
+            self._source,
+            self._steps + ((name, argument),),
+        )
+
+    def select(self, expression):
+        """
+        Records a transformation of each object by the given expression.
+
+        :param expression: The expression to transform each object, may be a coroutine function.
+        :type expression: function
+        :return: A new AsyncList.
+        :rtype: AsyncList
+        """
+        return self._chain(
+            "select",
+            expression,
+        )
+
+    def where(self, expression=None, **filters):
+        """
+        Records a filter on the objects that satisfy the given expression and filters.
+
+        :param expression: The expression to evaluate for each object, may be a coroutine function.
+        :type expression: function or None
+        :param filters: Additional attribute filters to apply, as in List.where().
+        :type filters: dict
+        :return: A new AsyncList.
+        :rtype: AsyncList
+        """
+        query = self
+        if expression is not None:
+            query = query._chain(
+                "where",
+                expression,
+            )
+        if filters:
+            query = query._chain(
+                "where",
+                _where_predicate(
+                    None,
+                    filters,
+                ),
+            )
+        return query
+
+    def skip(self, count):
+        """
+        Records skipping the first n objects.
+
+        :param count: The number of objects to skip.
+        :type count: int
+        :return: A new AsyncList.
+        :rtype: AsyncList
+        """
+        return self._chain(
+            "skip",
+            count,
+        )
+
+    def take(self, count):
+        """
+        Records keeping only the first n objects. The source is not read past the n-th object.
+
+        :param count: The number of objects to take.
+        :type count: int
+        :return: A new AsyncList.
+        :rtype: AsyncList
+        """
+        return self._chain(
+            "take",
+            count,
+        )
+
+    async def to_list(self):
+        """
+        Runs the query and materializes its results.
+
+        :return: A new List containing the results.
+        :rtype: List
+        """
+        return List._new([obj async for obj in self])
+
+    async def first(
+        self,
+        expression=_NO_EXPR,
+        default=_NONE,
+    ):
+        """
+        Returns the first result that satisfies the given expression, and stops reading the source.
+
+        :param expression: The expression to evaluate for each object, may be a coroutine function.
+        :type expression: function
+        :param default: The default value to return if no matching value is found.
+        :return: The first matching object or the default value.
+        :rtype: object
+        :raises IndexError: If no matching value is found and no default value is provided.
+        """
+        async for obj in self:
+            if await _resolve(expression(obj)):
+                return obj
+        if default is not _NONE:
+            return default
+        raise IndexError("No matching values")
+
+    async def any(
+        self,
+        expression=_NO_EXPR,
+    ):
+        """
+        Checks if any result satisfies the given expression, and stops reading the source once one does.
+
+        :param expression: The expression to evaluate for each object, may be a coroutine function.
+        :type expression: function
+        :return: True if any result satisfies the expression, False otherwise.
+        :rtype: bool
+        """
+        async for obj in self:
+            if await _resolve(expression(obj)):
+                return True
+        return False
@@ -0,0 +1,578 @@
+from array import (
+    array,
+)
+from collections import (
+    namedtuple,
+)
+from collections.abc import (
+    Mapping,
+)
+from functools import (
+    reduce,
+)
+from itertools import (
+    compress,
+    repeat,
+)
+from operator import (
+    attrgetter,
+    eq,
+    ge,
+    gt,
+    itemgetter,
+    le,
+    lt,
+    ne,
+)
+
+from linqit.expressions import (
+    Expression,
+    _And,
+    _conjuncts,
+    _filter_of,
+    _function_of,
+)
+from linqit.linq_list import (
+    _LOOKUPS,
+    _NO_EXPR,
+    _NONE,
+    _NUMPY_MIN_SIZE,
+    List,
+    Stats,
+    _HashedItems,
+    _parse_filter,
+    _stats,
+    numpy,
+)
+
+# Compact column types, by the type of all the values of a column.
+_TYPECODES = {
+    int: "q",
+    float: "d",
+}
+
+# NumPy views of the compact columns, by their array typecode.
+_DTYPES = {
+    "q": "int64",
+    "d": "float64",
+}
+
+# Keyword filter lookups that NumPy runs on a whole column at once.
+_VECTOR_LOOKUPS = {
+    "exact": eq,
+    "ne": ne,
+    "gt": gt,
+    "gte": ge,
+    "lt": lt,
+    "lte": le,
+    "in": lambda values, options: numpy.isin(
+        values,
+        list(options),
+    ),
+}
+
+
+def _compact(values):
+    """
+    Stores a column of values as an array of int64 or float64 when all of them are ints or floats,
+    and as a list otherwise.
+
+    :param values: The values of the column.
+    :type values: list
+    :return: The column.
+    :rtype: array.array or list
+    """
+    types = set(
+        map(
+            type,
+            values,
+        )
+    )
+    if len(types) == 1:
+        (value_type,) = types
+        if value_type in _TYPECODES:
+            try:
+                return array(
+                    _TYPECODES[value_type],
+                    values,
+                )
+            except OverflowError:
+                # Beyond int64, keep Python's ints.
+                pass
+    return values
+
+
+def _fields_of(record):
+    """
+    Infers the field names of a record: the keys of a mapping, the fields of a named tuple,
+    or the public attributes of an object.
+    """
+    if isinstance(
+        record,
+        Mapping,
+    ):
+        return list(record)
+    if hasattr(
+        record,
+        "_fields",
+    ):
+        return list(record._fields)
+    return [name for name in vars(record) if not name.startswith("_")]
+
+
+def _vector(column):
+    """
+    Returns a NumPy view of a column, without copying, when NumPy is installed and the column
+    is a large enough array.
+
+    :return: The NumPy array, or None.
+    :rtype: numpy.ndarray or None
+    """
+    if (
+        numpy is None
+        or not isinstance(
+            column,
+            array,
+        )
+        or len(column) < _NUMPY_MIN_SIZE
+    ):
+        return None
+    return numpy.frombuffer(
+        column,
+        dtype=_DTYPES[column.typecode],
+    )
+
+
+def _filter_column(column, indexes, lookup, value):
+    """
+    Selects the rows whose value in the column satisfies a keyword filter lookup.
+
+    :param column: The column to filter on.
+    :type column: array.array or list
+    :param indexes: The indexes of the rows selected so far, all of them as a range.
+    :type indexes: range, list or numpy.ndarray
+    :param lookup: The lookup name, as parsed by _parse_filter().
+    :type lookup: str
+    :param value: The filter value.
+    :return: The indexes of the selected rows, in order.
+    :rtype: list or numpy.ndarray
+    """
+    values = _vector(column)
+    if values is not None and lookup in _VECTOR_LOOKUPS:
+        if not isinstance(
+            indexes,
+            range,
+        ):
+            indexes = numpy.asarray(
+                indexes,
+                dtype="int64",
+            )
+            values = values[indexes]
+        mask = _VECTOR_LOOKUPS[lookup](
+            values,
+            value,
+        )
+        if isinstance(
+            indexes,
+            range,
+        ):
+            return numpy.flatnonzero(mask)
+        return indexes[mask]
+
+    if lookup == "in":
+        value = _HashedItems(value)
+    return list(
+        compress(
+            indexes,
+            map(
+                _LOOKUPS[lookup],
+                column
+                if isinstance(
+                    indexes,
+                    range,
+                )
+                else map(
+                    column.__getitem__,
+                    indexes,
+                ),
+                repeat(value),
+            ),
+        )
+    )
+
+
+def _gather(column, indexes):
+    """
+    Copies the values of the column at the given indexes into a new column of the same type.
+    """
+    vector = _vector(column)
+    if vector is not None:
+        return array(
+            column.typecode,
+            vector[
+                numpy.asarray(
+                    indexes,
+                    dtype="int64",
+                )
+            ].tobytes(),
+        )
+    values = map(
+        column.__getitem__,
+        indexes,
+    )
+    if isinstance(
+        column,
+        array,
+    ):
+        return array(
+            column.typecode,
+            values,
+        )
+    return list(values)
+
+
+class ColumnarList(object):
+    """
+    A list of records stored column by column.
+    Each field is kept as one column: a compact array of int64 or float64 values when all of them
+    are ints or floats, and a list otherwise, so millions of small records don't cost an object each.
+    Projecting a field returns its column without a per-record getattr, keyword filters
+    run column by column (with NumPy when it is installed), and records are only built,
+    as named tuples, when the list is iterated.
+    Other List operators run on the List of the records.
+    """
+
+    def __init__(self, columns):
+        """
+        Initializes a new ColumnarList instance.
+
+        :param columns: The columns by their field names, all of the same length.
+        :type columns: dict
+        """
+        self._columns = dict(columns)
+        self._record = namedtuple(
+            "Record",
+            list(self._columns),
+            rename=True,
+        )
+
+    @classmethod
+    def from_records(cls, records, fields=None):
+        """
+        Stores records column by column.
+
+        :param records: The records: objects, mappings or named tuples.
+        :type records: iterable
+        :param fields: The fields to store, inferred from the first record by default.
+        :type fields: list or None
+        :return: A new ColumnarList.
+        :rtype: ColumnarList
+        """
+        records = list(records)
+        if fields is None:
+            fields = _fields_of(records[0]) if records else []
+        getter = (
+            itemgetter
+            if records
+            and isinstance(
+                records[0],
+                Mapping,
+            )
+            else attrgetter
+        )
+        return cls(
+            (
+                field,
+                _compact(
+                    list(
+                        map(
+                            getter(field),
+                            records,
+                        )
+                    )
+                ),
+            )
+            for field in fields
+        )
+
+    @property
+    def fields(self):
+        """
+        The names of the fields, in order.
+
+        :rtype: tuple
+        """
+        return tuple(self._columns)
+
+    def __len__(self):
+        for column in self._columns.values():
+            return len(column)
+        return 0
+
+    def __iter__(self):
+        """
+        Builds the records, one at a time.
+
+        :return: An iterator over the records, as named tuples.
+        :rtype: iterator
+        """
+        if not self._columns:
+            return iter(())
+        return map(
+            self._record,
+            *self._columns.values()
+        )
+
+    def __getitem__(self, item):
+        """
+        Retrieves the record at the specified index, or the records of the specified slice.
+
+        :param item: Index or slice specifying the record(s) to retrieve.
+        :type item: int or slice
+        :return: The record, or a new ColumnarList.
+        :rtype: ColumnarList or tuple
+        """
+        if isinstance(
+            item,
+            slice,
+        ):
+            return self._derive(
+                (field, column[item]) for field, column in self._columns.items()
+            )
+        return self._record(*(column[item] for column in self._columns.values()))
+
+    def __repr__(self):
+        return "ColumnarList({fields}, {length} records)".format(
+            fields=", ".join(self._columns),
+            length=len(self),
+        )
+
+    def __getattr__(self, item):
+        """
+        Projects a field, or runs any other List operator on the List of the records.
+
+        :param item: The field or attribute to retrieve.
+        :type item: str
+        :return: A new List of the field values, or the attribute of the List of the records.
+        :rtype: object
+        """
+        if item.startswith("_"):
+            raise AttributeError(item)
+        if item in self._columns:
+            return List._new(self._columns[item])
+        return getattr(
+            self.to_list(),
+            item,
+        )
+
+    def _derive(self, columns):
+        """
+        Returns a new ColumnarList of the same fields, reusing the record type.
+        """
+        derived = ColumnarList.__new__(ColumnarList)
+        derived._columns = dict(columns)
+        derived._record = self._record
+        return derived
+
+    def _select_rows(self, indexes):
+        return self._derive(
+            (
+                field,
+                _gather(
+                    column,
+                    indexes,
+                ),
+            )
+            for field, column in self._columns.items()
+        )
+
+    def column(self, field):
+        """
+        Returns the column of a field itself, without copying it.
+
+        :param field: The field name.
+        :type field: str
+        :return: The column.
+        :rtype: array.array or list
+        :raises KeyError: If there is no such field.
+        """
+        return self._columns[field]
+
+    def to_list(self):
+        """
+        Builds all the records.
+
+        :return: A new List of the records, as named tuples.
+        :rtype: List
+        """
+        return List._new(iter(self))
+
+    def lazy(self):
+        """
+        Returns a deferred query over the records.
+
+        :return: A new Enumerable over the records.
+        :rtype: Enumerable
+        """
+        from linqit.enumerable import (
+            Enumerable,
+        )
+
+        return Enumerable(self)
+
+    def where(self, expression=None, **filters):
+        """
+        Returns the records that satisfy the given filters and expression.
+        The keyword filters run column by column first, and the expression only runs on the records
+        that satisfy them. The leading comparisons of fields to constants in an X expression run column by column
+        too, in order, each on the records that satisfied the previous ones.
+
+        :param expression: The expression to evaluate for each record.
+        :type expression: function or None
+        :param filters: Keyword filters on the fields, as field=value or field__lookup=value.
+        :type filters: dict
+        :return: A new ColumnarList containing the filtered records.
+        :rtype: ColumnarList
+        :raises AttributeError: If a filter is on a field that does not exist.
+        """
+        indexes = range(len(self))
+        for key, value in filters.items():
+            field, lookup = _parse_filter(key)
+            if field not in self._columns:
+                raise AttributeError(field)
+            indexes = _filter_column(
+                self._columns[field],
+                indexes,
+                lookup,
+                value,
+            )
+        if isinstance(
+            expression,
+            Expression,
+        ):
+            conjuncts = _conjuncts(expression)
+            while conjuncts:
+                keyword_filter = _filter_of(conjuncts[0])
+                if keyword_filter is None:
+                    break
+                field, lookup = _parse_filter(keyword_filter[0])
+                if field not in self._columns:
+                    break
+                indexes = _filter_column(
+                    self._columns[field],
+                    indexes,
+                    lookup,
+                    keyword_filter[1],
+                )
+                conjuncts.pop(0)
+            expression = reduce(_And, conjuncts) if conjuncts else None
+        if expression is not None:
+            indexes = list(
+                compress(
+                    indexes,
+                    map(
+                        _function_of(expression),
+                        self._select_rows(indexes),
+                    ),
+                )
+            )
+        return self._select_rows(indexes)
+
+    def select(self, expression):
+        """
+        Returns a new list containing the values obtained by applying the expression to each record.
+
+        :param expression: The expression to transform each record.
+        :type expression: function
+        :return: A new List containing the transformed values.
+        :rtype: List
+        """
+        return List._new(
+            map(
+                expression,
+                self,
+            )
+        )
+
+    def skip(self, count):
+        """
+        Returns the records starting from the specified index.
+
+        :param count: The number of records to skip.
+        :type count: int
+        :return: A new ColumnarList containing the remaining records.
+        :rtype: ColumnarList
+        """
+        return self[max(count, 0) :]
+
+    def take(self, count):
+        """
+        Returns the first n records.
+
+        :param count: The number of records to take.
+        :type count: int
+        :return: A new ColumnarList containing the first n records.
+        :rtype: ColumnarList
+        """
+        return self[: max(count, 0)]
+
+    def first(
+        self,
+        expression=_NO_EXPR,
+        default=_NONE,
+    ):
+        """
+        Returns the first record that satisfies the given expression.
+        Records are only built until it is found.
+
+        :param expression: The expression to evaluate for each record.
+        :type expression: function or None
+        :param default: The default value to return if no matching value is found.
+        :return: The first matching record or the default value.
+        :rtype: object
+        :raises IndexError: If no matching value is found and no default value is provided.
+        """
+        found = next(
+            filter(
+                expression,
+                self,
+            ),
+            default,
+        )
+        if found is not _NONE:
+            return found
+        raise IndexError("No matching values")
+
+    def stats(self, selector=None):
+        """
+        Calculates count, sum, min, max, mean and variance of a field, column-wise,
+        or of a value computed from each record.
+
+        :param selector: The field name, or an expression computing the value of each record.
+        :type selector: str or function
+        :return: The aggregates, as (count, sum, min, max, mean, variance).
+        :rtype: Stats
+        :raises KeyError: If there is no such field.
+        """
+        if not isinstance(
+            selector,
+            str,
+        ):
+            return _stats(
+                self,
+                selector,
+            )
+        column = self._columns[selector]
+        values = _vector(column)
+        if values is None:
+            return _stats(column)
+        # Python's ints don't overflow, so the sum is exact even for an int64 column.
+        total = sum(column)
+        return Stats(
+            len(values),
+            total,
+            values.min().item(),
+            values.max().item(),
+            total / len(values),
+            values.var().item(),
+        )
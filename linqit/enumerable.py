@@ -0,0 +1,960 @@
+from collections import (
+    deque,
+)
+from itertools import (
+    filterfalse,
+    islice,
+)
+from time import (
+    perf_counter,
+)
+
+from linqit.expressions import (
+    Expression,
+    _function_of,
+)
+from linqit.linq_list import (
+    _NO_EXPR,
+    _NONE,
+    List,
+    _distinct,
+    _stats,
+    _compile_filters,
+    _top,
+)
+from linqit.ordering import (
+    _ordered,
+)
+
+
+def _where(iterable, checks):
+    # The checks run in the order they were recorded, as where() runs them on a List:
+    # an earlier check may guard a later one, such as isinstance() before an attribute filter.
+    for check in checks:
+        iterable = filter(
+            _compile_filters(check)[0]
+            if isinstance(
+                check,
+                dict,
+            )
+            else _function_of(check),
+            iterable,
+        )
+    return iterable
+
+
+def _except_for(iterable, expression):
+    return filterfalse(
+        expression,
+        iterable,
+    )
+
+
+def _select(iterable, expression):
+    return map(
+        _function_of(expression),
+        iterable,
+    )
+
+
+def _skip(iterable, count):
+    return islice(
+        iterable,
+        max(count, 0),
+        None,
+    )
+
+
+def _take(iterable, count):
+    return islice(
+        iterable,
+        max(count, 0),
+    )
+
+
+def _order_by(iterable, plan):
+    return iter(
+        _ordered(
+            iterable,
+            plan,
+        )
+    )
+
+
+def _top_step(iterable, count, key, descending):
+    return iter(
+        _top(
+            iterable,
+            count,
+            key,
+            descending,
+        )
+    )
+
+
+def _chunk(iterable, size):
+    while True:
+        batch = List._new(
+            islice(
+                iterable,
+                size,
+            )
+        )
+        if not batch:
+            return
+        yield batch
+
+
+def _window(iterable, size, step):
+    window = deque(
+        islice(
+            iterable,
+            size,
+        ),
+        maxlen=size,
+    )
+    if len(window) < size:
+        return
+    while True:
+        yield List._new(window)
+        # The window keeps its last `size` objects, so a step larger than the window skips the objects between.
+        moved = list(
+            islice(
+                iterable,
+                step,
+            )
+        )
+        if len(moved) < step:
+            return
+        window.extend(moved)
+
+
+def _check_size(name, size):
+    if size < 1:
+        raise ValueError(
+            "{name} must be at least 1".format(
+                name=name,
+            )
+        )
+
+
+# Steps that handle each object on its own, so they don't depend on the order of the objects.
+_ELEMENTWISE = (
+    "where",
+    "select",
+    "except_for",
+)
+
+
+def _single_key(step):
+    return step[0] == "order_by" and len(step[1][0]) == 1
+
+
+def _merge_where(planned, args):
+    """
+    Adds a where step to the planned steps.
+    Filters don't depend on the order of the objects, so the step runs before the sorts it follows,
+    on fewer objects, and is merged into a where step right before them, after its checks.
+    """
+    (checks,) = args
+    position = len(planned)
+    while position and planned[position - 1][0] == "order_by":
+        position -= 1
+    if position and planned[position - 1][0] == "where":
+        (previous_checks,) = planned[position - 1][1]
+        planned[position - 1] = (
+            "where",
+            (previous_checks + checks,),
+        )
+        return
+    planned.insert(
+        position,
+        ("where", args),
+    )
+
+
+def _plan(steps, ordered=True):
+    """
+    Rewrites the recorded steps into the steps to run:
+    - Adjacent where steps are merged, their checks still running in the order they were recorded.
+    - Where steps run before the sorts they follow, so fewer objects are sorted.
+    - A single key sort followed by take(n), or by skip(m).take(n), only needs its first objects
+      in order, so it becomes a heap-based top-n selection.
+    - Unless the order of the results is needed, sorts only followed by element-wise steps are dropped.
+
+    :param steps: The recorded (operator name, arguments) steps.
+    :type steps: tuple
+    :param ordered: Whether the order of the results is needed.
+    :type ordered: bool
+    :return: The steps to run.
+    :rtype: list
+    """
+    planned = []
+    for name, args in steps:
+        if name == "where":
+            _merge_where(
+                planned,
+                args,
+            )
+            continue
+        if name == "take" and planned and _single_key(planned[-1]):
+            ((key, descending),) = planned.pop()[1][0]
+            name, args = "top", (args[0], key, descending)
+        elif (
+            name == "take"
+            and len(planned) > 1
+            and planned[-1][0] == "skip"
+            and _single_key(planned[-2])
+        ):
+            skip = planned.pop()
+            ((key, descending),) = planned.pop()[1][0]
+            planned.append(
+                (
+                    "top",
+                    (max(skip[1][0], 0) + max(args[0], 0), key, descending),
+                )
+            )
+            planned.append(skip)
+            continue
+        planned.append((name, args))
+    if not ordered:
+        position = len(planned)
+        while position and planned[position - 1][0] in _ELEMENTWISE + ("order_by",):
+            position -= 1
+        planned[position:] = [step for step in planned[position:] if step[0] != "order_by"]
+    return planned
+
+
+def _describe(value):
+    """
+    Describes an operator argument for explain(): functions by their name, other values by their repr.
+    """
+    if isinstance(
+        value,
+        Expression,
+    ):
+        return repr(value)
+    function = getattr(
+        value,
+        "func",
+        value,
+    )
+    if callable(function) and hasattr(
+        function,
+        "__qualname__",
+    ):
+        return function.__qualname__
+    return repr(value)
+
+
+def _describe_step(name, args):
+    if name == "where":
+        (checks,) = args
+        args = []
+        for check in checks:
+            if isinstance(
+                check,
+                dict,
+            ):
+                args.extend(
+                    "{key}={value!r}".format(
+                        key=key,
+                        value=value,
+                    )
+                    for key, value in check.items()
+                )
+            else:
+                args.append(_describe(check))
+    elif name == "order_by":
+        (plan,) = args
+        args = [
+            ("self" if key is None else _describe(key))
+            + (" descending" if descending else "")
+            for key, descending in plan
+        ]
+    else:
+        args = list(
+            map(
+                _describe,
+                args,
+            )
+        )
+    return "{name}({args})".format(
+        name=name,
+        args=", ".join(args),
+    )
+
+
+def _counted(iterable, counts, index):
+    for obj in iterable:
+        counts[index] += 1
+        yield obj
+
+
+# Maps a step name to the function that wraps the upstream iterator with it.
+_OPERATORS = {
+    "where": _where,
+    "except_for": _except_for,
+    "select": _select,
+    "skip": _skip,
+    "take": _take,
+    "distinct": _distinct,
+    "order_by": _order_by,
+    "top": _top_step,
+    "chunk": _chunk,
+    "window": _window,
+}
+
+
+class Enumerable(object):
+    """
+    A deferred query over an iterable source.
+    Chained operators are only recorded; nothing runs until a terminal operator
+    (first, any, all, sum, to_list...) is called.
+    The recorded chain is optimized, then runs as a single pass of fused iterators over the source,
+    so no intermediate lists are allocated between the steps.
+    """
+
+    def __init__(self, source, steps=()):
+        """
+        Initializes a new Enumerable instance.
+
+        :param source: The iterable to query.
+        :type source: iterable
+        :param steps: The recorded (operator name, arguments) steps.
+        :type steps: tuple
+        """
+        self._source = source
+        self._steps = tuple(steps)
+
+    def __iter__(self):
+        """
+        Runs the recorded chain over the source.
+
+        :return: An iterator over the query results.
+        :rtype: iterator
+        """
+        return self._run()
+
+    def _run(self, ordered=True):
+        """
+        Runs the planned steps over the source.
+
+        :param ordered: Whether the order of the results is needed, see _plan().
+        :type ordered: bool
+        :return: An iterator over the query results.
+        :rtype: iterator
+        """
+        iterable = iter(self._source)
+        for name, args in _plan(
+            self._steps,
+            ordered,
+        ):
+            iterable = _OPERATORS[name](
+                iterable,
+                *args
+            )
+        return iterable
+
+    def __repr__(self):
+        return "Enumerable({steps})".format(
+            steps=" -> ".join(name for name, _ in self._steps) or "source",
+        )
+
+    def explain(self, analyze=False):
+        """
+        Describes the steps the query runs, after rewrites such as order_by().take(n) into top(n).
+        With analyze, the query is run, and the number of objects into and out of each step is reported,
+        along with the total time.
+
+        :param analyze: Whether to run the query and report its object counts.
+        :type analyze: bool
+        :return: The description, one line per step.
+        :rtype: str
+        """
+        planned = _plan(self._steps)
+        source = type(self._source).__name__
+        if hasattr(
+            self._source,
+            "__len__",
+        ):
+            source += " of {length} objects".format(
+                length=len(self._source),
+            )
+        lines = ["source: " + source]
+        lines.extend(
+            "{number}. {step}".format(
+                number=number,
+                step=_describe_step(
+                    name,
+                    args,
+                ),
+            )
+            for number, (name, args) in enumerate(
+                planned,
+                1,
+            )
+        )
+        if not analyze:
+            return "\n".join(lines)
+
+        counts = [0] * (len(planned) + 1)
+        start = perf_counter()
+        iterable = _counted(
+            self._source,
+            counts,
+            0,
+        )
+        for number, (name, args) in enumerate(
+            planned,
+            1,
+        ):
+            iterable = _counted(
+                _OPERATORS[name](
+                    iterable,
+                    *args
+                ),
+                counts,
+                number,
+            )
+        for _ in iterable:
+            pass
+        seconds = perf_counter() - start
+        lines[0] += ": {count} read".format(
+            count=counts[0],
+        )
+        for number in range(
+            1,
+            len(lines),
+        ):
+            lines[number] += ": {objects_in} in, {objects_out} out".format(
+                objects_in=counts[number - 1],
+                objects_out=counts[number],
+            )
+        lines.append(
+            "total: {seconds:.6f}s".format(
+                seconds=seconds,
+            )
+        )
+        return "\n".join(lines)
+
+    def _chain(self, name, *args):
+        """
+        Returns a new Enumerable with one more recorded step.
+
+        :param name: The operator name.
+        :type name: str
+        :param args: The operator arguments.
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        """
+        return Enumerable(
+            self._source,
+            self._steps + ((name, args),),
+        )
+
+    # Deferred operators
+
+    def lazy(self):
+        """
+        Returns this enumerable, which is already deferred.
+
+        :rtype: Enumerable
+        """
+        return self
+
+    def where(self, expression=None, **filters):
+        """
+        Records a filter on the objects that satisfy the given expression and filters.
+        As in List.where(), the expression runs before the keyword filters. Adjacent filters are merged
+        and run in the order they were recorded, see _plan().
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function, Expression or None
+        :param filters: Additional attribute filters to apply, as attribute=value or attribute__lookup=value.
+        :type filters: dict
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        """
+        checks = () if expression is None else (expression,)
+        if filters:
+            checks += (dict(filters),)
+        return self._chain(
+            "where",
+            checks,
+        )
+
+    def distinct(self, key=None):
+        """
+        Records dropping duplicate objects, keeping the first occurrence of each.
+        Objects are streamed through, so it can be used mid-pipeline.
+
+        :param key: An expression computing the value to compare objects by.
+        :type key: function or None
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        """
+        return self._chain(
+            "distinct",
+            key,
+        )
+
+    def except_for(self, expression):
+        """
+        Records a filter on the objects that do not satisfy the given expression.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        """
+        return self._chain(
+            "except_for",
+            expression,
+        )
+
+    def of_type(self, _type):
+        """
+        Records a filter on the objects of the specified type.
+
+        :param _type: The type of objects to filter.
+        :type _type: type
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        :raises TypeError: If the argument is not a type.
+        """
+        if not isinstance(
+            _type,
+            type,
+        ):
+            raise TypeError("The argument must be a type")
+        return self.where(
+            lambda e: isinstance(
+                e,
+                _type,
+            )
+        )
+
+    def _then(self, expression, descending):
+        if not self._steps or self._steps[-1][0] != "order_by":
+            raise TypeError("then_by() must follow order_by()")
+        (plan,) = self._steps[-1][1]
+        return Enumerable(
+            self._source,
+            self._steps[:-1]
+            + (("order_by", (plan + ((expression, descending),),)),),
+        )
+
+    def order_by(self, expression=None):
+        """
+        Records sorting the objects according to the provided expression.
+        The sort needs all the objects, but when followed by take(n) only the n first are selected, with a heap.
+
+        :param expression: The expression to determine the sorting order.
+        :type expression: function or None
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        """
+        return self._chain(
+            "order_by",
+            ((expression, False),),
+        )
+
+    def order_by_descending(self, expression=None):
+        """
+        Records sorting the objects in descending order according to the provided expression.
+
+        :param expression: The expression to determine the sorting order.
+        :type expression: function or None
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        """
+        return self._chain(
+            "order_by",
+            ((expression, True),),
+        )
+
+    def then_by(self, expression=None):
+        """
+        Records sorting the ties of the previous order_by() further by the provided expression.
+        All the keys are sorted by in the same sort, each computed once per object.
+
+        :param expression: The expression to determine the sorting order of ties.
+        :type expression: function or None
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        :raises TypeError: If the previous operator is not order_by() or then_by().
+        """
+        return self._then(
+            expression,
+            False,
+        )
+
+    def then_by_descending(self, expression=None):
+        """
+        Records sorting the ties of the previous order_by() further by the provided expression,
+        in descending order.
+
+        :param expression: The expression to determine the sorting order of ties.
+        :type expression: function or None
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        :raises TypeError: If the previous operator is not order_by() or then_by().
+        """
+        return self._then(
+            expression,
+            True,
+        )
+
+    def select(self, expression):
+        """
+        Records a transformation of each object by the given expression.
+
+        :param expression: The expression to transform each object.
+        :type expression: function
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        """
+        return self._chain(
+            "select",
+            expression,
+        )
+
+    def skip(self, count):
+        """
+        Records skipping the first n elements.
+
+        :param count: The number of elements to skip.
+        :type count: int
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        """
+        return self._chain(
+            "skip",
+            count,
+        )
+
+    def bottom(self, count, key=None):
+        """
+        Records selecting the n lowest objects, in ascending order, with a heap.
+
+        :param count: The number of objects to select.
+        :type count: int
+        :param key: The expression to compare the objects by.
+        :type key: function or None
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        """
+        return self._chain(
+            "top",
+            count,
+            key,
+            False,
+        )
+
+    def top(self, count, key=None, descending=True):
+        """
+        Records selecting the n highest objects, in descending order, with a heap.
+
+        :param count: The number of objects to select.
+        :type count: int
+        :param key: The expression to compare the objects by.
+        :type key: function or None
+        :param descending: Whether to select the highest objects, or the lowest in ascending order.
+        :type descending: bool
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        """
+        return self._chain(
+            "top",
+            count,
+            key,
+            descending,
+        )
+
+    def take(self, count):
+        """
+        Records keeping only the first n elements.
+        The source is not read past the n-th element.
+
+        :param count: The number of elements to take.
+        :type count: int
+        :return: A new Enumerable.
+        :rtype: Enumerable
+        """
+        return self._chain(
+            "take",
+            count,
+        )
+
+    def chunk(self, size):
+        """
+        Records splitting the objects into consecutive batches of n, the last one possibly shorter.
+        Each batch is read from the upstream objects only when it is reached.
+
+        :param size: The number of objects per batch.
+        :type size: int
+        :return: A new Enumerable over the batches, as Lists.
+        :rtype: Enumerable
+        :raises ValueError: If the size is lower than 1.
+        """
+        _check_size(
+            "size",
+            size,
+        )
+        return self._chain(
+            "chunk",
+            size,
+        )
+
+    def window(self, size, step=1):
+        """
+        Records sliding a window of n objects over the objects, moving it by step objects at a time.
+        Only full windows are produced.
+
+        :param size: The number of objects per window.
+        :type size: int
+        :param step: The number of objects the window moves by.
+        :type step: int
+        :return: A new Enumerable over the windows, as Lists.
+        :rtype: Enumerable
+        :raises ValueError: If the size or the step is lower than 1.
+        """
+        _check_size(
+            "size",
+            size,
+        )
+        _check_size(
+            "step",
+            step,
+        )
+        return self._chain(
+            "window",
+            size,
+            step,
+        )
+
+    def group_by(self, key, element=None):
+        """
+        Groups the results by a key, in a single hash pass over the query.
+
+        :param key: The expression computing the key of each result.
+        :type key: function
+        :param element: An expression computing what is put in the group for each result.
+        :type element: function or None
+        :return: A new GroupBy over the query.
+        :rtype: GroupBy
+        """
+        from linqit.grouping import (
+            GroupBy,
+        )
+
+        return GroupBy(
+            self,
+            key,
+            element,
+        )
+
+    # Terminal operators
+
+    def to_list(self):
+        """
+        Runs the query and materializes its results.
+
+        :return: A new List containing the results.
+        :rtype: List
+        """
+        return List._new(iter(self))
+
+    def all(
+        self,
+        expression=_NO_EXPR,
+    ):
+        """
+        Checks if all results satisfy the given expression.
+        Stops reading the source at the first result that does not.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function
+        :return: True if all results satisfy the expression, False otherwise.
+        :rtype: bool
+        """
+        return next(
+            filterfalse(
+                expression,
+                self._run(ordered=False),
+            ),
+            _NONE,
+        ) is _NONE
+
+    def any(
+        self,
+        expression=_NO_EXPR,
+    ):
+        """
+        Checks if any result satisfies the given expression.
+        Stops reading the source at the first result that does.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function
+        :return: True if any result satisfies the expression, False otherwise.
+        :rtype: bool
+        """
+        return next(
+            filter(
+                expression,
+                self._run(ordered=False),
+            ),
+            _NONE,
+        ) is not _NONE
+
+    def first(
+        self,
+        expression=_NO_EXPR,
+        default=_NONE,
+    ):
+        """
+        Returns the first result that satisfies the given expression.
+        Stops reading the source as soon as it is found.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function or None
+        :param default: The default value to return if no matching value is found.
+        :return: The first matching object or the default value.
+        :rtype: object
+        :raises IndexError: If no matching value is found and no default value is provided.
+        """
+        found = next(
+            filter(
+                expression,
+                self,
+            ),
+            default,
+        )
+        if found is not _NONE:
+            return found
+        raise IndexError("No matching values")
+
+    def last(
+        self,
+        expression=_NO_EXPR,
+        default=_NONE,
+    ):
+        """
+        Returns the last result that satisfies the given expression.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function or None
+        :param default: The default value to return if no matching value is found.
+        :return: The last matching object or the default value.
+        :rtype: object
+        :raises IndexError: If no matching value is found and no default value is provided.
+        """
+        found = default
+        for el in self:
+            if expression(el):
+                found = el
+        if found is not _NONE:
+            return found
+        raise IndexError("No matching values")
+
+    def max_by(self, key):
+        """
+        Runs the query and returns the result with the highest key.
+
+        :param key: The expression to compare the results by.
+        :type key: function
+        :return: The result with the highest key.
+        :rtype: object
+        :raises ValueError: If there are no results.
+        """
+        return max(
+            self,
+            key=key,
+        )
+
+    def min_by(self, key):
+        """
+        Runs the query and returns the result with the lowest key.
+
+        :param key: The expression to compare the results by.
+        :type key: function
+        :return: The result with the lowest key.
+        :rtype: object
+        :raises ValueError: If there are no results.
+        """
+        return min(
+            self,
+            key=key,
+        )
+
+    def to_lookup(self, key, element=None):
+        """
+        Runs the query and groups the results by a key.
+
+        :param key: The expression computing the key of each result.
+        :type key: function
+        :param element: An expression computing what is put in the group for each result.
+        :type element: function or None
+        :return: The groups by their keys, with an empty group for missing keys.
+        :rtype: Lookup
+        """
+        return self.group_by(
+            key,
+            element,
+        ).to_dict()
+
+    @property
+    def sum(self):
+        """
+        Runs the query and calculates the sum of the results.
+
+        :return: The sum of the results.
+        :rtype: object
+        """
+        return sum(self._run(ordered=False))
+
+    @property
+    def min(self):
+        """
+        Runs the query and finds the lowest result.
+
+        :return: The lowest result.
+        :rtype: object
+        """
+        return min(self._run(ordered=False))
+
+    @property
+    def max(self):
+        """
+        Runs the query and finds the highest result.
+
+        :return: The highest result.
+        :rtype: object
+        """
+        return max(self._run(ordered=False))
+
+    @property
+    def avg(self):
+        """
+        Runs the query and calculates the average of the results.
+
+        :return: The average of the results.
+        :rtype: float
+        """
+        return List._new(self._run(ordered=False)).avg
+
+    def stats(self, selector=None):
+        """
+        Runs the query and calculates count, sum, min, max, mean and variance of the results,
+        in the same single pass.
+
+        :param selector: An expression computing the value of each result.
+        :type selector: function or None
+        :return: The aggregates, as (count, sum, min, max, mean, variance).
+        :rtype: Stats
+        """
+        return _stats(
+            self._run(ordered=False),
+            selector,
+        )
@@ -0,0 +1,841 @@
+import keyword
+from functools import (
+    lru_cache,
+    reduce,
+)
+from operator import (
+    add,
+    eq,
+    floordiv,
+    ge,
+    gt,
+    is_,
+    le,
+    lt,
+    mod,
+    mul,
+    ne,
+    sub,
+    truediv,
+)
+
+# Keyword filter lookups of the comparisons, as in where(age__gt=15).
+_COMPARISON_LOOKUPS = {
+    eq: "exact",
+    ne: "ne",
+    gt: "gt",
+    ge: "gte",
+    lt: "lt",
+    le: "lte",
+}
+
+_SYMBOLS = {
+    eq: "==",
+    ne: "!=",
+    gt: ">",
+    ge: ">=",
+    lt: "<",
+    le: "<=",
+    add: "+",
+    sub: "-",
+    mul: "*",
+    truediv: "/",
+    floordiv: "//",
+    mod: "%",
+    is_: "is",
+}
+
+
+@lru_cache(maxsize=256)
+def _code(source):
+    """
+    Compiles the source of an expression, once per shape of expression:
+    its constants are names, bound when the code runs.
+    """
+    return compile(
+        "lambda obj: " + source,
+        "<expression>",
+        "eval",
+    )
+
+
+def _constant(namespace, value):
+    """
+    Binds a constant to a new name in the namespace of the compiled expression.
+
+    :return: The name.
+    :rtype: str
+    """
+    name = "_c{n}".format(n=len(namespace))
+    namespace[name] = value
+    return name
+
+
+def _operand(namespace, value):
+    """
+    Returns the Python source of an operand: an expression, or a constant.
+    """
+    if isinstance(
+        value,
+        Expression,
+    ):
+        return value._source(namespace)
+    return _constant(
+        namespace,
+        value,
+    )
+
+
+def _options(values):
+    try:
+        return frozenset(values)
+    except TypeError:
+        # Unhashable options.
+        return tuple(values)
+
+
+class Expression(object):
+    """
+    An inspectable expression over an object, built from the X placeholder,
+    such as (X.age > 15) & X.name.startswith("b").
+    It is called like a function of the object, so it can be passed wherever an expression is expected,
+    and it is compiled into a single Python function the first time it is called.
+    & and | short-circuit in the order they are written, like and / or. where() looks the leading
+    equality comparisons up in the attribute indexes, and ColumnarList filters its leading comparisons
+    column by column.
+
+    Use & | ~ instead of and / or / not, and parenthesize comparisons, since & and | bind tighter.
+    Attributes starting with an underscore can't be accessed, and the names of the methods below
+    (startswith, endswith, contains, isin, lower, upper, strip) refer to them and not to attributes.
+    """
+
+    __slots__ = ("_function",)
+
+    # The names of the slots that describe the expression, as opposed to its compiled function.
+    _fields = ()
+
+    def __init__(self, *values):
+        for name, value in zip(
+            self._fields,
+            values,
+        ):
+            object.__setattr__(
+                self,
+                name,
+                value,
+            )
+
+    def _source(self, namespace):
+        """
+        Returns the Python source of the expression, over an object named obj.
+
+        :param namespace: The names the source refers to, which constants are added to.
+        :type namespace: dict
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    def _compile(self):
+        """
+        Returns the function of the object that evaluates the expression.
+        It is compiled once, into a single Python function, so it runs as fast as the lambda it replaces.
+
+        :rtype: function
+        """
+        try:
+            return self._function
+        except AttributeError:
+            namespace = {"_getattr": getattr}
+            function = eval(
+                _code(self._source(namespace)),
+                namespace,
+            )
+            object.__setattr__(
+                self,
+                "_function",
+                function,
+            )
+            return function
+
+    def _path(self):
+        """
+        Returns the dotted attribute path of the expression, as in attrgetter(), for an attribute of X.
+
+        :return: The path, or None if the expression is not an attribute of X.
+        :rtype: str or None
+        """
+        return None
+
+    def __call__(self, obj):
+        return self._compile()(obj)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _Attribute(
+            self,
+            name,
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Expressions are immutable")
+
+    def __getitem__(self, key):
+        return _Item(
+            self,
+            key,
+        )
+
+    def __getstate__(self):
+        # The compiled function is rebuilt after unpickling, since closures can't be pickled.
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __bool__(self):
+        raise TypeError(
+            "An expression has no truth value: use & | ~ instead of and / or / not, "
+            "and no chained comparisons"
+        )
+
+    __hash__ = object.__hash__
+
+    def __eq__(self, other):
+        return _Operation(eq, self, other)
+
+    def __ne__(self, other):
+        return _Operation(ne, self, other)
+
+    def __gt__(self, other):
+        return _Operation(gt, self, other)
+
+    def __ge__(self, other):
+        return _Operation(ge, self, other)
+
+    def __lt__(self, other):
+        return _Operation(lt, self, other)
+
+    def __le__(self, other):
+        return _Operation(le, self, other)
+
+    def __add__(self, other):
+        return _Operation(add, self, other)
+
+    def __radd__(self, other):
+        return _Operation(add, other, self)
+
+    def __sub__(self, other):
+        return _Operation(sub, self, other)
+
+    def __rsub__(self, other):
+        return _Operation(sub, other, self)
+
+    def __mul__(self, other):
+        return _Operation(mul, self, other)
+
+    def __rmul__(self, other):
+        return _Operation(mul, other, self)
+
+    def __truediv__(self, other):
+        return _Operation(truediv, self, other)
+
+    def __rtruediv__(self, other):
+        return _Operation(truediv, other, self)
+
+    def __floordiv__(self, other):
+        return _Operation(floordiv, self, other)
+
+    def __rfloordiv__(self, other):
+        return _Operation(floordiv, other, self)
+
+    def __mod__(self, other):
+        return _Operation(mod, self, other)
+
+    def __rmod__(self, other):
+        return _Operation(mod, other, self)
+
+    def __neg__(self):
+        return _Negative(self)
+
+    def __and__(self, other):
+        return _And(self, _logical_operand(other))
+
+    def __rand__(self, other):
+        return _And(_logical_operand(other), self)
+
+    def __or__(self, other):
+        return _Or(self, _logical_operand(other))
+
+    def __ror__(self, other):
+        return _Or(_logical_operand(other), self)
+
+    def __invert__(self):
+        return _Not(self)
+
+    def startswith(self, prefix):
+        """
+        Checks if the value starts with the prefix.
+
+        :rtype: Expression
+        """
+        return _MethodCall(
+            self,
+            "startswith",
+            (prefix,),
+        )
+
+    def endswith(self, suffix):
+        """
+        Checks if the value ends with the suffix.
+
+        :rtype: Expression
+        """
+        return _MethodCall(
+            self,
+            "endswith",
+            (suffix,),
+        )
+
+    def contains(self, item):
+        """
+        Checks if the value contains the item.
+
+        :rtype: Expression
+        """
+        return _MethodCall(
+            self,
+            "__contains__",
+            (item,),
+        )
+
+    def isin(self, options):
+        """
+        Checks if the value is one of the options.
+
+        :rtype: Expression
+        """
+        return _IsIn(
+            self,
+            _options(options),
+        )
+
+    def lower(self):
+        """
+        The value in lower case.
+
+        :rtype: Expression
+        """
+        return _MethodCall(
+            self,
+            "lower",
+            (),
+        )
+
+    def upper(self):
+        """
+        The value in upper case.
+
+        :rtype: Expression
+        """
+        return _MethodCall(
+            self,
+            "upper",
+            (),
+        )
+
+    def strip(self):
+        """
+        The value without leading and trailing whitespace.
+
+        :rtype: Expression
+        """
+        return _MethodCall(
+            self,
+            "strip",
+            (),
+        )
+
+
+class _Placeholder(Expression):
+    __slots__ = ()
+
+    def _source(self, namespace):
+        return "obj"
+
+    def _path(self):
+        return ""
+
+    def __repr__(self):
+        return "X"
+
+
+class _Attribute(Expression):
+    __slots__ = (
+        "base",
+        "name",
+    )
+    _fields = __slots__
+
+    def _source(self, namespace):
+        base = self.base._source(namespace)
+        if self.name.isidentifier() and not keyword.iskeyword(self.name):
+            return base + "." + self.name
+        return "_getattr({base}, {name})".format(
+            base=base,
+            name=_constant(
+                namespace,
+                self.name,
+            ),
+        )
+
+    def _path(self):
+        base = self.base._path()
+        if base is None:
+            return None
+        return base + "." + self.name if base else self.name
+
+    def __repr__(self):
+        return "{base!r}.{name}".format(
+            base=self.base,
+            name=self.name,
+        )
+
+
+class _Item(Expression):
+    __slots__ = (
+        "base",
+        "key",
+    )
+    _fields = __slots__
+
+    def _source(self, namespace):
+        return "{base}[{key}]".format(
+            base=self.base._source(namespace),
+            key=_constant(
+                namespace,
+                self.key,
+            ),
+        )
+
+    def __repr__(self):
+        return "{base!r}[{key!r}]".format(
+            base=self.base,
+            key=self.key,
+        )
+
+
+class _MethodCall(Expression):
+    __slots__ = (
+        "base",
+        "method",
+        "args",
+    )
+    _fields = __slots__
+
+    def _source(self, namespace):
+        return "{base}.{method}({args})".format(
+            base=self.base._source(namespace),
+            method=self.method,
+            args=", ".join(
+                _constant(
+                    namespace,
+                    arg,
+                )
+                for arg in self.args
+            ),
+        )
+
+    def __repr__(self):
+        return "{base!r}.{method}({args})".format(
+            base=self.base,
+            method="contains" if self.method == "__contains__" else self.method,
+            args=", ".join(map(repr, self.args)),
+        )
+
+
+class _IsIn(Expression):
+    __slots__ = (
+        "base",
+        "options",
+    )
+    _fields = __slots__
+
+    def _source(self, namespace):
+        return "({base} in {options})".format(
+            base=self.base._source(namespace),
+            options=_constant(
+                namespace,
+                self.options,
+            ),
+        )
+
+    def __repr__(self):
+        return "{base!r}.isin({options!r})".format(
+            base=self.base,
+            options=list(self.options),
+        )
+
+
+class _Operation(Expression):
+    __slots__ = (
+        "operator",
+        "left",
+        "right",
+    )
+    _fields = __slots__
+
+    def _source(self, namespace):
+        return "({left} {symbol} {right})".format(
+            left=_operand(
+                namespace,
+                self.left,
+            ),
+            symbol=_SYMBOLS[self.operator],
+            right=_operand(
+                namespace,
+                self.right,
+            ),
+        )
+
+    def __repr__(self):
+        return "({left!r} {symbol} {right!r})".format(
+            left=self.left,
+            symbol=_SYMBOLS[self.operator],
+            right=self.right,
+        )
+
+
+class _Negative(Expression):
+    __slots__ = ("operand",)
+    _fields = __slots__
+
+    def _source(self, namespace):
+        return "(-{operand})".format(
+            operand=self.operand._source(namespace),
+        )
+
+    def __repr__(self):
+        return "-{operand!r}".format(
+            operand=self.operand,
+        )
+
+
+class _And(Expression):
+    __slots__ = (
+        "left",
+        "right",
+    )
+    _fields = __slots__
+
+    def _source(self, namespace):
+        return "({left} and {right})".format(
+            left=_operand(
+                namespace,
+                self.left,
+            ),
+            right=_operand(
+                namespace,
+                self.right,
+            ),
+        )
+
+    def __repr__(self):
+        return "({left!r} & {right!r})".format(
+            left=self.left,
+            right=self.right,
+        )
+
+
+class _Or(Expression):
+    __slots__ = (
+        "left",
+        "right",
+    )
+    _fields = __slots__
+
+    def _source(self, namespace):
+        return "({left} or {right})".format(
+            left=_operand(
+                namespace,
+                self.left,
+            ),
+            right=_operand(
+                namespace,
+                self.right,
+            ),
+        )
+
+    def __repr__(self):
+        return "({left!r} | {right!r})".format(
+            left=self.left,
+            right=self.right,
+        )
+
+
+class _Not(Expression):
+    __slots__ = ("operand",)
+    _fields = __slots__
+
+    def _source(self, namespace):
+        return "(not {operand})".format(
+            operand=_operand(
+                namespace,
+                self.operand,
+            ),
+        )
+
+    def __repr__(self):
+        return "~{operand!r}".format(
+            operand=self.operand,
+        )
+
+
+# The placeholder for the object an expression is evaluated on, as in X.age > 15.
+X = _Placeholder()
+
+
+def _filter_of(expression):
+    """
+    Turns a comparison of an attribute of X to a constant into a keyword filter.
+
+    :return: The (keyword, value) filter, or None if the expression is not such a comparison.
+    :rtype: tuple or None
+    """
+    if isinstance(
+        expression,
+        _Operation,
+    ):
+        lookup = _COMPARISON_LOOKUPS.get(expression.operator)
+        path = _path_of(expression.left)
+        if (
+            lookup
+            and path
+            and not isinstance(
+                expression.right,
+                Expression,
+            )
+        ):
+            if lookup == "exact" and "__" not in path:
+                # A plain attribute=value filter, which attribute indexes look up.
+                return path, expression.right
+            return path + "__" + lookup, expression.right
+    elif isinstance(
+        expression,
+        _IsIn,
+    ):
+        path = _path_of(expression.base)
+        if path:
+            return path + "__in", expression.options
+    elif (
+        isinstance(
+            expression,
+            _MethodCall,
+        )
+        and expression.method == "startswith"
+        and isinstance(
+            expression.args[0],
+            str,
+        )
+    ):
+        path = _path_of(expression.base)
+        if path:
+            return path + "__startswith", expression.args[0]
+    return None
+
+
+def _path_of(value):
+    if isinstance(
+        value,
+        Expression,
+    ):
+        return value._path()
+    return None
+
+
+def _logical_operand(operand):
+    """
+    Checks an operand of & or |, which bind tighter than the comparisons:
+    X.age > 15 & X.name.startswith("b") means X.age > (15 & X.name.startswith("b")).
+
+    :raises TypeError: If the operand is neither an expression nor a bool.
+    """
+    if not isinstance(
+        operand,
+        (Expression, bool),
+    ):
+        raise TypeError(
+            "Cannot combine {!r} with & or |: parenthesize the comparisons, "
+            "e.g. (X.age > 15) & (X.name == 'bob')".format(operand)
+        )
+    return operand
+
+
+def _conjuncts(expression):
+    """
+    Flattens a conjunction, as in a & b & c, into its operands in the order they are written.
+    """
+    if isinstance(
+        expression,
+        _And,
+    ):
+        return _conjuncts(expression.left) + _conjuncts(expression.right)
+    return [expression]
+
+
+def _leading_filters(expression):
+    """
+    Turns the leading operands of a conjunction into keyword filters, up to the first one that isn't
+    a comparison of an attribute to a constant. Checking the filters in order on the remaining objects,
+    and then the rest of the expression, short-circuits like the expression itself.
+
+    :return: The keyword filters, in order, and the rest of the expression or None.
+    :rtype: tuple
+    """
+    filters = {}
+    conjuncts = _conjuncts(expression)
+    while conjuncts:
+        keyword_filter = _filter_of(conjuncts[0])
+        if keyword_filter is None or keyword_filter[0] in filters:
+            break
+        key, value = keyword_filter
+        filters[key] = value
+        conjuncts.pop(0)
+    if not conjuncts:
+        return filters, None
+    return filters, reduce(
+        _And,
+        conjuncts,
+    )
+
+
+def _function_of(expression):
+    """
+    Returns the compiled function of an expression, so it is called without the Expression indirection,
+    or the expression itself if it is a plain function.
+    """
+    if isinstance(
+        expression,
+        Expression,
+    ):
+        return expression._compile()
+    return expression
+
+
+# The comparison operators of the keyword filter lookups.
+_LOOKUP_OPERATORS = {lookup: operator for operator, lookup in _COMPARISON_LOOKUPS.items()}
+
+
+def _filter_expression(attribute, lookup, value):
+    """
+    Turns a keyword filter into an expression, so it is compiled like one.
+
+    :param attribute: The dotted attribute path, as parsed by _parse_filter().
+    :type attribute: str
+    :param lookup: The lookup name, as parsed by _parse_filter().
+    :type lookup: str
+    :param value: The filter value, with the options of an "in" lookup ready for membership tests.
+    :return: The expression, or None for an unknown lookup.
+    :rtype: Expression or None
+    """
+    target = X
+    for name in attribute.split("."):
+        target = _Attribute(
+            target,
+            name,
+        )
+    if lookup in _LOOKUP_OPERATORS:
+        return _Operation(
+            _LOOKUP_OPERATORS[lookup],
+            target,
+            value,
+        )
+    if lookup == "in":
+        return _IsIn(
+            target,
+            value,
+        )
+    if lookup == "isnull":
+        return _Operation(
+            eq,
+            _Operation(
+                is_,
+                target,
+                None,
+            ),
+            value,
+        )
+    if lookup == "startswith":
+        return _MethodCall(
+            target,
+            "startswith",
+            (value,),
+        )
+    return None
+
+
+class _Value(object):
+    """
+    A placeholder for a filter value, bound when the compiled filters run.
+    """
+
+    __slots__ = ()
+
+
+@lru_cache(maxsize=256)
+def _filters_template(shape):
+    """
+    Compiles keyword filters once per shape, whatever their values.
+
+    :param shape: The (attribute, lookup) pairs of the filters, in order.
+    :type shape: tuple
+    :return: The code, the constants it refers to, and the names to bind the filter values to, in order.
+    :rtype: tuple
+    """
+    values = [_Value() for _ in shape]
+    expression = reduce(
+        _And,
+        [
+            _filter_expression(
+                attribute,
+                lookup,
+                value,
+            )
+            for (attribute, lookup), value in zip(
+                shape,
+                values,
+            )
+        ],
+    )
+    namespace = {"_getattr": getattr}
+    code = _code(expression._source(namespace))
+    names = {id(value): name for name, value in namespace.items() if isinstance(value, _Value)}
+    constants = {
+        name: value for name, value in namespace.items() if not isinstance(value, _Value)
+    }
+    return code, constants, [names[id(value)] for value in values]
+
+
+def _compile_filter_values(shape, values):
+    """
+    Returns the function of the object that checks keyword filters: all of them, in order.
+
+    :param shape: The (attribute, lookup) pairs of the filters, in order.
+    :type shape: tuple
+    :param values: The values of the filters, in the same order.
+    :type values: list
+    :rtype: function
+    """
+    code, constants, names = _filters_template(shape)
+    namespace = dict(constants)
+    namespace.update(
+        zip(
+            names,
+            values,
+        )
+    )
+    return eval(
+        code,
+        namespace,
+    )
+
@@ -0,0 +1,228 @@
+from collections import (
+    namedtuple,
+)
+
+from linqit.linq_list import (
+    List,
+)
+
+
+class Grouping(List):
+    """
+    A List of the objects that share the same key.
+    """
+
+    def __init__(self, key, objects=()):
+        """
+        Initializes a new Grouping instance.
+
+        :param key: The key shared by the objects.
+        :param objects: The objects in the group.
+        :type objects: iterable
+        """
+        super(
+            Grouping,
+            self,
+        ).__init__(objects)
+        self.key = key
+
+    def __repr__(self):
+        return "Grouping({key!r}, {objects})".format(
+            key=self.key,
+            objects=list.__repr__(self),
+        )
+
+
+class Lookup(dict):
+    """
+    A dict of Groupings by their keys, as built by to_lookup().
+    Looking up a missing key returns an empty Grouping.
+    """
+
+    def __missing__(self, key):
+        return Grouping(key)
+
+
+# Aggregate folds, by name: (initial state, step(state, value), result(state)).
+_FOLDS = {
+    "count": (
+        lambda: 0,
+        lambda state, value: state + 1,
+        lambda state: state,
+    ),
+    "sum": (
+        lambda: 0,
+        lambda state, value: state + value,
+        lambda state: state,
+    ),
+    "min": (
+        lambda: None,
+        lambda state, value: value if state is None or value < state else state,
+        lambda state: state,
+    ),
+    "max": (
+        lambda: None,
+        lambda state, value: value if state is None or value > state else state,
+        lambda state: state,
+    ),
+    "avg": (
+        lambda: (0, 0),
+        lambda state, value: (state[0] + value, state[1] + 1),
+        lambda state: state[0] / state[1],
+    ),
+}
+
+
+def _parse_aggregate(name, spec):
+    """
+    Parses an aggregate of GroupBy.aggregate() into its fold and selector.
+
+    :param name: The name of the aggregate.
+    :type name: str
+    :param spec: The fold name, or a (fold name, selector) tuple.
+    :type spec: str or tuple
+    :return: The (initial, step, result) fold functions, and the selector or None.
+    :rtype: tuple
+    :raises ValueError: If the fold is unknown.
+    """
+    fold, selector = (spec, None) if isinstance(spec, str) else spec
+    if fold not in _FOLDS:
+        raise ValueError(
+            "Unknown aggregate {fold!r} for {name!r}, expected one of: {folds}".format(
+                fold=fold,
+                name=name,
+                folds=", ".join(sorted(_FOLDS)),
+            )
+        )
+    return _FOLDS[fold], selector
+
+
+class GroupBy(object):
+    """
+    A deferred grouping of objects by a key.
+    The objects are grouped in a single hash pass when iterated or materialized,
+    and the groups are kept in the order their keys were first seen.
+    aggregate() folds per-group aggregates during that pass, without building the groups.
+    Other List operators run on the List of the groups.
+    """
+
+    def __init__(self, source, key, element=None):
+        """
+        Initializes a new GroupBy instance.
+
+        :param source: The objects to group.
+        :type source: iterable
+        :param key: The expression computing the key of each object.
+        :type key: function
+        :param element: An expression computing what is put in the group for each object,
+            the object itself by default.
+        :type element: function or None
+        """
+        self._source = source
+        self._key = key
+        self._element = element
+
+    def _groups(self):
+        key = self._key
+        element = self._element
+        groups = {}
+        for obj in self._source:
+            k = key(obj)
+            try:
+                group = groups[k]
+            except KeyError:
+                group = groups[k] = Grouping(k)
+            list.append(
+                group,
+                obj if element is None else element(obj),
+            )
+        return groups
+
+    def __iter__(self):
+        return iter(self._groups().values())
+
+    def __getattr__(self, item):
+        if item.startswith("_"):
+            raise AttributeError(item)
+        return getattr(
+            self.to_list(),
+            item,
+        )
+
+    def to_list(self):
+        """
+        Groups the objects.
+
+        :return: A new List of the groups.
+        :rtype: List
+        """
+        return List._new(self._groups().values())
+
+    def to_dict(self):
+        """
+        Groups the objects.
+
+        :return: The groups, by their keys.
+        :rtype: Lookup
+        """
+        return Lookup(self._groups())
+
+    def aggregate(self, **aggregates):
+        """
+        Folds aggregates per group, in the same single pass that groups the objects,
+        without building the groups themselves.
+        Each aggregate is a fold name (count, sum, min, max, avg),
+        or a (fold name, selector) tuple to fold a value computed from each object.
+
+        Example: group_by(lambda p: p.city).aggregate(count="count", total=("sum", lambda p: p.age))
+
+        :param aggregates: The aggregates to compute, by name.
+        :type aggregates: dict
+        :return: A new List with a (key, *aggregates) named tuple per group.
+        :rtype: List
+        :raises ValueError: If an aggregate is unknown, or named "key".
+        """
+        if "key" in aggregates:
+            raise ValueError('"key" is reserved for the group key')
+        names = list(aggregates)
+        folds = [
+            _parse_aggregate(
+                name,
+                aggregates[name],
+            )
+            for name in names
+        ]
+        key = self._key
+        element = self._element
+        states = {}
+        for obj in self._source:
+            k = key(obj)
+            value = obj if element is None else element(obj)
+            try:
+                state = states[k]
+            except KeyError:
+                state = states[k] = [initial() for (initial, _, _), _ in folds]
+            for i, ((_, step, _), selector) in enumerate(folds):
+                state[i] = step(
+                    state[i],
+                    value if selector is None else selector(value),
+                )
+        row = namedtuple(
+            "Aggregate",
+            ["key"] + names,
+        )
+        return List._new(
+            [
+                row(
+                    k,
+                    *(
+                        result(s)
+                        for ((_, _, result), _), s in zip(
+                            folds,
+                            state,
+                        )
+                    )
+                )
+                for k, state in states.items()
+            ]
+        )
@@ -0,0 +1,176 @@
+from linqit.linq_list import (
+    _NONE,
+    List,
+)
+
+
+def _materialize(objects):
+    # One-shot iterators are read into a list, since the join needs their length.
+    return list(objects) if iter(objects) is objects else objects
+
+
+def _hash_matches(outer, inner, outer_key, inner_key):
+    """
+    Yields every outer object with the list of inner objects of the same key, in outer order.
+    The hash table is built on the smaller of the two sides.
+    """
+    outer = _materialize(outer)
+    inner = _materialize(inner)
+    if len(inner) <= len(outer):
+        table = {}
+        for i in inner:
+            k = inner_key(i)
+            try:
+                table[k].append(i)
+            except KeyError:
+                table[k] = [i]
+        for o in outer:
+            yield o, table.get(
+                outer_key(o),
+                (),
+            )
+        return
+
+    table = {}
+    for index, o in enumerate(outer):
+        k = outer_key(o)
+        try:
+            table[k].append(index)
+        except KeyError:
+            table[k] = [index]
+    matches = {}
+    for i in inner:
+        for index in table.get(
+            inner_key(i),
+            (),
+        ):
+            try:
+                matches[index].append(i)
+            except KeyError:
+                matches[index] = [i]
+    for index, o in enumerate(outer):
+        yield o, matches.get(
+            index,
+            (),
+        )
+
+
+def _merge_matches(outer, inner, outer_key, inner_key):
+    """
+    Yields every outer object with the list of inner objects of the same key, in outer order.
+    Both sides must already be sorted by their keys, in ascending order.
+    """
+    inner = iter(inner)
+    pending = next(
+        inner,
+        _NONE,
+    )
+    pending_key = None if pending is _NONE else inner_key(pending)
+    run_key = _NONE
+    run = []
+    for o in outer:
+        k = outer_key(o)
+        if run_key is _NONE or run_key != k:
+            while pending is not _NONE and pending_key < k:
+                pending = next(
+                    inner,
+                    _NONE,
+                )
+                pending_key = None if pending is _NONE else inner_key(pending)
+            run = []
+            run_key = k
+            while pending is not _NONE and pending_key == k:
+                run.append(pending)
+                pending = next(
+                    inner,
+                    _NONE,
+                )
+                pending_key = None if pending is _NONE else inner_key(pending)
+        yield o, run
+
+
+_STRATEGIES = {
+    "hash": _hash_matches,
+    "merge": _merge_matches,
+}
+
+
+def _join_results(how, result):
+    """
+    Returns the function that turns an outer object and its matches into join results.
+    """
+    if how == "inner":
+        return lambda o, matches: [result(o, i) for i in matches]
+    if how == "left":
+        return lambda o, matches: [result(o, i) for i in matches] or [result(o, None)]
+    if how == "semi":
+        return lambda o, matches: [o] if matches else []
+    if how == "anti":
+        return lambda o, matches: [] if matches else [o]
+    raise ValueError(
+        'Unknown join {how!r}, expected one of: "inner", "left", "semi", "anti"'.format(
+            how=how,
+        )
+    )
+
+
+def _matches(outer, inner, outer_key, inner_key, strategy):
+    """
+    Pairs every outer object with the inner objects of the same key, in outer order.
+
+    :param strategy: "hash", or "merge" for inputs already sorted by their keys.
+    :type strategy: str
+    :raises ValueError: If the strategy is unknown.
+    """
+    if strategy not in _STRATEGIES:
+        raise ValueError(
+            'Unknown join strategy {strategy!r}, expected "hash" or "merge"'.format(
+                strategy=strategy,
+            )
+        )
+    return _STRATEGIES[strategy](
+        outer,
+        inner,
+        outer_key,
+        inner_key,
+    )
+
+
+def _join(outer, inner, outer_key, inner_key, result, how, strategy):
+    results = _join_results(
+        how,
+        result,
+    )
+    joined = []
+    for o, inner_matches in _matches(
+        outer,
+        inner,
+        outer_key,
+        inner_key,
+        strategy,
+    ):
+        joined.extend(
+            results(
+                o,
+                inner_matches,
+            )
+        )
+    return List._new(joined)
+
+
+def _group_join(outer, inner, outer_key, inner_key, result, strategy):
+    return List._new(
+        [
+            result(
+                o,
+                List._new(inner_matches),
+            )
+            for o, inner_matches in _matches(
+                outer,
+                inner,
+                outer_key,
+                inner_key,
+                strategy,
+            )
+        ]
+    )
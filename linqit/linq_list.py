@@ -1,16 +1,751 @@
+import statistics
+import sys
+from inspect import (
+    signature,
+)
+from collections import (
+    OrderedDict,
+    namedtuple,
+)
+from contextlib import (
+    contextmanager,
+)
+from contextvars import (
+    ContextVar,
+)
 from functools import (
+    partial,
     reduce,
+    wraps,
+)
+from heapq import (
+    nlargest,
+    nsmallest,
 )
 from itertools import (
     chain,
+    count,
+    filterfalse,
+)
+from operator import (
+    add,
+    attrgetter,
+    eq,
+    ge,
+    gt,
+    le,
+    lt,
+    ne,
+)
+from threading import (
+    Lock,
+)
+from time import (
+    perf_counter,
+)
+from weakref import (
+    finalize,
+)
+
+from linqit.expressions import (
+    Expression,
+    _compile_filter_values,
+    _function_of,
+    _leading_filters,
 )
 
-_DEFAULT_LAZY = True
+try:
+    import numpy
+except ImportError:  # NumPy is optional, aggregates fall back to pure Python.
+    numpy = None
+
+# Aggregates only convert lists of at least this size into NumPy arrays,
+# below it the conversion costs more than it saves.
+_NUMPY_MIN_SIZE = 1000
+_NUMPY_TYPES = (int, float)
+# The default number of expressions awaited at once by the async operators.
+_DEFAULT_CONCURRENCY = 16
 _NO_EXPR = lambda x:x
+_pair = lambda x, y: (x, y)
 
 # A default variable for the function, so None as an argument will be valid, but not default.
 _NONE = type('_NONE', (object,), {})
 
+
+# Keyword filter lookups, as in where(age__gt=15), by suffix.
+# Each one compares an attribute value with the filter value.
+_LOOKUPS = {
+    "exact": eq,
+    "ne": ne,
+    "gt": gt,
+    "gte": ge,
+    "lt": lt,
+    "lte": le,
+    "in": lambda value, options: value in options,
+    "isnull": lambda value, is_null: (value is None) == is_null,
+    "startswith": lambda value, prefix: value.startswith(prefix),
+}
+
+
+def _parse_filter(key):
+    """
+    Splits a keyword filter into its attribute name and lookup.
+
+    :param key: The keyword, such as "age" or "age__gt".
+    :type key: str
+    :return: The attribute name and the lookup name.
+    :rtype: tuple
+    """
+    attribute, separator, lookup = key.rpartition("__")
+    if attribute and lookup in _LOOKUPS:
+        return attribute, lookup
+    return key, "exact"
+
+
+def _compile_filters(filters):
+    """
+    Compiles keyword filters into a list of checks, each accepting a single object.
+    The filters are compiled together, checked in the order they are given, into a single function
+    that reads the attributes directly, as a lambda would. The compiled code is reused
+    by filters on the same attributes and lookups.
+
+    :param filters: Keyword filters, as "attribute" or "attribute__lookup" to value.
+    :type filters: dict
+    :return: The checks.
+    :rtype: list
+    """
+    if not filters:
+        return []
+    shape = []
+    values = []
+    for key, value in filters.items():
+        attribute, lookup = _parse_filter(key)
+        if lookup == "in":
+            value = _HashedItems(value)
+        shape.append((attribute, lookup))
+        values.append(value)
+    return [
+        _compile_filter_values(
+            tuple(shape),
+            values,
+        )
+    ]
+
+
+def _where_predicate(expression, filters):
+    """
+    Builds the predicate used by where() out of an expression and keyword filters.
+    The keyword filters are compiled once, and only checked for objects that satisfy the expression.
+
+    :param expression: The expression to evaluate for each object.
+    :type expression: function or None
+    :param filters: Keyword filters, as "attribute" or "attribute__lookup" to value.
+    :type filters: dict
+    :return: A predicate that accepts a single object.
+    :rtype: function
+    """
+    checks = _compile_filters(filters)
+    if expression is not None:
+        checks.insert(
+            0,
+            expression,
+        )
+    if not checks:
+        return lambda x: True
+    if len(checks) == 1:
+        return checks[0]
+
+    def filter_function(
+        x,
+    ):
+        for check in checks:
+            if not check(x):
+                return False
+        return True
+
+    return filter_function
+
+
+class _HashedItems(object):
+    """
+    A membership container that hashes what it can.
+    Unhashable items are kept aside in a list and compared by equality.
+    """
+
+    __slots__ = (
+        "_hashed",
+        "_unhashable",
+    )
+
+    def __init__(self, items=()):
+        self._hashed = set()
+        self._unhashable = []
+        if iter(items) is items:
+            # A one-shot iterator can't be read twice by the fallback below.
+            items = list(items)
+        try:
+            self._hashed.update(items)
+        except TypeError:
+            # Some item is unhashable, sort them out one by one.
+            for item in items:
+                self.add(item)
+
+    def add(self, item):
+        try:
+            self._hashed.add(item)
+        except TypeError:
+            self._unhashable.append(item)
+
+    def __contains__(self, item):
+        try:
+            if item in self._hashed:
+                return True
+        except TypeError:
+            pass
+        return bool(self._unhashable) and item in self._unhashable
+
+
+def _distinct(iterable, key=None):
+    """
+    Yields the items of an iterable whose key was not seen before, in a single pass.
+
+    :param iterable: The items to deduplicate.
+    :type iterable: iterable
+    :param key: An expression computing the value to compare items by.
+    :type key: function or None
+    """
+    seen = _HashedItems()
+    for item in iterable:
+        value = item if key is None else key(item)
+        if value not in seen:
+            seen.add(value)
+            yield item
+
+
+# Kinds of projected attribute values, as bit flags so they can be intersected across values.
+_ITERABLE = 1
+_CALLABLE = 2
+
+# Caches the kind of every value type seen by a projection.
+_VALUE_KINDS = {}
+
+
+def _value_kind(value_type):
+    """
+    Returns the kind of the values of a type, as projected by List.__getattr__.
+
+    :param value_type: The type of a projected value.
+    :type value_type: type
+    :return: _ITERABLE and/or _CALLABLE flags.
+    :rtype: int
+    """
+    try:
+        return _VALUE_KINDS[value_type]
+    except KeyError:
+        pass
+    # Look the special methods up on the type itself, not on its metaclass.
+    members = set(chain.from_iterable(vars(cls) for cls in value_type.__mro__))
+    kind = 0
+    if "__iter__" in members and not issubclass(
+        value_type,
+        str,
+    ):
+        kind |= _ITERABLE
+    if "__call__" in members:
+        kind |= _CALLABLE
+    _VALUE_KINDS[value_type] = kind
+    return kind
+
+
+def _project_existing(getter, objects):
+    """
+    Yields the attribute of every object that has it, skipping those that don't.
+
+    :param getter: The attribute getter.
+    :type getter: operator.attrgetter
+    :param objects: The objects to project.
+    :type objects: iterable
+    """
+    for obj in objects:
+        try:
+            yield getter(obj)
+        except AttributeError:
+            pass
+
+
+Stats = namedtuple(
+    "Stats",
+    [
+        "count",
+        "sum",
+        "min",
+        "max",
+        "mean",
+        "variance",
+    ],
+)
+
+
+def _stats(iterable, selector=None):
+    """
+    Computes count, sum, min, max, mean and population variance in a single streaming pass,
+    using Welford's method for the variance.
+
+    :param iterable: The objects to aggregate.
+    :type iterable: iterable
+    :param selector: An expression computing the value of each object.
+    :type selector: function or None
+    :return: The aggregates, with None for min, max, mean and variance when there are no values.
+    :rtype: Stats
+    """
+    values = iterable if selector is None else map(selector, iterable)
+    count = 0
+    total = 0
+    lowest = highest = None
+    mean = 0.0
+    squares = 0.0
+    for value in values:
+        count += 1
+        total += value
+        if count == 1:
+            lowest = highest = value
+        elif value < lowest:
+            lowest = value
+        elif value > highest:
+            highest = value
+        delta = value - mean
+        mean += delta / count
+        squares += delta * (value - mean)
+    if not count:
+        return Stats(0, 0, None, None, None, None)
+    return Stats(
+        count,
+        total,
+        lowest,
+        highest,
+        total / count,
+        squares / count,
+    )
+
+
+
+class _AttributeIndex(object):
+    """
+    A hash index of objects by the values of one or more of their attributes.
+    Every bucket keeps its objects in list order.
+    """
+
+    __slots__ = (
+        "attributes",
+        "getter",
+        "buckets",
+    )
+
+    def __init__(self, attributes, objects):
+        self.attributes = attributes
+        self.getter = attrgetter(*attributes)
+        self.buckets = {}
+        self.add(objects)
+
+    def add(self, objects):
+        getter = self.getter
+        buckets = self.buckets
+        for obj in objects:
+            key = getter(obj)
+            try:
+                buckets[key].append(obj)
+            except KeyError:
+                buckets[key] = [obj]
+
+    def lookup(self, filters):
+        """
+        Returns the objects matching the filters on the indexed attributes,
+        or None if the filter values can't be looked up.
+        """
+        if len(self.attributes) == 1:
+            key = filters[self.attributes[0]]
+        else:
+            key = tuple(filters[attribute] for attribute in self.attributes)
+        try:
+            return self.buckets.get(key, ())
+        except TypeError:
+            # Unhashable filter value.
+            return None
+
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    [
+        "hits",
+        "misses",
+        "maxsize",
+        "currsize",
+    ],
+)
+
+# Mutation versions, unique across all lists, so results cached for one version are never returned for another.
+_VERSIONS = count(1)
+
+
+class _QueryCache(object):
+    """
+    A bounded LRU cache of query results, by (list version, operator, arguments).
+    """
+
+    __slots__ = (
+        "maxsize",
+        "hits",
+        "misses",
+        "results",
+        "__weakref__",
+    )
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.results = OrderedDict()
+        _use_queries(1)
+        finalize(
+            self,
+            _use_queries,
+            -1,
+        )
+
+    def get(self, key, compute):
+        """
+        Returns the cached result of the key, computing and caching it on a miss.
+
+        :param key: The hashable key of the result.
+        :type key: tuple
+        :param compute: Computes the result.
+        :type compute: function
+        :return: The cached result.
+        :rtype: object
+        """
+        try:
+            result = self.results[key]
+        except KeyError:
+            self.misses += 1
+            result = self.results[key] = compute()
+            if len(self.results) > self.maxsize:
+                self.results.popitem(last=False)
+            return result
+        self.hits += 1
+        self.results.move_to_end(key)
+        return result
+
+
+def _copy_result(result):
+    """
+    Returns a shallow copy of a cached List result, so changing it doesn't change the cache.
+    The copy keeps the state of the result, such as its version and cache.
+    """
+    if not isinstance(
+        result,
+        list,
+    ):
+        return result
+    copied = list.__new__(type(result))
+    list.extend(
+        copied,
+        result,
+    )
+    vars(copied).update(vars(result))
+    return copied
+
+
+OperatorProfile = namedtuple(
+    "OperatorProfile",
+    [
+        "operator",
+        "seconds",
+        "elements_in",
+        "elements_out",
+        "expression_calls",
+        "result_size",
+    ],
+)
+
+# The hooks of the List.profile() blocks active in the current thread or async task,
+# each called with the OperatorProfile of every operator call.
+_PROFILE_HOOKS = ContextVar(
+    "linqit_profile_hooks",
+    default=(),
+)
+
+# The operator parameters that are expressions, whose calls are counted while profiling.
+# Other arguments, such as defaults, items and filter values, are data and passed as is.
+_EXPRESSION_PARAMETERS = frozenset(
+    (
+        "expression",
+        "key",
+        "selector",
+        "outer_key",
+        "inner_key",
+        "result",
+        "element",
+    )
+)
+
+# The signatures of the profiled operators, by operator.
+_SIGNATURES = {}
+
+
+class _CountedExpression(object):
+    """
+    Counts the calls of an expression, while profiling.
+    """
+
+    __slots__ = (
+        "expression",
+        "calls",
+    )
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.expression(*args)
+
+
+def _run_query(operator, self, args, kwargs, compute):
+    """
+    Runs an operator call, through the query cache of the list when it is enabled.
+    Expressions are part of the cache key by identity, so only the same function object hits the cache.
+    As in lru_cache(typed=True), the argument types are part of the key too, so 0, 0.0 and False don't share results.
+    Calls with unhashable arguments are not cached.
+    """
+    cache = self._cache
+    if cache is None:
+        return compute()
+    key = (
+        self._version,
+        operator.__name__,
+        args,
+        frozenset(kwargs.items()),
+        tuple(map(type, args)),
+        frozenset((name, type(value)) for name, value in kwargs.items()),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return compute()
+
+    def compute_cached():
+        result = compute()
+        if isinstance(
+            result,
+            List,
+        ):
+            # Chained queries on the result are cached too.
+            result._version = next(_VERSIONS)
+            result._cache = cache
+        return result
+
+    return _copy_result(
+        cache.get(
+            key,
+            compute_cached,
+        )
+    )
+
+
+def _profile_query(operator, self, args, kwargs):
+    """
+    Runs an operator call, and reports its OperatorProfile to the hooks of the active profile() blocks.
+    """
+    expressions = []
+    operator_signature = _SIGNATURES.get(operator)
+    if operator_signature is None:
+        operator_signature = _SIGNATURES[operator] = signature(operator)
+
+    def compute():
+        bound = operator_signature.bind(
+            self,
+            *args,
+            **kwargs
+        )
+        for name, value in bound.arguments.items():
+            # X expressions are passed as is, so where() still turns them into keyword filters.
+            if (
+                name in _EXPRESSION_PARAMETERS
+                and callable(value)
+                and not isinstance(
+                    value,
+                    (type, Expression),
+                )
+            ):
+                bound.arguments[name] = _CountedExpression(value)
+                expressions.append(bound.arguments[name])
+        return operator(
+            *bound.args,
+            **bound.kwargs
+        )
+
+    start = perf_counter()
+    result = _run_query(
+        operator,
+        self,
+        args,
+        kwargs,
+        compute,
+    )
+    seconds = perf_counter() - start
+    is_list = isinstance(
+        result,
+        list,
+    )
+    profile = OperatorProfile(
+        operator.__name__,
+        seconds,
+        len(self),
+        len(result) if is_list else None,
+        sum(expression.calls for expression in expressions),
+        sys.getsizeof(result) if is_list else 0,
+    )
+    # Operators the hooks run themselves are not profiled.
+    hooks = _PROFILE_HOOKS.get()
+    token = _PROFILE_HOOKS.set(())
+    try:
+        for hook in hooks:
+            hook(profile)
+    finally:
+        _PROFILE_HOOKS.reset(token)
+    return result
+
+
+# The wrappers of the pure List operators, by operator, see _query().
+_QUERIES = {}
+
+# The number of live query caches and open profile() blocks, which need the wrappers installed.
+_QUERY_USERS = [0]
+_QUERY_USERS_LOCK = Lock()
+
+
+def _use_queries(users):
+    """
+    Counts the query caches and profile() blocks that start or stop, installing the operator wrappers
+    on List when the first one starts, and removing them when the last one stops.
+
+    :param users: 1 when a cache or block starts, -1 when it stops.
+    :type users: int
+    """
+    with _QUERY_USERS_LOCK:
+        _QUERY_USERS[0] += users
+        if _QUERY_USERS[0] == (1 if users > 0 else 0):
+            _install_queries(_QUERY_USERS[0] > 0)
+
+
+def _install_queries(installed):
+    """
+    Replaces the pure List operators, including the properties, by their wrappers or back.
+
+    :param installed: Whether to install the wrappers or the plain operators.
+    :type installed: bool
+    """
+    replacements = _QUERIES if installed else {query: operator for operator, query in _QUERIES.items()}
+    for name, attribute in list(vars(List).items()):
+        is_property = isinstance(
+            attribute,
+            property,
+        )
+        function = attribute.fget if is_property else attribute
+        if callable(function) and function in replacements:
+            setattr(
+                List,
+                name,
+                attribute.getter(replacements[function]) if is_property else replacements[function],
+            )
+
+
+def _query(operator):
+    """
+    Marks a pure List operator: its results are cached once enable_cache() is called on the list,
+    and its calls are profiled inside List.profile() blocks.
+    The operator is left as is; its wrapper only replaces it on List while a query cache
+    or a profile() block is in use, so plain calls don't pay for it.
+    """
+
+    @wraps(operator)
+    def query(self, *args, **kwargs):
+        profiling = _PROFILE_HOOKS.get()
+        if self._cache is None and not profiling:
+            return operator(
+                self,
+                *args,
+                **kwargs
+            )
+        if profiling:
+            return _profile_query(
+                operator,
+                self,
+                args,
+                kwargs,
+            )
+        return _run_query(
+            operator,
+            self,
+            args,
+            kwargs,
+            partial(
+                operator,
+                self,
+                *args,
+                **kwargs
+            ),
+        )
+
+    _QUERIES[operator] = query
+    return operator
+
+
+def _as_float(value):
+    """
+    Returns an int aggregate as a float, as NumPy computes it on large lists,
+    so the type of the result doesn't depend on the list size. Exact types, such as Fraction, are kept.
+    """
+    if isinstance(
+        value,
+        int,
+    ):
+        return float(value)
+    return value
+
+
+def _ordered(objects, plan):
+    """
+    Sorts the objects by a plan of keys, see linqit.ordering._ordered(), which replaces this function
+    on its first call: linqit.ordering imports this module, so it can't be imported at the top.
+    """
+    global _ordered
+    from linqit.ordering import (
+        _ordered,
+    )
+
+    return _ordered(
+        objects,
+        plan,
+    )
+
+
+def _top(iterable, count, key=None, descending=True):
+    """
+    Selects the n highest (or lowest) objects of an iterable with a heap.
+
+    :return: The selected objects, highest first (or lowest first).
+    :rtype: list
+    """
+    if count <= 0:
+        return []
+    return (nlargest if descending else nsmallest)(
+        count,
+        iterable,
+        key=key,
+    )
+
 class List(list):
     """
     Extends Python's built-in list with additional functionality.
@@ -19,6 +754,13 @@ class List(list):
     It enables them to be manipulated as a single entity.
     """
 
+    # Attribute indexes by their attribute names, see create_index().
+    # A None index is stale, and rebuilt on its next use.
+    _indexes = None
+    # The query result cache, see enable_cache(), and the mutation version its results are keyed by.
+    _cache = None
+    _version = 0
+
     def __init__(self, *objects):
         """
         Initializes a new List instance.
@@ -36,6 +778,24 @@ class List(list):
             else objects
         )
 
+    @classmethod
+    def _new(cls, objects=()):
+        """
+        Builds a new list of the objects for an operator result, without the argument checks of __init__.
+        An iterator is consumed straight into the new list, without an intermediate list.
+
+        :param objects: The objects to be contained.
+        :type objects: iterable
+        :return: A new list of this class.
+        :rtype: List
+        """
+        new = list.__new__(cls)
+        list.extend(
+            new,
+            objects,
+        )
+        return new
+
     def __getitem__(self, item):
         """
         Retrieves the item(s) from the list at the specified index or slice.
@@ -54,12 +814,14 @@ class List(list):
             item,
             slice,
         ):
-            _item = List(_item)
+            _item = List._new(_item)
         return _item
 
     def __getattr__(self, item):
         """
         Retrieves the attribute(s) with the specified name from the objects in the list.
+        Iterable values are flattened into one list, and methods are returned as
+        a single function that calls them all.
 
         :param item: The attribute to retrieve.
         :type item: str
@@ -67,49 +829,39 @@ class List(list):
         :rtype: List or object
         :raises AttributeError: If the attribute does not exist in any object.
         """
-        relevant_objects = list(
-            filter(
-                lambda obj: hasattr(
-                    obj,
-                    item,
-                ),
-                self,
+        getter = attrgetter(item)
+        try:
+            # Fast path: every object has the attribute, project them all in C.
+            attributes_values = List._new(
+                map(
+                    getter,
+                    self,
+                )
             )
-        )
-        if not relevant_objects:
-            raise AttributeError(item)
-
-        attributes_values = List(
-            [
-                getattr(
-                    obj,
-                    item,
+        except AttributeError:
+            attributes_values = List._new(
+                _project_existing(
+                    getter,
+                    self,
                 )
-                for obj in relevant_objects
-            ]
-        )
-
-        if all(
-            hasattr(
-                attr_value,
-                "__iter__",
             )
-            and not isinstance(
-                attr_value,
-                str,
+        if not attributes_values:
+            raise AttributeError(item)
+
+        kind = _ITERABLE | _CALLABLE
+        for value_type in set(
+            map(
+                type,
+                attributes_values,
             )
-            for attr_value in attributes_values
         ):
-            return List(chain.from_iterable(attributes_values))
-        elif all(callable(attr_value) for attr_value in attributes_values):
-            return lambda *args: List(
-                [
-                    attr_value(*args)
-                    for obj, attr_value in zip(
-                        relevant_objects,
-                        attributes_values,
-                    )
-                ]
+            kind &= _value_kind(value_type)
+
+        if kind & _ITERABLE:
+            return List._new(chain.from_iterable(attributes_values))
+        elif kind & _CALLABLE:
+            return lambda *args: List._new(
+                [attr_value(*args) for attr_value in attributes_values]
             )
 
         return attributes_values
@@ -123,11 +875,23 @@ class List(list):
         :return: A new List containing the concatenated items.
         :rtype: List
         """
-        added_list = super(
-            List,
-            self,
-        ).__add__(other)
-        return List(added_list)
+        if not isinstance(
+            other,
+            list,
+        ):
+            # Raises list's TypeError.
+            return List._new(
+                super(
+                    List,
+                    self,
+                ).__add__(other)
+            )
+        added_list = List._new(self)
+        list.extend(
+            added_list,
+            other,
+        )
+        return added_list
 
     def __mul__(self, other):
         """
@@ -138,13 +902,193 @@ class List(list):
         :return: A new List containing the multiplied items.
         :rtype: List
         """
-        multi_list = super(
+        multi_list = List._new(self)
+        list.__imul__(
+            multi_list,
+            other,
+        )
+        return multi_list
+
+    def __setitem__(self, key, value):
+        """
+        Sets the item(s) at the specified index or slice.
+        """
+        super(
+            List,
+            self,
+        ).__setitem__(
+            key,
+            value,
+        )
+        self._mutated()
+
+    def __delitem__(self, key):
+        """
+        Deletes the item(s) at the specified index or slice.
+        """
+        super(
+            List,
+            self,
+        ).__delitem__(key)
+        self._mutated()
+
+    def __iadd__(self, other):
+        """
+        Extends this list in place with another list or iterable.
+        """
+        self.extend(other)
+        return self
+
+    def __imul__(self, other):
+        """
+        Repeats the items of this list in place.
+        """
+        super(
+            List,
+            self,
+        ).__imul__(other)
+        self._mutated()
+        return self
+
+    def append(self, obj):
+        """
+        Appends an object to the end of the list, adding it to the list indexes.
+        """
+        super(
+            List,
+            self,
+        ).append(obj)
+        self._appended((obj,))
+
+    def extend(self, objects):
+        """
+        Appends the objects of an iterable to the end of the list, adding them to the list indexes.
+        """
+        if self._indexes:
+            # The objects are read again to index them.
+            objects = list(objects)
+        super(
+            List,
+            self,
+        ).extend(objects)
+        self._appended(objects)
+
+    def insert(self, index, obj):
+        """
+        Inserts an object before the specified index.
+        """
+        super(
+            List,
+            self,
+        ).insert(
+            index,
+            obj,
+        )
+        self._mutated()
+
+    def remove(self, obj):
+        """
+        Removes the first occurrence of an object.
+        """
+        super(
             List,
             self,
-        ).__mul__(other)
-        return List(multi_list)
+        ).remove(obj)
+        self._mutated()
+
+    def pop(self, *args):
+        """
+        Removes and returns the item at the specified index (default last).
+        """
+        obj = super(
+            List,
+            self,
+        ).pop(*args)
+        self._mutated()
+        return obj
+
+    def clear(self):
+        """
+        Removes all the items from the list.
+        """
+        super(
+            List,
+            self,
+        ).clear()
+        self._mutated()
+
+    def sort(self, *args, **kwargs):
+        """
+        Sorts the list in place.
+        """
+        super(
+            List,
+            self,
+        ).sort(
+            *args,
+            **kwargs
+        )
+        self._mutated()
+
+    def reverse(self):
+        """
+        Reverses the list in place.
+        """
+        super(
+            List,
+            self,
+        ).reverse()
+        self._mutated()
+
+    def _appended(self, objects):
+        """
+        Updates the state derived from the list after objects were appended to it.
+
+        :param objects: The appended objects.
+        :type objects: list or tuple
+        """
+        if self._cache is not None:
+            self._version = next(_VERSIONS)
+        if self._indexes:
+            for attributes, index in self._indexes.items():
+                if index is not None:
+                    try:
+                        index.add(objects)
+                    except (AttributeError, TypeError):
+                        # Surface the error on the next rebuild, like a scan would.
+                        self._indexes[attributes] = None
+
+    def _mutated(self):
+        """
+        Invalidates the state derived from the list after it was changed in place.
+        """
+        if self._cache is not None:
+            self._version = next(_VERSIONS)
+        if self._indexes:
+            self._indexes = dict.fromkeys(self._indexes)
+
+    def _numeric_array(self):
+        """
+        Returns the list as a NumPy array, when NumPy is installed and the list
+        is large enough and holds only int or float values.
+
+        :return: The values as an int or float array, or None.
+        :rtype: numpy.ndarray or None
+        """
+        if (
+            numpy is None
+            or len(self) < _NUMPY_MIN_SIZE
+            or type(self[0]) not in _NUMPY_TYPES
+        ):
+            return None
+        # A plain list copy is converted in C, where the List itself would go through __getitem__ per value.
+        array = numpy.asarray(list(self))
+        if array.ndim != 1 or array.dtype.kind not in "if":
+            return None
+        return array
 
     @property
+    @_query
     def sum(self):
         """
         Calculates the sum of all the values in the list.
@@ -155,6 +1099,7 @@ class List(list):
         return sum(self)
 
     @property
+    @_query
     def min(self):
         """
         Finds the lowest value in the list.
@@ -165,6 +1110,7 @@ class List(list):
         return min(self)
 
     @property
+    @_query
     def max(self):
         """
         Finds the highest value in the list.
@@ -175,16 +1121,68 @@ class List(list):
         return max(self)
 
     @property
+    @_query
     def avg(self):
         """
         Calculates the average of the numerical values in the list.
         :return: The average of the values.
         :rtype: float
         """
-        return reduce(
-            lambda x, y: x + y,
-            self,
-        ) / len(self)
+        try:
+            total = sum(self)
+        except TypeError:
+            # Values that add up together, but not to 0, such as timedeltas.
+            total = reduce(
+                add,
+                self,
+            )
+        return total / len(self)
+
+    @property
+    @_query
+    def var(self):
+        """
+        Calculates the population variance of the numerical values in the list.
+
+        :return: The variance of the values, a float for int values too.
+        :rtype: float
+        :raises ValueError: If the list is empty.
+        """
+        array = self._numeric_array()
+        if array is not None:
+            return array.var().item()
+        return _as_float(statistics.pvariance(self))
+
+    @property
+    @_query
+    def std(self):
+        """
+        Calculates the population standard deviation of the numerical values in the list.
+
+        :return: The standard deviation of the values.
+        :rtype: float
+        :raises ValueError: If the list is empty.
+        """
+        array = self._numeric_array()
+        if array is not None:
+            return array.std().item()
+        return statistics.pstdev(self)
+
+    @property
+    @_query
+    def median(self):
+        """
+        Finds the median of the numerical values in the list.
+        For an even number of values, the mean of the two middle values is returned.
+
+        :return: The median of the values, a float for int values too.
+        :rtype: object
+        :raises ValueError: If the list is empty.
+        """
+        array = self._numeric_array()
+        if array is not None:
+            return numpy.median(array).item()
+        return _as_float(statistics.median(self))
 
     @property
     def sorted(
@@ -198,6 +1196,7 @@ class List(list):
         """
         return sorted(self)
 
+    @_query
     def all(
         self,
         expression=_NO_EXPR,
@@ -217,6 +1216,7 @@ class List(list):
         return True
 
 
+    @_query
     def any(
         self,
         expression=_NO_EXPR,
@@ -229,12 +1229,90 @@ class List(list):
         :return: True if any object satisfies the expression, False otherwise.
         :rtype: bool
         """
+        expression = _function_of(expression)
         if self:
             for i in self:
                 if expression(i):
                     return True
         return False  # for an empty iterable, all returns False!
 
+    async def any_async(
+        self,
+        expression=_NO_EXPR,
+        concurrency=_DEFAULT_CONCURRENCY,
+    ):
+        """
+        Checks if any object in the list satisfies the given expression, which may be a coroutine function.
+        At most `concurrency` expressions are awaited at once, and no more are started once one is satisfied.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function
+        :param concurrency: The maximal number of expressions awaited at once.
+        :type concurrency: int
+        :return: True if any object satisfies the expression, False otherwise.
+        :rtype: bool
+        """
+        from linqit.async_list import (
+            _map_bounded,
+        )
+
+        results = await _map_bounded(
+            expression,
+            self,
+            concurrency,
+            stop=lambda index, result: bool(result),
+        )
+        return any(result is not _NONE and result for result in results)
+
+    @_query
+    def bottom(self, count, key=None):
+        """
+        Returns the n lowest objects, in ascending order, without sorting the whole list.
+
+        :param count: The number of objects to return.
+        :type count: int
+        :param key: The expression to compare the objects by.
+        :type key: function or None
+        :return: A new List containing the n lowest objects.
+        :rtype: List
+        """
+        return self.top(
+            count,
+            key,
+            descending=False,
+        )
+
+    def cache_info(self):
+        """
+        Reports the effectiveness of the query cache of the list, see enable_cache().
+
+        :return: The hits, misses, maximal size and current size of the cache, all 0 when it is disabled.
+        :rtype: CacheInfo
+        """
+        cache = self._cache
+        if cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return CacheInfo(
+            cache.hits,
+            cache.misses,
+            cache.maxsize,
+            len(cache.results),
+        )
+
+    def chunk(self, size):
+        """
+        Splits the list into consecutive batches of n objects, the last one possibly shorter,
+        in a single pass. Batches are only built as they are reached.
+
+        :param size: The number of objects per batch.
+        :type size: int
+        :return: A new Enumerable over the batches, as Lists.
+        :rtype: Enumerable
+        :raises ValueError: If the size is lower than 1.
+        """
+        return self.lazy().chunk(size)
+
+    @_query
     def concat(self, second):
         """
         Concatenates this list with another list or iterable.
@@ -244,8 +1322,9 @@ class List(list):
         :return: A new List containing the concatenated items.
         :rtype: List
         """
-        return List(self + second)
+        return self + second
 
+    @_query
     def contains(self, item):
         """
         Checks if the list contains the specified item.
@@ -256,17 +1335,100 @@ class List(list):
         """
         return item in self
 
+    def create_index(self, *attributes):
+        """
+        Builds a hash index on the given attributes, that where() uses for its equality filters.
+        Several attributes make a composite index, used when all of them are filtered on.
+        The index follows changes to the list itself, but not to the attributes of its objects:
+        call create_index() again after changing them.
+
+        :param attributes: The attribute names to index.
+        :type attributes: str
+        :return: This list.
+        :rtype: List
+        :raises AttributeError: If an object does not have one of the attributes.
+        :raises TypeError: If an attribute value is unhashable.
+        """
+        if not attributes:
+            raise TypeError("create_index() requires at least one attribute")
+        index = _AttributeIndex(
+            attributes,
+            self,
+        )
+        if self._indexes is None:
+            self._indexes = {}
+        self._indexes[attributes] = index
+        return self
+
+    def disable_cache(self):
+        """
+        Disables the query cache of the list, and drops the cached results.
+
+        :return: This list.
+        :rtype: List
+        """
+        self._cache = None
+        return self
+
+    @_query
     def distinct(
         self,
+        key=None,
     ):
         """
         Returns a new list with no duplicate items.
+        The first occurrence of each item is kept, in order.
 
+        :param key: An expression computing the value to compare items by.
+        :type key: function or None
         :return: A new list with distinct items.
         :rtype: List
         """
-        return List(set(self))
+        return List._new(
+            _distinct(
+                self,
+                key,
+            )
+        )
+
+    def drop_index(self, *attributes):
+        """
+        Removes the hash index on the given attributes, or all of them if none are given.
+
+        :param attributes: The attribute names of the index.
+        :type attributes: str
+        """
+        if not attributes:
+            self._indexes = None
+        elif self._indexes:
+            self._indexes.pop(
+                attributes,
+                None,
+            )
+
+    def enable_cache(self, maxsize=128):
+        """
+        Caches the results of the pure operators (where, select, order_by, top, the aggregates...)
+        on the list, and on the lists they return, in a bounded LRU cache.
+        Results are keyed by the version of the list, the operator and its arguments,
+        with expressions compared by identity: pass the same function objects to hit the cache.
+        Changing the list in place bumps its version, so stale results are never returned,
+        but changes to the attributes of its objects are not tracked.
+        Cached lists are returned as copies, so changing them doesn't change the cache.
+
+        :param maxsize: The maximal number of cached results.
+        :type maxsize: int
+        :return: This list.
+        :rtype: List
+        :raises ValueError: If maxsize is lower than 1.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._cache = _QueryCache(maxsize)
+        self._version = next(_VERSIONS)
+        return self
 
+    @_query
     def except_for(
         self,
         expression,
@@ -279,13 +1441,33 @@ class List(list):
         :return: A new List containing the filtered objects.
         :rtype: List
         """
-        return List(
+        return List._new(
             filter(
                 lambda e: not expression(e),
                 self,
             )
         )
 
+    @_query
+    def except_items(self, second):
+        """
+        Returns a new list containing the objects that are not present in the second list (set difference).
+        The order of this list is kept, and the second list is hashed once.
+
+        :param second: The list or iterable of objects to remove.
+        :type second: list or iterable
+        :return: A new List containing the remaining objects.
+        :rtype: List
+        """
+        second = _HashedItems(second)
+        return List._new(
+            filterfalse(
+                second.__contains__,
+                self,
+            )
+        )
+
+    @_query
     def first(
         self,
 expression=_NO_EXPR, default=_NONE
@@ -300,6 +1482,7 @@ expression=_NO_EXPR, default=_NONE
         :rtype: object
         :raises IndexError: If no matching value is found and no default value is provided.
         """
+        expression = _function_of(expression)
         if self:
             for el in self:
                 if expression(el):
@@ -310,6 +1493,150 @@ expression=_NO_EXPR, default=_NONE
             raise IndexError('No matching values')
 
 
+    async def first_async(
+        self,
+        expression=_NO_EXPR,
+        default=_NONE,
+        concurrency=_DEFAULT_CONCURRENCY,
+    ):
+        """
+        Returns the first object that satisfies the given expression, which may be a coroutine function.
+        At most `concurrency` expressions are awaited at once, and none are started past the first match.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function or None
+        :param default: The default value to return if no matching value is found.
+        :param concurrency: The maximal number of expressions awaited at once.
+        :type concurrency: int
+        :return: The first matching object or the default value.
+        :rtype: object
+        :raises IndexError: If no matching value is found and no default value is provided.
+        """
+        from linqit.async_list import (
+            _map_bounded,
+        )
+
+        results = await _map_bounded(
+            expression,
+            self,
+            concurrency,
+            stop=lambda index, result: bool(result),
+        )
+        for obj, result in zip(
+            self,
+            results,
+        ):
+            if result is not _NONE and result:
+                return obj
+        if default is not _NONE:
+            return default
+        raise IndexError("No matching values")
+
+    @classmethod
+    def from_csv(cls, path, encoding="utf-8", fieldnames=None, restval=None, **fmtparams):
+        """
+        Returns a deferred query over the rows of a CSV file, as named tuples of strings.
+        The file is streamed in large buffered chunks and each row is parsed only when it is reached,
+        so first() or take(n) stop reading it early.
+        As in csv.DictReader, blank lines are skipped and rows with fewer fields are padded with restval.
+
+        :param path: The path of the file.
+        :type path: str
+        :param encoding: The encoding of the file.
+        :type encoding: str
+        :param fieldnames: The field names of the rows, read from the first row of the file by default.
+        :type fieldnames: list or None
+        :param restval: The value of the missing fields of short rows.
+        :type restval: object
+        :param fmtparams: The CSV format, as in csv.reader().
+        :type fmtparams: dict
+        :return: A new Enumerable over the rows, reading the file again on each run.
+        :rtype: Enumerable
+        :raises ValueError: When run, if a row has more fields than the field names.
+        """
+        from linqit.enumerable import (
+            Enumerable,
+        )
+        from linqit.sources import (
+            _FileSource,
+            _read_csv,
+        )
+
+        return Enumerable(
+            _FileSource(
+                path,
+                _read_csv,
+                encoding=encoding,
+                newline="",
+                fieldnames=fieldnames,
+                restval=restval,
+                **fmtparams
+            )
+        )
+
+    @classmethod
+    def from_jsonl(cls, path, encoding="utf-8", record=None):
+        """
+        Returns a deferred query over the objects of a JSON Lines file, one JSON value per line.
+        The file is streamed in large buffered chunks and each line is parsed only when it is reached,
+        so first() or take(n) stop reading it early. Blank lines are skipped.
+
+        :param path: The path of the file.
+        :type path: str
+        :param encoding: The encoding of the file.
+        :type encoding: str
+        :param record: Builds each record out of the keys of its JSON object, such as types.SimpleNamespace,
+            so attribute filters apply. The parsed JSON values by default.
+        :type record: function or None
+        :return: A new Enumerable over the records, reading the file again on each run.
+        :rtype: Enumerable
+        """
+        from linqit.enumerable import (
+            Enumerable,
+        )
+        from linqit.sources import (
+            _FileSource,
+            _read_jsonl,
+        )
+
+        return Enumerable(
+            _FileSource(
+                path,
+                _read_jsonl,
+                encoding=encoding,
+                record=record,
+            )
+        )
+
+    @classmethod
+    def from_lines(cls, path, encoding="utf-8"):
+        """
+        Returns a deferred query over the lines of a text file, without their line endings.
+        The file is streamed in large buffered chunks, so first() or take(n) stop reading it early.
+
+        :param path: The path of the file.
+        :type path: str
+        :param encoding: The encoding of the file.
+        :type encoding: str
+        :return: A new Enumerable over the lines, reading the file again on each run.
+        :rtype: Enumerable
+        """
+        from linqit.enumerable import (
+            Enumerable,
+        )
+        from linqit.sources import (
+            _FileSource,
+            _read_lines,
+        )
+
+        return Enumerable(
+            _FileSource(
+                path,
+                _read_lines,
+                encoding=encoding,
+            )
+        )
+
     def get_by_attr(self, attr):
         """
         Retrieves all objects in the list that have the specified attribute.
@@ -325,24 +1652,138 @@ expression=_NO_EXPR, default=_NONE
                 attr,
             )
         except AttributeError:
-            return List()
+            return List._new()
+
+    def group_by(self, key, element=None):
+        """
+        Groups the objects by a key, in a single hash pass.
+        The grouping is deferred: iterate it, call to_list() or to_dict(),
+        or aggregate() to fold per-group aggregates without building the groups.
+
+        :param key: The expression computing the key of each object.
+        :type key: function
+        :param element: An expression computing what is put in the group for each object,
+            the object itself by default.
+        :type element: function or None
+        :return: A new GroupBy over the list.
+        :rtype: GroupBy
+        """
+        from linqit.grouping import (
+            GroupBy,
+        )
+
+        return GroupBy(
+            self,
+            key,
+            element,
+        )
+
+    @_query
+    def group_join(
+        self,
+        inner,
+        outer_key,
+        inner_key,
+        result=None,
+        strategy="hash",
+    ):
+        """
+        Correlates the objects of this list with the inner objects of the same key,
+        and returns one result per object of this list, with a List of its matches.
+
+        :param inner: The list or iterable to join with.
+        :type inner: list or iterable
+        :param outer_key: The expression computing the key of each object of this list.
+        :type outer_key: function
+        :param inner_key: The expression computing the key of each inner object.
+        :type inner_key: function
+        :param result: An expression of an object and the List of its matches, (object, matches) by default.
+        :type result: function or None
+        :param strategy: "hash", or "merge" when both lists are already sorted by their keys.
+        :type strategy: str
+        :return: A new List of the results, in the order of this list.
+        :rtype: List
+        :raises ValueError: If the strategy is unknown.
+        """
+        from linqit.joins import (
+            _group_join,
+        )
+
+        return _group_join(
+            self,
+            inner,
+            outer_key,
+            inner_key,
+            result or _pair,
+            strategy,
+        )
 
+    @_query
     def intersect(self, second):
         """
         Returns a new list containing the objects that are present in both this list and the second list.
+        The second list is hashed once, so the cost is O(n+m) rather than O(n*m).
 
         :param second: The list or iterable to intersect with.
         :type second: list or iterable
         :return: A new List containing the intersecting objects.
         :rtype: List
         """
-        return List(
+        second = _HashedItems(second)
+        return List._new(
             filter(
-                lambda e: e in second,
+                second.__contains__,
                 self,
             )
         )
 
+    @_query
+    def join(
+        self,
+        inner,
+        outer_key,
+        inner_key,
+        result=None,
+        how="inner",
+        strategy="hash",
+    ):
+        """
+        Correlates the objects of this list with the inner objects of the same key, in linear time.
+        The hash strategy builds its table on the smaller list; the merge strategy
+        walks both lists at once, and requires them to be sorted by their keys.
+
+        :param inner: The list or iterable to join with.
+        :type inner: list or iterable
+        :param outer_key: The expression computing the key of each object of this list.
+        :type outer_key: function
+        :param inner_key: The expression computing the key of each inner object.
+        :type inner_key: function
+        :param result: An expression of an object and a matching inner object, (object, inner) by default.
+        :type result: function or None
+        :param how: "inner", "left" (objects without matches are joined with None),
+            "semi" (the objects with matches) or "anti" (the objects without matches).
+        :type how: str
+        :param strategy: "hash", or "merge" when both lists are already sorted by their keys.
+        :type strategy: str
+        :return: A new List of the results, in the order of this list, then of the inner list.
+        :rtype: List
+        :raises ValueError: If the join or the strategy is unknown.
+        """
+        from linqit.joins import (
+            _join,
+        )
+
+        return _join(
+            self,
+            inner,
+            outer_key,
+            inner_key,
+            result or _pair,
+            how,
+            strategy,
+        )
+
+    @_query
     def last(
         self,
         expression=_NO_EXPR,
@@ -350,6 +1791,7 @@ expression=_NO_EXPR, default=_NONE
     ):
         """
         Returns the last object that satisfies the given expression, or the last element if no expression is provided.
+        The list is scanned backwards, without copying it.
 
         :param expression: The expression to evaluate for each object.
         :type expression: function or None
@@ -358,11 +1800,67 @@ expression=_NO_EXPR, default=_NONE
         :rtype: object
         :raises IndexError: If no matching value is found and no default value is provided.
         """
-        return List(reversed(self)).first(
-            expression,
+        found = next(
+            filter(
+                expression,
+                reversed(self),
+            ),
             default,
         )
+        if found is not _NONE:
+            return found
+        raise IndexError("No matching values")
+
+    def lazy(self):
+        """
+        Returns a deferred query over the list.
+        Operators chained on it are recorded and run together, in a single pass,
+        only when a terminal operator (first, any, all, sum, to_list...) is called.
+
+        :return: A new Enumerable over the list.
+        :rtype: Enumerable
+        """
+        from linqit.enumerable import (
+            Enumerable,
+        )
+
+        return Enumerable(self)
+
+    @_query
+    def max_by(self, key):
+        """
+        Returns the object with the highest key, in a single pass.
+        The first one is returned on ties.
+
+        :param key: The expression to compare the objects by.
+        :type key: function
+        :return: The object with the highest key.
+        :rtype: object
+        :raises ValueError: If the list is empty.
+        """
+        return max(
+            self,
+            key=key,
+        )
+
+    @_query
+    def min_by(self, key):
+        """
+        Returns the object with the lowest key, in a single pass.
+        The first one is returned on ties.
+
+        :param key: The expression to compare the objects by.
+        :type key: function
+        :return: The object with the lowest key.
+        :rtype: object
+        :raises ValueError: If the list is empty.
+        """
+        return min(
+            self,
+            key=key,
+        )
 
+    @_query
     def order_by(
         self,
         expression=None,
@@ -371,17 +1869,123 @@ expression=_NO_EXPR, default=_NONE
         Returns a new list of objects sorted according to the provided expression.
         If no expression is given, the default sort is used.
 
+        The expression is computed once per object, and the sort is stable,
+        so then_by() can sort the result further by more keys.
+
         :param expression: The expression to determine the sorting order.
         :type expression: function or None
-        :return: A new sorted List.
-        :rtype: List
+        :return: A new sorted OrderedList.
+        :rtype: OrderedList
+        """
+        return _ordered(
+            self,
+            ((expression, False),),
+        )
+
+    @_query
+    def order_by_descending(
+        self,
+        expression=None,
+    ):
+        """
+        Returns a new list of objects sorted in descending order according to the provided expression.
+        Objects with equal keys keep their original order.
+
+        :param expression: The expression to determine the sorting order.
+        :type expression: function or None
+        :return: A new sorted OrderedList.
+        :rtype: OrderedList
+        """
+        return _ordered(
+            self,
+            ((expression, True),),
+        )
+
+    def parallel(self, workers=None, backend="thread", chunk_size=None):
+        """
+        Returns a parallel view of the list, whose operators split the list into chunks,
+        run them on a pool of workers, and merge the results in the original order.
+
+        :param workers: The number of workers, the number of CPUs by default.
+        :type workers: int or None
+        :param backend: "thread", or "process" for CPU-bound picklable expressions.
+        :type backend: str
+        :param chunk_size: The number of elements per chunk.
+        :type chunk_size: int or None
+        :return: A new ParallelList over the list.
+        :rtype: ParallelList
         """
-        sorted_data = sorted(
+        from linqit.parallel import (
+            ParallelList,
+        )
+
+        return ParallelList(
             self,
-            key=expression,
+            workers,
+            backend,
+            chunk_size,
+        )
+
+    @_query
+    def percentile(self, q):
+        """
+        Calculates the q-th percentile of the numerical values in the list,
+        interpolating linearly between the two nearest values.
+
+        :param q: The percentile to compute, between 0 and 100.
+        :type q: int or float
+        :return: The percentile of the values.
+        :rtype: float
+        :raises ValueError: If the list is empty or q is out of range.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("The percentile must be between 0 and 100")
+        if not self:
+            raise ValueError("percentile requires at least one value")
+        array = self._numeric_array()
+        if array is not None:
+            return numpy.percentile(
+                array,
+                q,
+            ).item()
+        data = sorted(self)
+        position = (len(data) - 1) * q / 100.0
+        lower = int(position)
+        upper = min(
+            lower + 1,
+            len(data) - 1,
         )
-        return List(sorted_data)
+        return data[lower] + (data[upper] - data[lower]) * (position - lower)
+
+    @staticmethod
+    @contextmanager
+    def profile(hook=None):
+        """
+        Profiles the List operators called inside the block, on any list, in the current thread or async task.
+        Calls made by other threads, including the workers of parallel(), are not recorded.
+        Each call is recorded as an OperatorProfile: its wall time in seconds, the length of the list,
+        the length of the result list (None for other results), the number of calls of its expressions,
+        and the size of the result list itself in bytes, as reported by sys.getsizeof().
+        Operators the hook calls are not profiled.
+
+        Example: with List.profile() as profile: people.where(is_adult).order_by(by_name)
+
+        :param hook: Also called with each OperatorProfile, such as to forward it to a metrics system.
+        :type hook: function or None
+        :return: A context manager giving the List of the recorded OperatorProfiles.
+        :rtype: contextmanager
+        """
+        profiles = List._new()
+        hooks = (profiles.append,) if hook is None else (profiles.append, hook)
+        _use_queries(1)
+        token = _PROFILE_HOOKS.set(_PROFILE_HOOKS.get() + hooks)
+        try:
+            yield profiles
+        finally:
+            _PROFILE_HOOKS.reset(token)
+            _use_queries(-1)
 
+    @_query
     def select(
         self,
         expression,
@@ -394,68 +1998,303 @@ expression=_NO_EXPR, default=_NONE
         :return: A new List containing the transformed values.
         :rtype: List
         """
-        return List(
+        return List._new(
             map(
+                _function_of(expression),
+                self,
+            )
+        )
+
+    async def select_async(
+        self,
+        expression,
+        concurrency=_DEFAULT_CONCURRENCY,
+    ):
+        """
+        Returns a new list containing the values obtained by applying the expression to each object in the list.
+        The expression may be a coroutine function, at most `concurrency` of them are awaited at once.
+
+        :param expression: The expression to transform each object.
+        :type expression: function
+        :param concurrency: The maximal number of expressions awaited at once.
+        :type concurrency: int
+        :return: A new List containing the transformed values, in order.
+        :rtype: List
+        """
+        from linqit.async_list import (
+            _map_bounded,
+        )
+
+        return List._new(
+            await _map_bounded(
                 expression,
                 self,
+                concurrency,
             )
         )
 
+    @_query
     def skip(self, count):
         """
         Returns a new list containing the elements starting from the specified index.
+        As in LINQ, a negative count skips nothing.
 
         :param count: The number of elements to skip.
         :type count: int
         :return: A new List containing the remaining elements.
         :rtype: List
         """
-        return List(self[count:])
+        return self[max(count, 0) :]
+
+    @_query
+    def stats(self, selector=None):
+        """
+        Calculates count, sum, min, max, mean and variance of the values in a single pass.
+        With a selector, values are computed on the fly, without building a projected list.
+
+        :param selector: An expression computing the value of each object.
+        :type selector: function or None
+        :return: The aggregates, as (count, sum, min, max, mean, variance).
+        :rtype: Stats
+        """
+        return _stats(
+            self,
+            selector,
+        )
 
+    @_query
     def take(self, count):
         """
         Returns a new list containing the first n elements.
+        As in LINQ, a negative count takes nothing.
 
         :param count: The number of elements to take.
         :type count: int
         :return: A new List containing the first n elements.
         :rtype: List
         """
-        if not self or count == 0:
-            return List()
+        if not self or count <= 0:
+            return List._new()
         return self[:count]
 
+    def to_lookup(self, key, element=None):
+        """
+        Groups the objects by a key, in a single hash pass.
+
+        :param key: The expression computing the key of each object.
+        :type key: function
+        :param element: An expression computing what is put in the group for each object,
+            the object itself by default.
+        :type element: function or None
+        :return: The groups by their keys, with an empty group for missing keys.
+        :rtype: Lookup
+        """
+        return self.group_by(
+            key,
+            element,
+        ).to_dict()
+
+    @_query
+    def top(self, count, key=None, descending=True):
+        """
+        Returns the n highest objects, in descending order, without sorting the whole list.
+        It selects them with a heap in O(n log k), and gives the same result as
+        a stable descending sort followed by take(n): ties are kept in list order.
+
+        :param count: The number of objects to return.
+        :type count: int
+        :param key: The expression to compare the objects by.
+        :type key: function or None
+        :param descending: Whether to return the highest objects, or the lowest in ascending order.
+        :type descending: bool
+        :return: A new List containing the n highest objects.
+        :rtype: List
+        """
+        return List._new(
+            _top(
+                self,
+                count,
+                key,
+                descending,
+            )
+        )
+
+    @_query
+    def union(self, second):
+        """
+        Returns a new list containing the distinct objects of this list followed by those of the second list.
+        The first occurrence of each object is kept, in order.
+
+        :param second: The list or iterable to unite with.
+        :type second: list or iterable
+        :return: A new List containing the united objects.
+        :rtype: List
+        """
+        seen = _HashedItems()
+        united = []
+        for e in chain(
+            self,
+            second,
+        ):
+            if e not in seen:
+                seen.add(e)
+                united.append(e)
+        return List._new(united)
+
+    def view(self, start=None, stop=None, step=None):
+        """
+        Returns a zero-copy view of a range of the list.
+        Slicing the view, skip() and take() on it, cost O(1) memory regardless of the list size.
+
+        :param start: The index of the first element in the view.
+        :type start: int or None
+        :param stop: The index after the last element in the view.
+        :type stop: int or None
+        :param step: The step between the elements in the view.
+        :type step: int or None
+        :return: A new ListView over the list.
+        :rtype: ListView
+        """
+        from linqit.list_view import (
+            ListView,
+        )
+
+        return ListView(
+            self,
+            range(len(self))[start:stop:step],
+        )
+
+    @_query
     def where(self, expression=None, **filters):
         """
         Returns a new list containing the objects that satisfy the given expression and filters.
+        Equality filters on indexed attributes are looked up in the index (see create_index()).
+        The expression runs on every object; to stop early, chain from lazy() instead,
+        e.g. lazy().where(expression).take(3) only reads the source up to the third match.
+
+        An X expression, such as (X.name == "bob") & (X.age > 15), runs as written, and its leading
+        equality comparisons are looked up in the indexes too.
 
         :param expression: The expression to evaluate for each object.
-        :type expression: function or None
-        :param filters: Additional attribute filters to apply.
+        :type expression: function, Expression or None
+        :param filters: Additional attribute filters to apply, as attribute=value,
+            or attribute__lookup=value with one of the lookups: ne, gt, gte, lt, lte, in, isnull, startswith.
         :type filters: dict
         :return: A new List containing the filtered objects.
         :rtype: List
         """
+        candidates = self
+        if self._indexes:
+            lookup = dict(filters)
+            if isinstance(
+                expression,
+                Expression,
+            ):
+                # The expression still runs on the candidates, so it short-circuits as written.
+                for key, value in _leading_filters(expression)[0].items():
+                    if "__" not in key:
+                        lookup.setdefault(
+                            key,
+                            value,
+                        )
+            if lookup:
+                candidates, remaining = self._indexed_candidates(lookup)
+                filters = {key: value for key, value in remaining.items() if key in filters}
+        selection = filter(
+            _where_predicate(
+                _function_of(expression),
+                filters,
+            ),
+            candidates,
+        )
+        return List._new(selection)
+
+    async def where_async(
+        self,
+        expression,
+        concurrency=_DEFAULT_CONCURRENCY,
+    ):
+        """
+        Returns a new list containing the objects that satisfy the given expression.
+        The expression may be a coroutine function, at most `concurrency` of them are awaited at once.
 
-        def filter_function(
-            x,
-        ):
-            return (expression is None or expression(x)) and all(
-                [
-                    getattr(
-                        x,
-                        key,
-                    )
-                    == value
-                    for key, value in filters.items()
-                ]
-            )
+        :param expression: The expression to evaluate for each object.
+        :type expression: function
+        :param concurrency: The maximal number of expressions awaited at once.
+        :type concurrency: int
+        :return: A new List containing the filtered objects, in order.
+        :rtype: List
+        """
+        from linqit.async_list import (
+            _map_bounded,
+        )
 
-        selection = filter(
-            filter_function,
+        results = await _map_bounded(
+            expression,
             self,
+            concurrency,
+        )
+        return List._new(
+            [
+                obj
+                for obj, result in zip(
+                    self,
+                    results,
+                )
+                if result
+            ]
+        )
+
+    def window(self, size, step=1):
+        """
+        Slides a window of n objects over the list, moving it by step objects at a time,
+        in a single pass. Only full windows are produced, and only as they are reached.
+
+        :param size: The number of objects per window.
+        :type size: int
+        :param step: The number of objects the window moves by.
+        :type step: int
+        :return: A new Enumerable over the windows, as Lists.
+        :rtype: Enumerable
+        :raises ValueError: If the size or the step is lower than 1.
+        """
+        return self.lazy().window(
+            size,
+            step,
         )
-        return List(selection)
+
+    def _indexed_candidates(self, filters):
+        """
+        Narrows down the objects for the given equality filters with the best matching index.
+
+        :param filters: Attribute filters, as attribute name to expected value.
+        :type filters: dict
+        :return: The candidate objects, and the filters still to apply on them.
+        :rtype: tuple
+        """
+        usable = [
+            attributes
+            for attributes in self._indexes
+            if all(attribute in filters for attribute in attributes)
+        ]
+        if not usable:
+            return self, filters
+        attributes = max(
+            usable,
+            key=len,
+        )
+        index = self._indexes[attributes]
+        if index is None:
+            index = self._indexes[attributes] = _AttributeIndex(
+                attributes,
+                self,
+            )
+        candidates = index.lookup(filters)
+        if candidates is None:
+            return self, filters
+        return candidates, {
+            key: value for key, value in filters.items() if key not in attributes
+        }
 
     def of_type(self, _type):
         """
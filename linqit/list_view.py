@@ -0,0 +1,271 @@
+from collections.abc import (
+    MutableSequence,
+)
+from itertools import (
+    repeat,
+)
+
+from linqit.linq_list import (
+    _NO_EXPR,
+    _NONE,
+    List,
+)
+
+
+class ListView(MutableSequence):
+    """
+    A zero-copy window over a range of a list.
+    It holds a reference to its parent list and a range of indexes, so slicing it,
+    skipping and taking elements cost O(1) memory regardless of the list size.
+    Changes to the parent list's elements show through the view; the view copies its elements
+    into a list of its own only when it is changed itself.
+    The range is fixed, so once the parent list grows or shrinks, reading the view raises a RuntimeError,
+    as iterating a dict does after it changes size; create a new view then.
+    Other List operators run on a List copy of the view.
+    """
+
+    # Whether the view was changed, and copied its elements into a list of its own.
+    _owned = False
+
+    def __init__(self, parent, indexes=None):
+        """
+        Initializes a new ListView instance.
+
+        :param parent: The list to look at.
+        :type parent: list
+        :param indexes: The indexes of the parent list in the view, all of them by default.
+        :type indexes: range
+        """
+        self._parent = parent
+        self._parent_size = len(parent)
+        self._indexes = range(self._parent_size) if indexes is None else indexes
+
+    def __len__(self):
+        self._check_parent()
+        return len(self._indexes)
+
+    def __iter__(self):
+        self._check_parent()
+        return map(
+            list.__getitem__,
+            repeat(self._parent),
+            self._indexes,
+        )
+
+    def __reversed__(self):
+        self._check_parent()
+        return map(
+            list.__getitem__,
+            repeat(self._parent),
+            reversed(self._indexes),
+        )
+
+    def __getitem__(self, item):
+        """
+        Retrieves the item at the specified index, or a view of the specified slice.
+
+        :param item: Index or slice specifying the item(s) to retrieve.
+        :type item: int or slice
+        :return: The item, or a new ListView.
+        :rtype: ListView or object
+        """
+        self._check_parent()
+        if isinstance(
+            item,
+            slice,
+        ):
+            return ListView(
+                self._parent,
+                self._indexes[item],
+            )
+        return list.__getitem__(
+            self._parent,
+            self._indexes[item],
+        )
+
+    def __setitem__(self, item, value):
+        self._own()[item] = value
+        self._resized()
+
+    def __delitem__(self, item):
+        del self._own()[item]
+        self._resized()
+
+    def insert(self, index, value):
+        self._own().insert(
+            index,
+            value,
+        )
+        self._resized()
+
+    def __eq__(self, other):
+        if isinstance(
+            other,
+            (list, ListView),
+        ):
+            return len(self) == len(other) and all(
+                a == b
+                for a, b in zip(
+                    self,
+                    other,
+                )
+            )
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "ListView({items!r})".format(
+            items=list(self),
+        )
+
+    def __getattr__(self, item):
+        """
+        Runs any other List operator, or attribute projection, on a List copy of the view.
+
+        :param item: The attribute to retrieve.
+        :type item: str
+        :return: The attribute of the List copy.
+        :rtype: object
+        """
+        if item.startswith("_"):
+            raise AttributeError(item)
+        return getattr(
+            self.to_list(),
+            item,
+        )
+
+    def _check_parent(self):
+        """
+        Checks that the parent list still has the size the view's range was taken from.
+
+        :raises RuntimeError: If the parent list grew or shrank.
+        """
+        if len(self._parent) != self._parent_size:
+            raise RuntimeError(
+                "The list changed size from {} to {} after the view was created".format(
+                    self._parent_size,
+                    len(self._parent),
+                )
+            )
+
+    def _own(self):
+        """
+        Copies the viewed elements into a list of the view's own, before it is changed.
+
+        :return: The list backing the view.
+        :rtype: List
+        """
+        if not self._owned:
+            self._parent = self.to_list()
+            self._owned = True
+            self._resized()
+        return self._parent
+
+    def _resized(self):
+        """
+        Makes the view span all of its own list again, after it was changed.
+        """
+        self._parent_size = len(self._parent)
+        self._indexes = range(self._parent_size)
+
+    def to_list(self):
+        """
+        Copies the viewed elements into a new List.
+
+        :return: A new List containing the viewed elements.
+        :rtype: List
+        """
+        return List._new(iter(self))
+
+    def lazy(self):
+        """
+        Returns a deferred query over the view.
+
+        :return: A new Enumerable over the view.
+        :rtype: Enumerable
+        """
+        from linqit.enumerable import (
+            Enumerable,
+        )
+
+        return Enumerable(self)
+
+    def skip(self, count):
+        """
+        Returns a view of the elements starting from the specified index, without copying.
+
+        :param count: The number of elements to skip.
+        :type count: int
+        :return: A new ListView containing the remaining elements.
+        :rtype: ListView
+        """
+        return self[max(count, 0) :]
+
+    def take(self, count):
+        """
+        Returns a view of the first n elements, without copying.
+
+        :param count: The number of elements to take.
+        :type count: int
+        :return: A new ListView containing the first n elements.
+        :rtype: ListView
+        """
+        return self[: max(count, 0)]
+
+    def first(
+        self,
+        expression=_NO_EXPR,
+        default=_NONE,
+    ):
+        """
+        Returns the first viewed object that satisfies the given expression.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function or None
+        :param default: The default value to return if no matching value is found.
+        :return: The first matching object or the default value.
+        :rtype: object
+        :raises IndexError: If no matching value is found and no default value is provided.
+        """
+        found = next(
+            filter(
+                expression,
+                self,
+            ),
+            default,
+        )
+        if found is not _NONE:
+            return found
+        raise IndexError("No matching values")
+
+    def last(
+        self,
+        expression=_NO_EXPR,
+        default=_NONE,
+    ):
+        """
+        Returns the last viewed object that satisfies the given expression,
+        scanning backwards without copying.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function or None
+        :param default: The default value to return if no matching value is found.
+        :return: The last matching object or the default value.
+        :rtype: object
+        :raises IndexError: If no matching value is found and no default value is provided.
+        """
+        found = next(
+            filter(
+                expression,
+                reversed(self),
+            ),
+            default,
+        )
+        if found is not _NONE:
+            return found
+        raise IndexError("No matching values")
@@ -0,0 +1,223 @@
+from functools import (
+    partial,
+)
+
+from linqit.expressions import (
+    _function_of,
+)
+from linqit.linq_list import (
+    List,
+)
+
+
+# The sort keys of a list sorted by the objects themselves.
+_OWN_KEYS = ()
+
+
+def _sort(objects, key, descending):
+    """
+    Stable-sorts a new list of objects in place by the key, computing the key once per object.
+
+    :param objects: The objects to sort, in place.
+    :type objects: list
+    :return: The keys of the objects in their original order.
+    :rtype: list
+    """
+    keys = list(
+        map(
+            _function_of(key),
+            objects,
+        )
+    )
+    # The sort calls its key function once per object, in order, so it can read the computed keys back.
+    list.sort(
+        objects,
+        key=partial(
+            next,
+            iter(keys),
+        ),
+        reverse=descending,
+    )
+    return keys
+
+
+def _keys(objects, key):
+    """
+    Computes the sort keys of the objects, once per object, in their order.
+    """
+    if key is None:
+        return objects
+    return list(
+        map(
+            _function_of(key),
+            objects,
+        )
+    )
+
+
+def _sorted_by_keys(source, keys, plan):
+    """
+    Sorts the objects by their precomputed keys, with one stable sort per key, from the last key to the first.
+
+    :param source: The objects to sort.
+    :type source: list
+    :param keys: The keys of the objects, a list per (key, descending) pair of the plan, in the order of source.
+    :type keys: tuple
+    :param plan: The (key, descending) pairs to sort by, in order.
+    :type plan: tuple
+    :return: A new sorted OrderedList.
+    :rtype: OrderedList
+    """
+    order = list(range(len(source)))
+    for values, (_, descending) in zip(
+        reversed(keys),
+        reversed(plan),
+    ):
+        order.sort(
+            key=values.__getitem__,
+            reverse=descending,
+        )
+    ordered = OrderedList._new(
+        map(
+            source.__getitem__,
+            order,
+        )
+    )
+    ordered._sort_plan = plan
+    ordered._source = source
+    ordered._sort_keys = keys
+    return ordered
+
+
+def _ordered(objects, plan):
+    """
+    Sorts the objects by a plan of keys, each key breaking the ties of the previous ones.
+
+    :param objects: The objects to sort.
+    :type objects: iterable
+    :param plan: The (key, descending) pairs to sort by, in order.
+    :type plan: tuple
+    :return: A new sorted OrderedList.
+    :rtype: OrderedList
+    """
+    if len(plan) > 1:
+        source = list(objects)
+        return _sorted_by_keys(
+            source,
+            tuple(_keys(source, key) for key, _ in plan),
+            plan,
+        )
+    ((key, descending),) = plan
+    ordered = OrderedList._new(objects)
+    if key is None:
+        # Sorted by the objects themselves, it is its own source, as the class defaults say.
+        list.sort(
+            ordered,
+            reverse=descending,
+        )
+        if descending:
+            ordered._sort_plan = plan
+        return ordered
+    # The others keep the objects in their original order.
+    ordered._source = list(ordered)
+    ordered._sort_keys = (
+        _sort(
+            ordered,
+            key,
+            descending,
+        ),
+    )
+    ordered._sort_plan = plan
+    return ordered
+
+
+class OrderedList(List):
+    """
+    A List sorted by order_by(), which then_by() sorts further by more keys.
+    The list keeps the keys it was sorted by, so each key is computed once per object,
+    and then_by() only computes the new key before sorting again by all the keys, with stable C sorts.
+    Changing the list in place drops the keys, and then_by() sorts it again by all the keys.
+    """
+
+    # The (key, descending) pairs the list is sorted by, by default the objects themselves, ascending.
+    _sort_plan = ((None, False),)
+    # The objects in the order they were sorted from, or None if the list is sorted by the objects themselves.
+    _source = None
+    # The keys of the source objects, a list per pair of the plan (or _OWN_KEYS), None once changed in place.
+    _sort_keys = (_OWN_KEYS,)
+
+    def _appended(self, objects):
+        super(
+            OrderedList,
+            self,
+        )._appended(objects)
+        self._source = self._sort_keys = None
+
+    def _mutated(self):
+        super(
+            OrderedList,
+            self,
+        )._mutated()
+        self._source = self._sort_keys = None
+
+    def _then(self, key, descending):
+        """
+        Sorts the list by one more key.
+
+        :return: A new sorted OrderedList.
+        :rtype: OrderedList
+        """
+        plan = self._sort_plan + ((key, descending),)
+        keys = self._sort_keys
+        if keys is None:
+            # Changed in place since it was sorted.
+            return _ordered(
+                self,
+                plan,
+            )
+        source = self._source
+        if source is None:
+            # Sorted by the objects themselves, which are their own keys.
+            source = list(self)
+            keys = (source,)
+        return _sorted_by_keys(
+            source,
+            keys
+            + (
+                _keys(
+                    source,
+                    key,
+                ),
+            ),
+            plan,
+        )
+
+    def then_by(self, expression=None):
+        """
+        Returns a new list sorted further by the provided expression,
+        among the objects the previous sort keys consider equal.
+
+        :param expression: The expression to determine the sorting order of ties.
+        :type expression: function or None
+        :return: A new sorted OrderedList.
+        :rtype: OrderedList
+        """
+        return self._then(
+            expression,
+            False,
+        )
+
+    def then_by_descending(self, expression=None):
+        """
+        Returns a new list sorted further by the provided expression, in descending order,
+        among the objects the previous sort keys consider equal.
+
+        :param expression: The expression to determine the sorting order of ties.
+        :type expression: function or None
+        :return: A new sorted OrderedList.
+        :rtype: OrderedList
+        """
+        return self._then(
+            expression,
+            True,
+        )
@@ -0,0 +1,411 @@
+import os
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from itertools import (
+    chain,
+)
+
+from linqit.linq_list import (
+    _NO_EXPR,
+    _NONE,
+    List,
+    Stats,
+    _stats,
+    _where_predicate,
+)
+
+_BACKENDS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+# Chunks per worker when no chunk size is given, so uneven chunks still balance out.
+_CHUNKS_PER_WORKER = 4
+
+
+# The chunk functions run on the workers, and are module level so the process backend can pickle them.
+# A None expression stands for _NO_EXPR, which is a lambda and can't be pickled.
+
+
+def _select_chunk(expression, chunk):
+    return list(
+        map(
+            expression,
+            chunk,
+        )
+    )
+
+
+def _where_chunk(expression, filters, chunk):
+    return list(
+        filter(
+            _where_predicate(
+                expression,
+                filters,
+            ),
+            chunk,
+        )
+    )
+
+
+def _all_chunk(expression, chunk):
+    return all(
+        chunk
+        if expression is None
+        else map(
+            expression,
+            chunk,
+        )
+    )
+
+
+def _any_chunk(expression, chunk):
+    return any(
+        chunk
+        if expression is None
+        else map(
+            expression,
+            chunk,
+        )
+    )
+
+
+def _first_chunk(expression, chunk):
+    return next(
+        filter(
+            expression,
+            chunk,
+        ),
+        _NONE,
+    )
+
+
+def _stats_chunk(selector, chunk):
+    return _stats(
+        chunk,
+        selector,
+    )
+
+
+def _picklable(expression):
+    return None if expression is _NO_EXPR else expression
+
+
+def _merge_stats(first, second):
+    """
+    Combines the stats of two chunks, as computed by _stats(), into the stats of both.
+
+    :param first: The stats of the first chunk.
+    :type first: Stats
+    :param second: The stats of the second chunk.
+    :type second: Stats
+    :return: The stats of both chunks.
+    :rtype: Stats
+    """
+    if not second.count:
+        return first
+    if not first.count:
+        return second
+    count = first.count + second.count
+    total = first.sum + second.sum
+    delta = second.mean - first.mean
+    squares = (
+        first.variance * first.count
+        + second.variance * second.count
+        + delta * delta * first.count * second.count / count
+    )
+    return Stats(
+        count,
+        total,
+        min(
+            first.min,
+            second.min,
+        ),
+        max(
+            first.max,
+            second.max,
+        ),
+        total / count,
+        squares / count,
+    )
+
+
+class ParallelList(object):
+    """
+    Runs List operators on a pool of workers.
+    The list is split into chunks, each chunk is processed by a worker,
+    and the results are merged back in the original order.
+    With the process backend, expressions must be picklable (module level functions, not lambdas).
+    """
+
+    def __init__(self, source, workers=None, backend="thread", chunk_size=None):
+        """
+        Initializes a new ParallelList instance.
+
+        :param source: The list to process.
+        :type source: list
+        :param workers: The number of workers, the number of CPUs by default.
+        :type workers: int or None
+        :param backend: "thread" or "process".
+        :type backend: str
+        :param chunk_size: The number of elements per chunk.
+        :type chunk_size: int or None
+        :raises ValueError: If the backend is unknown.
+        """
+        if backend not in _BACKENDS:
+            raise ValueError(
+                "Unknown backend {backend!r}, expected one of: {backends}".format(
+                    backend=backend,
+                    backends=", ".join(sorted(_BACKENDS)),
+                )
+            )
+        self._source = source
+        self._workers = workers or os.cpu_count() or 1
+        self._backend = backend
+        self._chunk_size = chunk_size or max(
+            1,
+            -(-len(source) // (self._workers * _CHUNKS_PER_WORKER)),
+        )
+
+    def _chunks(self):
+        size = self._chunk_size
+        for start in range(
+            0,
+            len(self._source),
+            size,
+        ):
+            yield self._source[start : start + size]
+
+    def _submit(self, executor, function, *args):
+        """
+        Submits the function on every chunk.
+
+        :return: The futures of the chunks, in order.
+        :rtype: list
+        """
+        return [
+            executor.submit(
+                function,
+                *(args + (chunk,))
+            )
+            for chunk in self._chunks()
+        ]
+
+    def _map(self, function, *args):
+        """
+        Runs the function on every chunk, and waits for all the results.
+
+        :return: The results of the chunks, in order.
+        :rtype: list
+        """
+        with _BACKENDS[self._backend](self._workers) as executor:
+            return [
+                future.result()
+                for future in self._submit(
+                    executor,
+                    function,
+                    *args
+                )
+            ]
+
+    def _find(self, function, *args, found=bool, ordered=False):
+        """
+        Runs the function on every chunk, until a chunk result is found.
+        The chunks that were not started yet are then cancelled.
+
+        :param found: Checks whether a chunk result is the one looked for.
+        :type found: function
+        :param ordered: Whether the first found result, in chunk order, is required.
+        :type ordered: bool
+        :return: The found chunk result, or _NONE.
+        """
+        executor = _BACKENDS[self._backend](self._workers)
+        futures = self._submit(
+            executor,
+            function,
+            *args
+        )
+        try:
+            for future in futures if ordered else as_completed(futures):
+                result = future.result()
+                if found(result):
+                    return result
+            return _NONE
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def select(self, expression):
+        """
+        Returns a new list containing the values obtained by applying the expression to each object in the list.
+
+        :param expression: The expression to transform each object.
+        :type expression: function
+        :return: A new List containing the transformed values, in order.
+        :rtype: List
+        """
+        return List._new(
+            chain.from_iterable(
+                self._map(
+                    _select_chunk,
+                    expression,
+                )
+            )
+        )
+
+    def where(self, expression=None, **filters):
+        """
+        Returns a new list containing the objects that satisfy the given expression and filters.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function or None
+        :param filters: Additional attribute filters to apply, as in List.where().
+        :type filters: dict
+        :return: A new List containing the filtered objects, in order.
+        :rtype: List
+        """
+        return List._new(
+            chain.from_iterable(
+                self._map(
+                    _where_chunk,
+                    expression,
+                    filters,
+                )
+            )
+        )
+
+    def all(
+        self,
+        expression=_NO_EXPR,
+    ):
+        """
+        Checks if all objects in the list satisfy the given expression.
+        Pending chunks are cancelled as soon as a chunk fails.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function
+        :return: True if all objects satisfy the expression, False otherwise.
+        :rtype: bool
+        """
+        return (
+            self._find(
+                _all_chunk,
+                _picklable(expression),
+                found=lambda result: not result,
+            )
+            is _NONE
+        )
+
+    def any(
+        self,
+        expression=_NO_EXPR,
+    ):
+        """
+        Checks if any object in the list satisfies the given expression.
+        Pending chunks are cancelled as soon as a chunk succeeds.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function
+        :return: True if any object satisfies the expression, False otherwise.
+        :rtype: bool
+        """
+        return (
+            self._find(
+                _any_chunk,
+                _picklable(expression),
+            )
+            is not _NONE
+        )
+
+    def first(
+        self,
+        expression=_NO_EXPR,
+        default=_NONE,
+    ):
+        """
+        Returns the first object that satisfies the given expression.
+        Chunks after the one it is found in are cancelled.
+
+        :param expression: The expression to evaluate for each object.
+        :type expression: function or None
+        :param default: The default value to return if no matching value is found.
+        :return: The first matching object or the default value.
+        :rtype: object
+        :raises IndexError: If no matching value is found and no default value is provided.
+        """
+        found = self._find(
+            _first_chunk,
+            _picklable(expression),
+            ordered=True,
+            found=lambda result: result is not _NONE,
+        )
+        if found is _NONE:
+            found = default
+        if found is not _NONE:
+            return found
+        raise IndexError("No matching values")
+
+    def stats(self, selector=None):
+        """
+        Calculates count, sum, min, max, mean and variance of the values,
+        one chunk per worker, and merges the chunk results.
+
+        :param selector: An expression computing the value of each object.
+        :type selector: function or None
+        :return: The aggregates, as (count, sum, min, max, mean, variance).
+        :rtype: Stats
+        """
+        merged = Stats(0, 0, None, None, None, None)
+        for chunk_stats in self._map(
+            _stats_chunk,
+            selector,
+        ):
+            merged = _merge_stats(
+                merged,
+                chunk_stats,
+            )
+        return merged
+
+    @property
+    def sum(self):
+        """
+        Calculates the sum of all the values in the list.
+
+        :return: The sum of the values.
+        :rtype: object
+        """
+        return sum(self._map(sum))
+
+    @property
+    def min(self):
+        """
+        Finds the lowest value in the list.
+
+        :return: The lowest value.
+        :rtype: object
+        """
+        return min(self._map(min))
+
+    @property
+    def max(self):
+        """
+        Finds the highest value in the list.
+
+        :return: The highest value.
+        :rtype: object
+        """
+        return max(self._map(max))
+
+    @property
+    def avg(self):
+        """
+        Calculates the average of the numerical values in the list.
+
+        :return: The average of the values.
+        :rtype: float
+        """
+        return self.stats().mean
@@ -0,0 +1,106 @@
+import csv
+import json
+from collections import (
+    namedtuple,
+)
+
+# Read files in large buffered chunks, since records are parsed one line at a time.
+_BUFFER_SIZE = 1 << 20
+
+
+def _read_lines(lines):
+    for line in lines:
+        yield line.rstrip("\n")
+
+
+def _read_jsonl(lines, record=None):
+    decode = json.JSONDecoder().decode
+    for line in lines:
+        if line.strip():
+            obj = decode(line)
+            yield obj if record is None else record(**obj)
+
+
+def _read_csv(lines, fieldnames=None, restval=None, **fmtparams):
+    # As in csv.DictReader, blank lines are skipped and short rows are padded with restval.
+    reader = csv.reader(
+        lines,
+        **fmtparams
+    )
+    rows = filter(
+        None,
+        reader,
+    )
+    if fieldnames is None:
+        fieldnames = next(
+            rows,
+            None,
+        )
+        if fieldnames is None:
+            return
+    row = namedtuple(
+        "Row",
+        fieldnames,
+        rename=True,
+    )
+    size = len(row._fields)
+    for values in rows:
+        if len(values) < size:
+            values += [restval] * (size - len(values))
+        elif len(values) > size:
+            raise ValueError(
+                "Line {}: expected {} fields, found {}".format(
+                    reader.line_num,
+                    size,
+                    len(values),
+                )
+            )
+        yield row._make(values)
+
+
+class _FileSource(object):
+    """
+    A re-iterable source of the records of a text file.
+    The file is opened again on each iteration, read in large buffered chunks,
+    and its records are parsed one at a time, so memory does not grow with the file size,
+    and the file is closed as soon as the iteration stops.
+    """
+
+    def __init__(self, path, read, encoding="utf-8", newline=None, **options):
+        """
+        Initializes a new _FileSource instance.
+
+        :param path: The path of the file.
+        :type path: str
+        :param read: Parses the lines of the open file into records.
+        :type read: function
+        :param encoding: The encoding of the file.
+        :type encoding: str
+        :param newline: The newline mode of the file, as in open().
+        :type newline: str or None
+        :param options: Additional keyword arguments for read.
+        :type options: dict
+        """
+        self._path = path
+        self._read = read
+        self._encoding = encoding
+        self._newline = newline
+        self._options = options
+
+    def __iter__(self):
+        with open(
+            self._path,
+            encoding=self._encoding,
+            newline=self._newline,
+            buffering=_BUFFER_SIZE,
+        ) as lines:
+            for obj in self._read(
+                lines,
+                **self._options
+            ):
+                yield obj
+
+    def __repr__(self):
+        return "FileSource({path!r})".format(
+            path=self._path,
+        )
@@ -14,11 +14,12 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/avilum/linqit",
     packages=setuptools.find_packages(),
+    extras_require={"numpy": ["numpy"]},
     classifiers=[
-        "Programming Language :: Python :: 2",
         "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
         "License :: OSI Approved :: Apache Software License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=2.7,>=3.6",
+    python_requires=">=3.7",
 )
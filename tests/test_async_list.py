@@ -0,0 +1,214 @@
+import asyncio
+from unittest import (
+    TestCase,
+)
+
+from linqit import (
+    AsyncList,
+    List,
+)
+
+
+class Mock(object):
+    pass
+
+
+class ConcurrencyProbe(object):
+    """
+    An async expression that records how many of its calls are awaited at once.
+    """
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.running = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def __call__(self, x):
+        self.calls += 1
+        self.running += 1
+        self.peak = max(
+            self.peak,
+            self.running,
+        )
+        await asyncio.sleep(0)
+        self.running -= 1
+        return self.expression(x)
+
+
+async def numbers(count):
+    for i in range(count):
+        await asyncio.sleep(0)
+        yield i
+
+
+class AsyncOperatorsTests(TestCase):
+    """
+    UnitTests of the coroutine-aware List operators
+    """
+
+    def setUp(self):
+        self.list = List(range(100))
+
+    def test_select_async_keeps_order_and_bounds_concurrency(
+        self,
+    ):
+        probe = ConcurrencyProbe(lambda x: x * 2)
+        result = asyncio.run(self.list.select_async(probe, concurrency=5))
+        self.assertEqual(
+            result,
+            self.list.select(lambda x: x * 2),
+        )
+        self.assertTrue(
+            isinstance(
+                result,
+                List,
+            )
+        )
+        self.assertEqual(
+            probe.peak,
+            5,
+        )
+
+    def test_select_async_with_plain_function(
+        self,
+    ):
+        self.assertEqual(
+            asyncio.run(self.list.select_async(str)),
+            self.list.select(str),
+        )
+
+    def test_where_async(
+        self,
+    ):
+        probe = ConcurrencyProbe(lambda x: x % 10 == 0)
+        self.assertEqual(
+            asyncio.run(self.list.where_async(probe, concurrency=3)),
+            [0, 10, 20, 30, 40, 50, 60, 70, 80, 90],
+        )
+        self.assertEqual(
+            probe.peak,
+            3,
+        )
+
+    def test_first_async_stops_after_first_match(
+        self,
+    ):
+        probe = ConcurrencyProbe(lambda x: x >= 10)
+        self.assertEqual(
+            asyncio.run(self.list.first_async(probe, concurrency=4)),
+            10,
+        )
+        self.assertTrue(probe.calls < 20)
+        self.assertEqual(
+            None,
+            asyncio.run(self.list.first_async(lambda x: x < 0, None)),
+        )
+        self.assertRaises(
+            IndexError,
+            asyncio.run,
+            self.list.first_async(lambda x: x < 0),
+        )
+
+    def test_any_async_stops_after_first_match(
+        self,
+    ):
+        probe = ConcurrencyProbe(lambda x: x == 3)
+        self.assertTrue(asyncio.run(self.list.any_async(probe, concurrency=2)))
+        self.assertTrue(probe.calls < 10)
+        self.assertFalse(asyncio.run(self.list.any_async(lambda x: x < 0)))
+        self.assertFalse(asyncio.run(List().any_async()))
+
+    def test_failure_cancels_the_other_workers(
+        self,
+    ):
+        def fail_on_zero(x):
+            if x == 0:
+                raise ValueError(x)
+            return x
+
+        probe = ConcurrencyProbe(fail_on_zero)
+
+        async def calls_after_failure():
+            with self.assertRaises(ValueError):
+                await self.list.select_async(probe, concurrency=4)
+            calls = probe.calls
+            for _ in range(10):
+                await asyncio.sleep(0)
+            return calls, probe.calls
+
+        calls, later_calls = asyncio.run(calls_after_failure())
+        self.assertTrue(calls < 20)
+        self.assertEqual(
+            later_calls,
+            calls,
+        )
+
+    def test_invalid_concurrency_raises_value_error(
+        self,
+    ):
+        self.assertRaises(
+            ValueError,
+            asyncio.run,
+            self.list.select_async(str, concurrency=0),
+        )
+
+
+class AsyncListTests(TestCase):
+    """
+    UnitTests of the AsyncList streaming queries
+    """
+
+    def test_streams_async_source(
+        self,
+    ):
+        probe = ConcurrencyProbe(lambda x: x * 3)
+        query = (
+            AsyncList(numbers(1000))
+            .where(lambda x: x % 2 == 1)
+            .select(probe)
+            .skip(1)
+            .take(3)
+        )
+        self.assertEqual(
+            asyncio.run(query.to_list()),
+            [9, 15, 21],
+        )
+        self.assertEqual(
+            probe.calls,
+            4,
+        )
+
+    def test_sync_source_and_filters(
+        self,
+    ):
+        a, b = (
+            Mock(),
+            Mock(),
+        )
+        a.age = 20
+        b.age = 30
+        query = AsyncList(List(a, b)).where(age__gte=25)
+        self.assertEqual(
+            asyncio.run(query.to_list()),
+            [b],
+        )
+
+    def test_first_and_any(
+        self,
+    ):
+        async def is_big(
+            x,
+        ):
+            return x > 5
+
+        self.assertEqual(
+            asyncio.run(AsyncList(numbers(1000)).first(is_big)),
+            6,
+        )
+        self.assertTrue(asyncio.run(AsyncList(range(10)).any(is_big)))
+        self.assertFalse(asyncio.run(AsyncList(range(3)).any(is_big)))
+        self.assertEqual(
+            None,
+            asyncio.run(AsyncList([]).first(default=None)),
+        )
@@ -0,0 +1,186 @@
+from array import (
+    array,
+)
+from unittest import (
+    TestCase,
+    skipIf,
+)
+from unittest.mock import (
+    patch,
+)
+
+from linqit import (
+    ColumnarList,
+    List,
+)
+from linqit.linq_list import (
+    numpy,
+)
+
+
+class Person(object):
+    def __init__(self, name, city, age, score):
+        self.name = name
+        self.city = city
+        self.age = age
+        self.score = score
+
+
+class ColumnarListTests(TestCase):
+    """
+    UnitTests of ColumnarList
+    """
+
+    def setUp(self):
+        self.people = ColumnarList.from_records(
+            [
+                Person("avi", "tel aviv", 23, 1.5),
+                Person("bill", "london", 41, 3.0),
+                Person("bob", "tel aviv", 77, 2.5),
+                Person("harry", None, 55, 0.5),
+            ]
+        )
+
+    def test_columns_are_compact(
+        self,
+    ):
+        self.assertEqual(
+            self.people.fields,
+            ("name", "city", "age", "score"),
+        )
+        self.assertEqual(
+            self.people.column("age"),
+            array("q", [23, 41, 77, 55]),
+        )
+        self.assertEqual(
+            self.people.column("score").typecode,
+            "d",
+        )
+        self.assertEqual(
+            self.people.column("city"),
+            ["tel aviv", "london", "tel aviv", None],
+        )
+
+    def test_from_mappings(
+        self,
+    ):
+        points = ColumnarList.from_records(
+            [
+                {"x": 1, "y": 2 ** 70},
+                {"x": 3, "y": 4},
+            ]
+        )
+        self.assertEqual(
+            points.column("x").typecode,
+            "q",
+        )
+        # Beyond int64, values are kept as Python's ints.
+        self.assertEqual(
+            points.column("y"),
+            [2 ** 70, 4],
+        )
+
+    def test_projection(
+        self,
+    ):
+        ages = self.people.age
+        self.assertTrue(
+            isinstance(
+                ages,
+                List,
+            )
+        )
+        self.assertEqual(
+            ages,
+            [23, 41, 77, 55],
+        )
+        self.assertEqual(
+            ages.avg,
+            49,
+        )
+
+    def test_records(
+        self,
+    ):
+        self.assertEqual(
+            len(self.people),
+            4,
+        )
+        self.assertEqual(
+            self.people[1].name,
+            "bill",
+        )
+        self.assertEqual(
+            [person.name for person in self.people[2:]],
+            ["bob", "harry"],
+        )
+        self.assertEqual(
+            self.people.first(lambda p: p.age > 50).name,
+            "bob",
+        )
+        self.assertEqual(
+            self.people.select(lambda p: p.age + 1),
+            [24, 42, 78, 56],
+        )
+        # Other operators run on the List of the records.
+        self.assertEqual(
+            self.people.max_by(lambda p: p.score).name,
+            "bill",
+        )
+
+    def test_where(
+        self,
+    ):
+        self.assertEqual(
+            self.people.where(age__gt=30, city="tel aviv").name,
+            ["bob"],
+        )
+        self.assertEqual(
+            self.people.where(
+                lambda p: p.score > 1,
+                city__isnull=False,
+            ).name,
+            ["avi", "bill", "bob"],
+        )
+        self.assertEqual(
+            self.people.where(name__in=["avi", "harry"], age__lte=30).name,
+            ["avi"],
+        )
+        with self.assertRaises(AttributeError):
+            self.people.where(height=3)
+
+    @skipIf(
+        numpy is None,
+        "NumPy is not installed",
+    )
+    def test_where_vectorized(
+        self,
+    ):
+        with patch(
+            "linqit.columnar._NUMPY_MIN_SIZE",
+            1,
+        ):
+            self.assertEqual(
+                self.people.where(age__gt=30, score__lt=3.0).name,
+                ["bob", "harry"],
+            )
+            self.assertEqual(
+                self.people.where(age__in=[23, 55], score__gte=1).name,
+                ["avi"],
+            )
+            self.assertEqual(
+                self.people.stats("age"),
+                (4, 196, 23, 77, 49, 390),
+            )
+
+    def test_stats(
+        self,
+    ):
+        self.assertEqual(
+            self.people.stats("age"),
+            (4, 196, 23, 77, 49, 390),
+        )
+        self.assertEqual(
+            self.people.stats(lambda p: p.age * 2).sum,
+            392,
+        )
@@ -0,0 +1,672 @@
+from types import (
+    SimpleNamespace,
+)
+from unittest import (
+    TestCase,
+)
+
+from linqit import (
+    Enumerable,
+    List,
+)
+from linqit.enumerable import (
+    _plan,
+)
+
+
+class EnumerableTests(TestCase):
+    """
+    UnitTests of the deferred Enumerable query pipeline
+    """
+
+    def setUp(self):
+        self.list = List(range(10))
+
+    def test_negative_counts(
+        self,
+    ):
+        # As in LINQ, a negative count skips nothing and takes nothing, on every surface.
+        for source in (
+            self.list,
+            self.list.lazy(),
+            self.list.view(),
+        ):
+            self.assertEqual(
+                list(source.skip(-2)),
+                list(range(10)),
+            )
+            self.assertEqual(
+                list(source.take(-1)),
+                [],
+            )
+        self.assertEqual(
+            self.list.lazy().order_by().skip(-2).take(3).to_list(),
+            [0, 1, 2],
+        )
+
+    def test_lazy_returns_enumerable(
+        self,
+    ):
+        self.assertTrue(
+            isinstance(
+                self.list.lazy(),
+                Enumerable,
+            )
+        )
+
+    def test_operators_are_deferred(
+        self,
+    ):
+        calls = []
+
+        def expression(
+            x,
+        ):
+            calls.append(x)
+            return x
+
+        query = self.list.lazy().select(expression).where(lambda x: x > 2)
+        self.assertEqual(
+            calls,
+            [],
+        )
+        query.to_list()
+        self.assertEqual(
+            len(calls),
+            10,
+        )
+
+    def test_to_list_returns_list(
+        self,
+    ):
+        result = self.list.lazy().to_list()
+        self.assertTrue(
+            isinstance(
+                result,
+                List,
+            )
+        )
+        self.assertEqual(
+            result,
+            self.list,
+        )
+
+    def test_chain_matches_eager_chain(
+        self,
+    ):
+        eager = (
+            self.list.where(lambda x: x % 2 == 0)
+            .select(lambda x: x * 10)
+            .except_for(lambda x: x == 40)
+            .skip(1)
+            .take(2)
+        )
+        lazy = (
+            self.list.lazy()
+            .where(lambda x: x % 2 == 0)
+            .select(lambda x: x * 10)
+            .except_for(lambda x: x == 40)
+            .skip(1)
+            .take(2)
+            .to_list()
+        )
+        self.assertEqual(
+            lazy,
+            eager,
+        )
+        self.assertEqual(
+            lazy,
+            [20, 60],
+        )
+
+    def test_where_with_filter_kwargs(
+        self,
+    ):
+        data = List(
+            [
+                type("Mock", (object,), {"name": "bob"})(),
+                type("Mock", (object,), {"name": "john"})(),
+            ]
+        )
+        self.assertEqual(
+            data.lazy().where(name="john").to_list(),
+            [data[1]],
+        )
+
+    def test_of_type(
+        self,
+    ):
+        data = List(1, "a", 2.0, "b")
+        self.assertEqual(
+            data.lazy().of_type(str).to_list(),
+            ["a", "b"],
+        )
+        self.assertRaises(
+            TypeError,
+            data.lazy().of_type,
+            "str",
+        )
+
+    def test_query_can_run_twice(
+        self,
+    ):
+        query = self.list.lazy().where(lambda x: x < 3)
+        self.assertEqual(
+            query.to_list(),
+            query.to_list(),
+        )
+
+    def test_terminal_operators(
+        self,
+    ):
+        query = self.list.lazy().where(lambda x: x > 4)
+        self.assertEqual(
+            query.first(),
+            5,
+        )
+        self.assertEqual(
+            query.last(),
+            9,
+        )
+        self.assertTrue(query.any(lambda x: x == 7))
+        self.assertTrue(query.all(lambda x: x > 4))
+        self.assertEqual(
+            query.sum,
+            35,
+        )
+        self.assertEqual(
+            query.min,
+            5,
+        )
+        self.assertEqual(
+            query.max,
+            9,
+        )
+        self.assertEqual(
+            query.avg,
+            7,
+        )
+
+    def test_first_without_match(
+        self,
+    ):
+        query = self.list.lazy().where(lambda x: x > 100)
+        self.assertRaises(
+            IndexError,
+            query.first,
+        )
+        self.assertEqual(
+            None,
+            query.first(default=None),
+        )
+        self.assertEqual(
+            None,
+            query.last(default=None),
+        )
+
+
+counter = 0
+
+
+def is_even(x):
+    global counter
+    counter += 1
+    return x % 2 == 0
+
+
+class EnumerableEarlyExitTests(TestCase):
+    """
+    Checks that terminal operators stop evaluating once they have enough results
+    """
+
+    def setUp(self):
+        global counter
+        counter = 0
+        self.list = List(range(1000))
+
+    def test_where_take_stops_after_enough_matches(
+        self,
+    ):
+        result = self.list.lazy().where(is_even).take(3).to_list()
+        self.assertEqual(
+            result,
+            [0, 2, 4],
+        )
+        self.assertEqual(
+            counter,
+            5,
+        )
+
+    def test_chunk_reads_one_batch_at_a_time(
+        self,
+    ):
+        batches = iter(self.list.lazy().where(is_even).chunk(4))
+        self.assertEqual(
+            next(batches),
+            [0, 2, 4, 6],
+        )
+        self.assertEqual(
+            counter,
+            7,
+        )
+
+    def test_where_take_zero_does_not_evaluate(
+        self,
+    ):
+        self.list.lazy().where(is_even).take(0).to_list()
+        self.assertEqual(
+            counter,
+            0,
+        )
+
+    def test_where_first_stops_at_first_match(
+        self,
+    ):
+        self.assertEqual(
+            self.list.lazy().where(is_even).first(lambda x: x > 10),
+            12,
+        )
+        self.assertEqual(
+            counter,
+            13,
+        )
+
+    def test_where_any_stops_at_first_match(
+        self,
+    ):
+        self.assertTrue(self.list.lazy().where(is_even).any(lambda x: x == 6))
+        self.assertEqual(
+            counter,
+            7,
+        )
+
+    def test_all_stops_at_first_failure(
+        self,
+    ):
+        self.assertFalse(self.list.lazy().all(is_even))
+        self.assertEqual(
+            counter,
+            2,
+        )
+
+    def test_where_skip_take_evaluates_only_needed_elements(
+        self,
+    ):
+        result = self.list.lazy().where(is_even).skip(2).take(2).to_list()
+        self.assertEqual(
+            result,
+            [4, 6],
+        )
+        self.assertEqual(
+            counter,
+            7,
+        )
+
+    def test_eager_where_evaluates_every_element(
+        self,
+    ):
+        self.list.where(is_even).take(3)
+        self.assertEqual(
+            counter,
+            1000,
+        )
+
+    def test_distinct_streams_mid_pipeline(
+        self,
+    ):
+        result = (
+            self.list.lazy()
+            .select(lambda x: x % 7)
+            .distinct()
+            .where(is_even)
+            .take(2)
+            .to_list()
+        )
+        self.assertEqual(
+            result,
+            [0, 2],
+        )
+        self.assertEqual(
+            counter,
+            3,
+        )
+
+    def test_distinct_with_key(
+        self,
+    ):
+        self.assertEqual(
+            List("apple", "avocado", "banana", "blueberry", "cherry")
+            .lazy()
+            .distinct(lambda s: s[0])
+            .to_list(),
+            ["apple", "banana", "cherry"],
+        )
+
+    def test_stats_streams_results(
+        self,
+    ):
+        stats = self.list.lazy().where(is_even).take(4).stats(lambda x: x * 2)
+        self.assertEqual(
+            stats,
+            (4, 24, 0, 12, 6, 20),
+        )
+        self.assertEqual(
+            counter,
+            7,
+        )
+
+
+class EnumerablePlanTests(TestCase):
+    """
+    UnitTests of the rewrites of the recorded steps
+    """
+
+    def setUp(self):
+        self.list = List(5, 3, 8, 1, 9, 2, 7, 3)
+
+    def test_adjacent_wheres_are_merged(
+        self,
+    ):
+        is_odd = lambda x: x % 2
+        is_small = lambda x: x < 9
+        query = self.list.lazy().where(is_odd).where(real__gt=2).where(is_small)
+        ((name, (checks,)),) = _plan(query._steps)
+        self.assertEqual(
+            name,
+            "where",
+        )
+        self.assertEqual(
+            checks,
+            (is_odd, {"real__gt": 2}, is_small),
+        )
+        self.assertEqual(
+            query.to_list(),
+            [5, 3, 7, 3],
+        )
+        query = self.list.lazy().where(real__gt=2).where(real__gt=4)
+        self.assertEqual(
+            _plan(query._steps),
+            [("where", (({"real__gt": 2}, {"real__gt": 4}),))],
+        )
+        self.assertEqual(
+            query.to_list(),
+            [5, 8, 9, 7],
+        )
+
+    def test_checks_keep_their_order(
+        self,
+    ):
+        values = List(
+            1,
+            SimpleNamespace(age=5),
+            SimpleNamespace(age=7),
+        )
+        is_object = lambda x: isinstance(
+            x,
+            SimpleNamespace,
+        )
+        expected = values.where(
+            is_object,
+            age=5,
+        )
+        self.assertEqual(
+            expected,
+            [values[1]],
+        )
+        # The guard runs first, as in List.where(), so the filter never reads the age of 1.
+        for query in (
+            values.lazy().where(is_object, age=5),
+            values.lazy().where(is_object).where(age=5),
+            values.lazy().where(is_object).order_by(str).where(age=5),
+        ):
+            self.assertEqual(
+                query.to_list(),
+                expected,
+            )
+
+    def test_where_runs_before_sorts(
+        self,
+    ):
+        sorted_objects = []
+
+        def key(x):
+            sorted_objects.append(x)
+            return x
+
+        query = self.list.lazy().order_by(key).where(real__gt=4).select(str)
+        self.assertEqual(
+            [name for name, _ in _plan(query._steps)],
+            ["where", "order_by", "select"],
+        )
+        self.assertEqual(
+            query.to_list(),
+            ["5", "7", "8", "9"],
+        )
+        self.assertEqual(
+            len(sorted_objects),
+            4,
+        )
+
+    def test_sort_skip_take_becomes_top(
+        self,
+    ):
+        query = self.list.lazy().order_by().skip(2).take(3)
+        self.assertEqual(
+            [name for name, _ in _plan(query._steps)],
+            ["top", "skip"],
+        )
+        self.assertEqual(
+            query.to_list(),
+            [3, 3, 5],
+        )
+
+    def test_unordered_terminals_drop_sorts(
+        self,
+    ):
+        query = self.list.lazy().order_by().where(real__gt=4).select(lambda x: x * 2)
+        self.assertEqual(
+            [name for name, _ in _plan(query._steps, ordered=False)],
+            ["where", "select"],
+        )
+        self.assertEqual(
+            [name for name, _ in _plan(query.take(2)._steps, ordered=False)],
+            ["where", "order_by", "select", "take"],
+        )
+        self.assertEqual(
+            query.sum,
+            58,
+        )
+        self.assertTrue(query.any(lambda x: x == 18))
+        self.assertEqual(
+            query.first(),
+            10,
+        )
+
+
+class EnumerableExplainTests(TestCase):
+    """
+    UnitTests of Enumerable.explain
+    """
+
+    def test_explain(
+        self,
+    ):
+        query = List(range(10)).lazy().where(is_even, real__gt=2).order_by_descending().take(2)
+        self.assertEqual(
+            query.explain(),
+            "source: List of 10 objects\n"
+            "1. where(is_even, real__gt=2)\n"
+            "2. top(2, None, True)",
+        )
+        self.assertEqual(
+            List().lazy().order_by(abs).then_by_descending().explain(),
+            "source: List of 0 objects\n1. order_by(abs, self descending)",
+        )
+
+    def test_explain_analyze(
+        self,
+    ):
+        lines = (
+            Enumerable(iter(range(10)))
+            .where(is_even)
+            .select(str)
+            .take(2)
+            .explain(analyze=True)
+            .splitlines()
+        )
+        self.assertEqual(
+            lines[:-1],
+            [
+                "source: range_iterator: 3 read",
+                "1. where(is_even): 3 in, 2 out",
+                "2. select(str): 2 in, 2 out",
+                "3. take(2): 2 in, 2 out",
+            ],
+        )
+        self.assertTrue(lines[-1].startswith("total: "))
+
+
+class EnumerableBatchTests(TestCase):
+    """
+    UnitTests of the chunk and window operators of Enumerable
+    """
+
+    def setUp(self):
+        self.list = List(range(7))
+
+    def test_chunk(
+        self,
+    ):
+        batches = self.list.lazy().chunk(3).to_list()
+        self.assertEqual(
+            batches,
+            [[0, 1, 2], [3, 4, 5], [6]],
+        )
+        self.assertTrue(
+            isinstance(
+                batches[0],
+                List,
+            )
+        )
+        self.assertEqual(
+            List().lazy().chunk(3).to_list(),
+            [],
+        )
+        # Works on one-shot iterators too.
+        self.assertEqual(
+            Enumerable(iter(range(4))).chunk(2).to_list(),
+            [[0, 1], [2, 3]],
+        )
+
+    def test_window(
+        self,
+    ):
+        self.assertEqual(
+            self.list.lazy().window(3).to_list(),
+            [[0, 1, 2], [1, 2, 3], [2, 3, 4], [3, 4, 5], [4, 5, 6]],
+        )
+        self.assertEqual(
+            self.list.lazy().window(2, step=2).to_list(),
+            [[0, 1], [2, 3], [4, 5]],
+        )
+        self.assertEqual(
+            self.list.lazy().window(2, step=3).to_list(),
+            [[0, 1], [3, 4]],
+        )
+        self.assertEqual(
+            self.list.lazy().window(8).to_list(),
+            [],
+        )
+
+    def test_invalid_sizes(
+        self,
+    ):
+        with self.assertRaises(ValueError):
+            self.list.lazy().chunk(0)
+        with self.assertRaises(ValueError):
+            self.list.lazy().window(2, step=0)
+
+
+class EnumerableOrderingTests(TestCase):
+    """
+    UnitTests of the ordering operators of Enumerable
+    """
+
+    def setUp(self):
+        self.list = List(5, 3, 8, 1, 9, 2, 7)
+
+    def test_order_by(
+        self,
+    ):
+        self.assertEqual(
+            self.list.lazy().order_by(lambda x: -x).to_list(),
+            self.list.order_by(lambda x: -x),
+        )
+
+    def test_order_by_take_becomes_top(
+        self,
+    ):
+        query = self.list.lazy().order_by().take(3)
+        self.assertEqual(
+            [name for name, _ in _plan(query._steps)],
+            ["top"],
+        )
+        self.assertEqual(
+            query.to_list(),
+            [1, 2, 3],
+        )
+        self.assertEqual(
+            self.list.lazy().order_by(lambda x: -x).take(2).to_list(),
+            [9, 8],
+        )
+
+    def test_then_by(
+        self,
+    ):
+        query = (
+            self.list.lazy()
+            .order_by(lambda x: x % 2)
+            .then_by_descending()
+        )
+        self.assertEqual(
+            [name for name, _ in _plan(query._steps)],
+            ["order_by"],
+        )
+        self.assertEqual(
+            query.to_list(),
+            [8, 2, 9, 7, 5, 3, 1],
+        )
+        self.assertEqual(
+            query.take(3).to_list(),
+            [8, 2, 9],
+        )
+        self.assertEqual(
+            self.list.lazy().order_by_descending().take(2).to_list(),
+            [9, 8],
+        )
+        with self.assertRaises(TypeError):
+            self.list.lazy().where(lambda x: x).then_by()
+
+    def test_top_and_bottom(
+        self,
+    ):
+        self.assertEqual(
+            self.list.lazy().where(lambda x: x % 2 == 1).top(2).to_list(),
+            [9, 7],
+        )
+        self.assertEqual(
+            self.list.lazy().bottom(2).to_list(),
+            [1, 2],
+        )
+
+    def test_min_by_and_max_by(
+        self,
+    ):
+        self.assertEqual(
+            self.list.lazy().min_by(lambda x: abs(x - 6)),
+            5,
+        )
+        self.assertEqual(
+            self.list.lazy().max_by(lambda x: -x),
+            1,
+        )
@@ -0,0 +1,299 @@
+import pickle
+from unittest import (
+    TestCase,
+)
+from unittest.mock import (
+    patch,
+)
+
+from linqit import (
+    ColumnarList,
+    List,
+    X,
+)
+from linqit.expressions import (
+    _leading_filters,
+)
+
+
+class Address(object):
+    def __init__(self, city):
+        self.city = city
+
+
+class Person(object):
+    def __init__(self, name, age, city=None):
+        self.name = name
+        self.age = age
+        self.address = Address(city)
+
+    def __repr__(self):
+        return self.name
+
+
+class ExpressionTests(TestCase):
+    """
+    UnitTests of the X expressions
+    """
+
+    def setUp(self):
+        self.people = List(
+            Person("avi", 23, "tel aviv"),
+            Person("bill", 41, "london"),
+            Person("bob", 77, "tel aviv"),
+            Person("harry", 12, "london"),
+        )
+
+    def test_evaluate(
+        self,
+    ):
+        bill = self.people[1]
+        self.assertEqual(X.name(bill), "bill")
+        self.assertEqual(X.address.city(bill), "london")
+        self.assertTrue((X.age > 15)(bill))
+        self.assertFalse((X.age <= 15)(bill))
+        self.assertEqual((X.age * 2 + 1)(bill), 83)
+        self.assertEqual((100 - X.age)(bill), 59)
+        self.assertEqual((-X.age)(bill), -41)
+        self.assertTrue(X.name.startswith("b")(bill))
+        self.assertTrue(X.name.upper().endswith("LL")(bill))
+        self.assertTrue(X.name.contains("il")(bill))
+        self.assertTrue(X.age.isin([41, 42])(bill))
+        self.assertEqual(X["a"]({"a": 1}), 1)
+        # Attribute names that aren't valid in Python source.
+        obj = type("Obj", (object,), {"class": 1, "two words": 2})()
+        self.assertEqual(getattr(X, "class")(obj), 1)
+        self.assertEqual((getattr(X, "two words") + 1)(obj), 3)
+
+    def test_logical_operators(
+        self,
+    ):
+        bill = self.people[1]
+        self.assertTrue(((X.age > 15) & X.name.startswith("b"))(bill))
+        self.assertFalse(((X.age > 50) & X.name.startswith("b"))(bill))
+        self.assertTrue(((X.age > 50) | X.name.startswith("b"))(bill))
+        self.assertFalse((~(X.age > 15))(bill))
+        # & short-circuits, like and.
+        self.assertFalse(((X.age > 50) & (X.name / 2))(bill))
+
+    def test_repr(
+        self,
+    ):
+        self.assertEqual(
+            repr((X.age > 15) & X.name.startswith("b")),
+            "((X.age > 15) & X.name.startswith('b'))",
+        )
+        self.assertEqual(
+            repr(~X.address.city.isin(["london"])),
+            "~X.address.city.isin(['london'])",
+        )
+
+    def test_no_truth_value(
+        self,
+    ):
+        with self.assertRaises(TypeError):
+            bool(X.age > 15)
+        with self.assertRaises(TypeError):
+            10 < X.age < 20
+        with self.assertRaises(TypeError):
+            X.age > 15 & X.name.startswith("b")
+        with self.assertRaises(TypeError):
+            X.age == 1 | X.age == 2
+        self.assertTrue((True & (X.age > 15))(self.people[1]))
+
+    def test_hash_by_identity(
+        self,
+    ):
+        expression = X.age > 15
+        self.assertEqual(
+            {expression: 1}[expression],
+            1,
+        )
+        self.assertNotEqual(
+            hash(expression),
+            hash(X.age > 15),
+        )
+
+    def test_private_attributes(
+        self,
+    ):
+        with self.assertRaises(AttributeError):
+            X._age
+        with self.assertRaises(AttributeError):
+            X.age = 1
+
+    def test_pickle(
+        self,
+    ):
+        expression = pickle.loads(pickle.dumps((X.age > 15) & X.name.startswith("b")))
+        self.assertEqual(
+            self.people.where(expression),
+            [self.people[1], self.people[2]],
+        )
+
+    def test_leading_filters(
+        self,
+    ):
+        self.assertEqual(
+            _leading_filters((X.age > 15) & X.name.startswith("b") & (X.address.city == "london")),
+            (
+                {
+                    "age__gt": 15,
+                    "name__startswith": "b",
+                    "address.city": "london",
+                },
+                None,
+            ),
+        )
+        filters, rest = _leading_filters((X.age >= 15) & (X.age.isin([1]) | (X.age != 2)))
+        self.assertEqual(
+            filters,
+            {"age__gte": 15},
+        )
+        self.assertEqual(
+            repr(rest),
+            "(X.age.isin([1]) | (X.age != 2))",
+        )
+        # The same filter twice is kept as an expression.
+        filters, rest = _leading_filters((X.age > 15) & (X.age > 20))
+        self.assertEqual(
+            filters,
+            {"age__gt": 15},
+        )
+        self.assertEqual(
+            repr(rest),
+            "(X.age > 20)",
+        )
+        # The comparisons after one that isn't a filter are kept in the expression, in order.
+        filters, rest = _leading_filters((X.age > 15) & (X.name.upper() == "BOB") & (X.age < 50))
+        self.assertEqual(
+            filters,
+            {"age__gt": 15},
+        )
+        self.assertEqual(
+            repr(rest),
+            "((X.name.upper() == 'BOB') & (X.age < 50))",
+        )
+
+    def test_and_keeps_its_order(
+        self,
+    ):
+        homeless = Person("dan", 30)
+        homeless.address = None
+        people = self.people + [homeless]
+        guarded = (X.address != None) & (X.address.city == "london")  # noqa: E711
+        bill, harry = people[1], people[3]
+        self.assertEqual(
+            people.where(guarded),
+            [bill, harry],
+        )
+        self.assertEqual(
+            people.where(guarded, age__gt=20),
+            [bill],
+        )
+        self.assertEqual(
+            people.lazy().where(guarded).to_list(),
+            [bill, harry],
+        )
+        self.assertEqual(
+            people.create_index("name").where((X.name == "dan") & guarded),
+            [],
+        )
+        self.assertEqual(
+            people.where(address__isnull=False, **{"address.city": "london"}),
+            [bill, harry],
+        )
+
+    def test_list_operators(
+        self,
+    ):
+        avi, bill, bob, harry = self.people
+        self.assertEqual(
+            self.people.where((X.age > 15) & X.name.startswith("b")),
+            [bill, bob],
+        )
+        self.assertEqual(
+            self.people.where(X.name.lower().endswith("y"), age__lt=30),
+            [harry],
+        )
+        self.assertEqual(
+            self.people.where(X.age > 15, age__lt=50),
+            [avi, bill],
+        )
+        self.assertEqual(
+            self.people.select(X.address.city),
+            ["tel aviv", "london", "tel aviv", "london"],
+        )
+        self.assertEqual(
+            self.people.order_by(X.age),
+            [harry, avi, bill, bob],
+        )
+        self.assertEqual(
+            self.people.order_by(X.address.city).then_by_descending(X.age),
+            [bill, harry, bob, avi],
+        )
+        self.assertEqual(
+            self.people.first(X.age > 50),
+            bob,
+        )
+        self.assertTrue(self.people.any(X.name == "harry"))
+        self.assertFalse(self.people.any(X.age > 100))
+
+    def test_where_uses_index(
+        self,
+    ):
+        people = self.people.create_index("name")
+        with patch.object(
+            List,
+            "_indexed_candidates",
+            wraps=people._indexed_candidates,
+        ) as indexed_candidates:
+            self.assertEqual(
+                people.where((X.name == "bob") & (X.age > 15)),
+                [people[2]],
+            )
+        indexed_candidates.assert_called_once_with(
+            {
+                "name": "bob",
+            }
+        )
+
+    def test_enumerable(
+        self,
+    ):
+        query = (
+            self.people.lazy()
+            .where(X.name.startswith("b"))
+            .where((X.age > 15) & (X.age.upper() == 1))
+            .select(X.age)
+        )
+        self.assertEqual(
+            query.explain(),
+            "source: List of 4 objects\n"
+            "1. where(X.name.startswith('b'), ((X.age > 15) & (X.age.upper() == 1)))\n"
+            "2. select(X.age)",
+        )
+        query = self.people.lazy().where((X.age > 15) & (X.name != "bob")).select(X.name)
+        self.assertEqual(
+            query.to_list(),
+            ["avi", "bill"],
+        )
+
+    def test_columnar(
+        self,
+    ):
+        people = ColumnarList.from_records(
+            {"name": person.name, "age": person.age} for person in self.people
+        )
+        with patch(
+            "linqit.columnar._NUMPY_MIN_SIZE",
+            1,
+        ):
+            self.assertEqual(
+                people.where((X.age > 15) & (X.age < 50) & X.name.startswith("a")).name,
+                ["avi"],
+            )
+            self.assertEqual(
+                people.where((X.age > 15) & X.name.endswith("l")).name,
+                ["bill"],
+            )
@@ -0,0 +1,146 @@
+from unittest import (
+    TestCase,
+)
+
+from linqit import (
+    List,
+)
+from linqit.grouping import (
+    Grouping,
+)
+
+
+class Person(object):
+    def __init__(self, name, city, age):
+        self.name = name
+        self.city = city
+        self.age = age
+
+
+class GroupingTests(TestCase):
+    """
+    UnitTests of group_by and to_lookup
+    """
+
+    def setUp(self):
+        self.people = List(
+            Person("avi", "tel aviv", 23),
+            Person("bill", "london", 41),
+            Person("bob", "tel aviv", 77),
+            Person("harry", "london", 55),
+            Person("zoe", "paris", 27),
+        )
+
+    def test_group_by_keeps_key_order(
+        self,
+    ):
+        groups = self.people.group_by(lambda p: p.city).to_list()
+        self.assertEqual(
+            [group.key for group in groups],
+            ["tel aviv", "london", "paris"],
+        )
+        self.assertTrue(
+            isinstance(
+                groups[0],
+                Grouping,
+            )
+        )
+        self.assertEqual(
+            groups[1],
+            [self.people[1], self.people[3]],
+        )
+        self.assertEqual(
+            groups[1].name,
+            ["bill", "harry"],
+        )
+
+    def test_group_by_with_element(
+        self,
+    ):
+        groups = self.people.group_by(
+            lambda p: p.city,
+            lambda p: p.age,
+        )
+        self.assertEqual(
+            [(group.key, group.sum) for group in groups],
+            [("tel aviv", 100), ("london", 96), ("paris", 27)],
+        )
+
+    def test_group_by_supports_list_operators(
+        self,
+    ):
+        self.assertEqual(
+            self.people.group_by(lambda p: p.city)
+            .where(lambda g: len(g) > 1)
+            .select(lambda g: g.key),
+            ["tel aviv", "london"],
+        )
+
+    def test_aggregate(
+        self,
+    ):
+        rows = self.people.group_by(lambda p: p.city).aggregate(
+            count="count",
+            total=("sum", lambda p: p.age),
+            youngest=("min", lambda p: p.age),
+            oldest=("max", lambda p: p.name),
+            average=("avg", lambda p: p.age),
+        )
+        self.assertEqual(
+            rows[0],
+            ("tel aviv", 2, 100, 23, "bob", 50),
+        )
+        self.assertEqual(
+            rows.total,
+            [100, 96, 27],
+        )
+        self.assertEqual(
+            rows[2].average,
+            27,
+        )
+
+    def test_aggregate_with_invalid_spec_raises_value_error(
+        self,
+    ):
+        groups = self.people.group_by(lambda p: p.city)
+        self.assertRaises(
+            ValueError,
+            groups.aggregate,
+            total=("median", lambda p: p.age),
+        )
+        self.assertRaises(
+            ValueError,
+            groups.aggregate,
+            key="count",
+        )
+
+    def test_to_lookup(
+        self,
+    ):
+        lookup = self.people.to_lookup(lambda p: p.city)
+        self.assertEqual(
+            lookup["paris"],
+            [self.people[4]],
+        )
+        self.assertEqual(
+            lookup["rome"],
+            [],
+        )
+        self.assertEqual(
+            lookup["rome"].key,
+            "rome",
+        )
+        self.assertFalse("rome" in lookup)
+
+    def test_lazy_group_by(
+        self,
+    ):
+        lookup = (
+            self.people.lazy()
+            .where(lambda p: p.age > 30)
+            .to_lookup(lambda p: p.city, lambda p: p.name)
+        )
+        self.assertEqual(
+            dict(lookup),
+            {"london": ["bill", "harry"], "tel aviv": ["bob"]},
+        )
@@ -0,0 +1,157 @@
+from unittest import (
+    TestCase,
+)
+
+from linqit import (
+    List,
+)
+
+
+class Record(object):
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+class JoinTests(TestCase):
+    """
+    UnitTests of join and group_join
+    """
+
+    def setUp(self):
+        self.users = List(
+            Record(id=1, name="avi"),
+            Record(id=2, name="bill"),
+            Record(id=3, name="zoe"),
+        )
+        self.orders = List(
+            Record(user_id=3, item="pizza"),
+            Record(user_id=1, item="book"),
+            Record(user_id=3, item="pasta"),
+            Record(user_id=4, item="ghost"),
+        )
+
+    def _join(self, outer, inner, **kwargs):
+        return outer.join(
+            inner,
+            lambda u: u.id,
+            lambda o: o.user_id,
+            lambda u, o: (u.name, o and o.item),
+            **kwargs
+        )
+
+    def test_inner_join_keeps_outer_then_inner_order(
+        self,
+    ):
+        expected = [
+            ("avi", "book"),
+            ("zoe", "pizza"),
+            ("zoe", "pasta"),
+        ]
+        self.assertEqual(
+            self._join(self.users, self.orders),
+            expected,
+        )
+        # Built on the outer side, when it is the smaller one.
+        self.assertEqual(
+            self._join(self.users, self.orders * 3),
+            [expected[0]] * 3 + [expected[1], expected[2]] * 3,
+        )
+
+    def test_join_default_result_and_iterator_inner(
+        self,
+    ):
+        self.assertEqual(
+            self.users.join(
+                iter(self.orders),
+                lambda u: u.id,
+                lambda o: o.user_id,
+            )[0],
+            (self.users[0], self.orders[1]),
+        )
+
+    def test_left_join(
+        self,
+    ):
+        self.assertEqual(
+            self._join(self.users, self.orders, how="left"),
+            [
+                ("avi", "book"),
+                ("bill", None),
+                ("zoe", "pizza"),
+                ("zoe", "pasta"),
+            ],
+        )
+
+    def test_semi_and_anti_join(
+        self,
+    ):
+        self.assertEqual(
+            self._join(self.users, self.orders, how="semi").name,
+            ["avi", "zoe"],
+        )
+        self.assertEqual(
+            self._join(self.users, self.orders, how="anti").name,
+            ["bill"],
+        )
+
+    def test_merge_join_matches_hash_join(
+        self,
+    ):
+        orders = self.orders.order_by(lambda o: o.user_id)
+        for how in ("inner", "left", "semi", "anti"):
+            self.assertEqual(
+                self._join(self.users, orders, how=how, strategy="merge"),
+                self._join(self.users, orders, how=how),
+            )
+
+    def test_merge_join_with_duplicate_outer_keys(
+        self,
+    ):
+        self.assertEqual(
+            List(1, 1, 2, 5).join(
+                [0, 1, 1, 5, 6],
+                lambda x: x,
+                lambda x: x,
+                lambda x, y: x * 10 + y,
+                strategy="merge",
+            ),
+            [11, 11, 11, 11, 55],
+        )
+
+    def test_group_join(
+        self,
+    ):
+        for strategy in ("hash", "merge"):
+            groups = self.users.group_join(
+                self.orders.order_by(lambda o: o.user_id),
+                lambda u: u.id,
+                lambda o: o.user_id,
+                lambda u, orders: (u.name, [o.item for o in orders]),
+                strategy=strategy,
+            )
+            self.assertEqual(
+                groups,
+                [
+                    ("avi", ["book"]),
+                    ("bill", []),
+                    ("zoe", ["pizza", "pasta"]),
+                ],
+            )
+
+    def test_unknown_join_raises_value_error(
+        self,
+    ):
+        self.assertRaises(
+            ValueError,
+            self._join,
+            self.users,
+            self.orders,
+            how="outer",
+        )
+        self.assertRaises(
+            ValueError,
+            self._join,
+            self.users,
+            self.orders,
+            strategy="nested",
+        )
@@ -1,12 +1,30 @@
 from datetime import (
     datetime,
 )
+from fractions import (
+    Fraction,
+)
+from threading import (
+    Thread,
+)
+from types import (
+    SimpleNamespace,
+)
 from unittest import (
     TestCase,
+    skipIf,
+)
+from unittest.mock import (
+    patch,
 )
 
 from linqit import (
     List,
+    X,
+)
+from linqit.linq_list import (
+    _NUMPY_MIN_SIZE,
+    numpy,
 )
 
 
@@ -249,6 +267,44 @@ class ListTests(TestCase):
             )
         )
 
+    def test_add_method_keeps_list_semantics(
+        self,
+    ):
+        self.assertEqual(
+            List(1, 2) + [3],
+            [1, 2, 3],
+        )
+        self.assertRaises(
+            TypeError,
+            lambda: List(1, 2) + (3,),
+        )
+        self.assertEqual(
+            List(1, 2) * 0,
+            [],
+        )
+        self.assertRaises(
+            TypeError,
+            lambda: List(1, 2) * 1.5,
+        )
+
+    def test_new_method(
+        self,
+    ):
+        new_list = List._new(x * 2 for x in range(3))
+        self.assertEqual(
+            new_list,
+            [0, 2, 4],
+        )
+        self.assertIs(
+            type(new_list),
+            List,
+        )
+        # A single list-like object is its objects, and not a list containing it.
+        self.assertEqual(
+            List._new((1, 2)),
+            [1, 2],
+        )
+
     def test_times_method(
         self,
     ):
@@ -272,6 +328,28 @@ class ListTests(TestCase):
                 List,
             )
         )
+        numbers = List(range(10))
+        plain = list(range(10))
+        for item in (
+            slice(None, 5),
+            slice(2, 8, 3),
+            slice(8, None),
+            slice(-3, None),
+            slice(None, None, -2),
+            slice(7, 2, -1),
+            slice(5, 5),
+            slice(20, None),
+        ):
+            self.assertEqual(
+                numbers[item],
+                plain[item],
+            )
+            self.assertTrue(
+                isinstance(
+                    numbers[item],
+                    List,
+                )
+            )
 
     def test_non_existing_attribute_raises_attribute_error(
         self,
@@ -767,3 +845,780 @@ class ListTests(TestCase):
             counter,
             4,
         )  # all 4 true
+
+    def test_intersect_method_keeps_order_and_duplicates(
+        self,
+    ):
+        self.assertEqual(
+            List(5, 1, 3, 1, 4).intersect([1, 4, 9]),
+            [1, 1, 4],
+        )
+
+    def test_intersect_method_with_unhashable_items(
+        self,
+    ):
+        self.assertEqual(
+            List([1], [2], 3).intersect(iter([[2], 3, {"a": 1}])),
+            [[2], 3],
+        )
+
+    def test_union_method(
+        self,
+    ):
+        self.assertEqual(
+            List(3, 1, 3, 2).union([2, 5, 1, 6]),
+            [3, 1, 2, 5, 6],
+        )
+
+    def test_union_method_with_unhashable_items(
+        self,
+    ):
+        self.assertEqual(
+            List([1], 2).union([[1], [3]]),
+            [[1], 2, [3]],
+        )
+
+    def test_except_items_method(
+        self,
+    ):
+        self.assertEqual(
+            List(5, 1, 3, 1, 4).except_items([1, 4]),
+            [5, 3],
+        )
+        self.assertEqual(
+            List([1], [2]).except_items([[1]]),
+            [[2]],
+        )
+
+    def test_distinct_method_keeps_order(
+        self,
+    ):
+        self.assertEqual(
+            List(3, 1, 3, 2, 1).distinct(),
+            [3, 1, 2],
+        )
+
+    def test_distinct_method_with_unhashable_items(
+        self,
+    ):
+        self.assertEqual(
+            List([1], 2, [1], 2).distinct(),
+            [[1], 2],
+        )
+
+    def test_distinct_method_with_key(
+        self,
+    ):
+        self.list.append(Mock())
+        self.list[2].name = "other"
+        self.list[2].age = 30
+        self.assertEqual(
+            self.list.distinct(lambda p: p.age),
+            [self.list[0], self.list[2]],
+        )
+
+    def test_mixed_iterable_and_plain_properties_are_not_flattened(
+        self,
+    ):
+        a, b = (
+            Mock(),
+            Mock(),
+        )
+        a.foo = [1, 2]
+        b.foo = 3
+        self.list = List(a, b)
+        self.assertEqual(
+            self.list.foo,
+            [[1, 2], 3],
+        )
+
+    def test_string_properties_are_not_flattened(
+        self,
+    ):
+        self.assertEqual(
+            self.list.name,
+            ["bob", "john"],
+        )
+
+    def test_method_properties_are_broadcast(
+        self,
+    ):
+        a = Person(
+            "Bob",
+            "Marley",
+            "Singing",
+            33,
+        )
+        b = Person(
+            "John",
+            "Doe",
+            "Coding",
+            27,
+        )
+        self.assertEqual(
+            List(a, b).do_something(),
+            [
+                "Bob Marley is singing.",
+                "John Doe is coding.",
+            ],
+        )
+
+    def test_empty_list_attribute_raises_attribute_error(
+        self,
+    ):
+        self.assertRaises(
+            AttributeError,
+            getattr,
+            List(),
+            "name",
+        )
+
+    def test_var_and_std_methods(
+        self,
+    ):
+        self.list = List(2, 4, 4, 4, 5, 5, 7, 9)
+        self.assertEqual(
+            self.list.var,
+            4,
+        )
+        self.assertEqual(
+            self.list.std,
+            2,
+        )
+
+    def test_median_method(
+        self,
+    ):
+        self.assertEqual(
+            List(5, 1, 3).median,
+            3,
+        )
+        self.assertEqual(
+            List(4, 1, 3, 2).median,
+            2.5,
+        )
+
+    def test_aggregate_types_do_not_depend_on_the_size(
+        self,
+    ):
+        for values in (
+            List(range(_NUMPY_MIN_SIZE - 1)),
+            List(range(_NUMPY_MIN_SIZE + 1)),
+        ):
+            for value in (
+                values.var,
+                values.std,
+                values.median,
+                values.percentile(50),
+            ):
+                self.assertIs(
+                    type(value),
+                    float,
+                )
+        self.assertEqual(
+            List(Fraction(1), Fraction(2)).median,
+            Fraction(3, 2),
+        )
+
+    def test_percentile_method(
+        self,
+    ):
+        self.list = List(
+            1,
+            2,
+            3,
+            4,
+            5,
+        )
+        self.assertEqual(
+            self.list.percentile(0),
+            1,
+        )
+        self.assertEqual(
+            self.list.percentile(50),
+            3,
+        )
+        self.assertEqual(
+            self.list.percentile(90),
+            4.6,
+        )
+        self.assertEqual(
+            self.list.percentile(100),
+            5,
+        )
+        self.assertRaises(
+            ValueError,
+            self.list.percentile,
+            101,
+        )
+        self.assertRaises(
+            ValueError,
+            List().percentile,
+            50,
+        )
+
+    @skipIf(
+        numpy is None,
+        "NumPy is not installed",
+    )
+    def test_numeric_aggregates_with_numpy_match_pure_python(
+        self,
+    ):
+        def aggregates(
+            values,
+        ):
+            return [
+                values.sum,
+                values.min,
+                values.max,
+                values.avg,
+                values.var,
+                values.std,
+                values.median,
+                values.percentile(37),
+            ]
+
+        for values in (
+            List(range(-7, _NUMPY_MIN_SIZE * 3, 3)),
+            List(x / 4.0 for x in range(_NUMPY_MIN_SIZE * 2)),
+        ):
+            self.assertTrue(values._numeric_array() is not None)
+            vectorized = aggregates(values)
+            with patch(
+                "linqit.linq_list.numpy",
+                None,
+            ):
+                self.assertTrue(values._numeric_array() is None)
+                pure = aggregates(values)
+            for vectorized_value, pure_value in zip(
+                vectorized,
+                pure,
+            ):
+                self.assertAlmostEqual(
+                    vectorized_value,
+                    pure_value,
+                )
+
+    @skipIf(
+        numpy is None,
+        "NumPy is not installed",
+    )
+    def test_numeric_aggregates_with_numpy_fall_back_on_big_ints(
+        self,
+    ):
+        values = List([2 ** 62] * _NUMPY_MIN_SIZE)
+        self.assertEqual(
+            values.sum,
+            2 ** 62 * _NUMPY_MIN_SIZE,
+        )
+        self.assertTrue(List([2 ** 70] * _NUMPY_MIN_SIZE)._numeric_array() is None)
+        self.assertTrue(List(["a"] * _NUMPY_MIN_SIZE)._numeric_array() is None)
+
+    def test_stats_method(
+        self,
+    ):
+        stats = List(2, 4, 4, 4, 5, 5, 7, 9).stats()
+        self.assertEqual(
+            stats,
+            (8, 40, 2, 9, 5, 4),
+        )
+        self.assertEqual(
+            stats.variance,
+            4,
+        )
+
+    def test_stats_method_with_selector(
+        self,
+    ):
+        self.list[1].age = 30
+        stats = self.list.stats(lambda p: p.age)
+        self.assertEqual(
+            (
+                stats.count,
+                stats.sum,
+                stats.min,
+                stats.max,
+                stats.mean,
+            ),
+            (2, 50, 20, 30, 25),
+        )
+
+    def test_stats_method_with_empty_list(
+        self,
+    ):
+        self.assertEqual(
+            List().stats(),
+            (0, 0, None, None, None, None),
+        )
+
+    def _get_people(
+        self,
+    ):
+        return List(
+            Person("jake", "samson", "Coding", 32),
+            Person("sam", "thompson", "Chess", 44),
+            Person("sarah", "smith", "Coding", 41),
+            Person("zoe", "lee", "Chess", 32),
+        )
+
+    def test_where_method_uses_index(
+        self,
+    ):
+        people = self._get_people().create_index("age")
+        global counter
+        counter = 0
+        self.assertEqual(
+            people.where(func_lee, age=32),
+            [people[3]],
+        )
+        self.assertEqual(
+            counter,
+            2,
+        )  # Only the two candidates from the index
+        self.assertEqual(
+            people.where(age=33),
+            [],
+        )
+
+    def test_where_method_uses_composite_index(
+        self,
+    ):
+        people = self._get_people().create_index("hobby", "age")
+        self.assertEqual(
+            people.where(hobby="Chess", age=32, first_name="zoe"),
+            [people[3]],
+        )
+        self.assertEqual(
+            people.where(hobby="Chess"),
+            [people[1], people[3]],
+        )
+
+    def test_index_follows_list_mutations(
+        self,
+    ):
+        people = self._get_people().create_index("age")
+        newcomer = Person("ann", "lee", "Chess", 32)
+        people.append(newcomer)
+        self.assertEqual(
+            people.where(age=32),
+            [people[0], people[3], newcomer],
+        )
+        people += [Person("bob", "lee", "Chess", 44)]
+        self.assertEqual(
+            len(people.where(age=44)),
+            2,
+        )
+        people.remove(newcomer)
+        people.insert(0, newcomer)
+        del people[1]
+        people[1] = Person("tim", "lee", "Chess", 32)
+        people.sort(key=lambda p: p.first_name)
+        self.assertEqual(
+            people.where(age=32).first_name,
+            ["ann", "tim", "zoe"],
+        )
+        people.pop()
+        people.clear()
+        self.assertEqual(
+            people.where(age=32),
+            [],
+        )
+
+    def test_where_method_with_unhashable_value_and_index(
+        self,
+    ):
+        people = self._get_people().create_index("age")
+        self.assertEqual(
+            people.where(age=[32]),
+            [],
+        )
+
+    def test_drop_index(
+        self,
+    ):
+        people = self._get_people().create_index("age")
+        people.drop_index("age")
+        people[0].age = 50
+        self.assertEqual(
+            people.where(age=50),
+            [people[0]],
+        )
+        self.assertRaises(
+            TypeError,
+            people.create_index,
+        )
+
+    def test_where_method_with_lookup_filters(
+        self,
+    ):
+        people = self._get_people()
+        self.assertEqual(
+            people.where(age__gt=32).first_name,
+            ["sam", "sarah"],
+        )
+        self.assertEqual(
+            people.where(age__gte=41, age__lt=44).first_name,
+            ["sarah"],
+        )
+        self.assertEqual(
+            people.where(age__lte=32, hobby__ne="Coding").first_name,
+            ["zoe"],
+        )
+        self.assertEqual(
+            people.where(last_name__in=["lee", "smith"]).first_name,
+            ["sarah", "zoe"],
+        )
+        self.assertEqual(
+            people.where(first_name__startswith="sa").first_name,
+            ["sam", "sarah"],
+        )
+        self.assertEqual(
+            people.where(hobby__isnull=True),
+            [],
+        )
+        self.assertEqual(
+            len(people.where(hobby__isnull=False, hobby="Chess", age=32)),
+            1,
+        )
+
+    def test_where_method_checks_filters_only_after_expression(
+        self,
+    ):
+        self.list.append(1)
+        self.assertEqual(
+            self.list.where(lambda x: x != 1, age__gt=15),
+            self.list[:2],
+        )
+
+    def test_last_method_with_expression(
+        self,
+    ):
+        self.list = List(1, 2, 3, 4)
+        self.assertEqual(
+            self.list.last(lambda x: x < 3),
+            2,
+        )
+        self.assertRaises(
+            IndexError,
+            List().last,
+        )
+
+    def test_top_method(
+        self,
+    ):
+        people = self._get_people()
+        self.assertEqual(
+            people.top(2, lambda p: p.age).first_name,
+            ["sam", "sarah"],
+        )
+        self.assertEqual(
+            people.top(3, lambda p: p.age, descending=False).first_name,
+            ["jake", "zoe", "sarah"],
+        )
+        self.assertEqual(
+            List(3, 1, 2).top(5),
+            [3, 2, 1],
+        )
+        self.assertEqual(
+            List(3, 1, 2).top(0),
+            [],
+        )
+
+    def test_bottom_method(
+        self,
+    ):
+        self.assertEqual(
+            List(5, 1, 4, 1, 3).bottom(3),
+            [1, 1, 3],
+        )
+
+    def test_min_by_and_max_by_methods(
+        self,
+    ):
+        people = self._get_people()
+        self.assertEqual(
+            people.min_by(lambda p: p.age),
+            people[0],
+        )
+        self.assertEqual(
+            people.max_by(lambda p: p.age),
+            people[1],
+        )
+        self.assertRaises(
+            ValueError,
+            List().max_by,
+            abs,
+        )
+
+    def test_query_cache(
+        self,
+    ):
+        calls = []
+
+        def is_odd(x):
+            calls.append(x)
+            return x % 2
+
+        numbers = List(1, 2, 3, 4, 5).enable_cache(maxsize=2)
+        self.assertEqual(
+            numbers.where(is_odd),
+            [1, 3, 5],
+        )
+        self.assertEqual(
+            numbers.where(is_odd),
+            [1, 3, 5],
+        )
+        self.assertEqual(
+            len(calls),
+            5,
+        )
+        self.assertEqual(
+            numbers.cache_info(),
+            (1, 1, 2, 1),
+        )
+
+        # Cached lists are copies.
+        numbers.where(is_odd).append(7)
+        self.assertEqual(
+            numbers.where(is_odd),
+            [1, 3, 5],
+        )
+
+        # Chained queries on a cached result are cached too.
+        odd = numbers.where(is_odd)
+        self.assertEqual(
+            odd.sum,
+            9,
+        )
+        self.assertEqual(
+            numbers.where(is_odd).sum,
+            9,
+        )
+        self.assertEqual(
+            numbers.cache_info()[:2],
+            (6, 2),
+        )
+
+    def test_query_cache_follows_changes(
+        self,
+    ):
+        numbers = List(3, 1, 2).enable_cache()
+        self.assertEqual(
+            numbers.max,
+            3,
+        )
+        numbers.append(4)
+        self.assertEqual(
+            numbers.max,
+            4,
+        )
+        numbers[0] = 5
+        self.assertEqual(
+            numbers.max,
+            5,
+        )
+        numbers.disable_cache()
+        self.assertEqual(
+            numbers.cache_info(),
+            (0, 0, 0, 0),
+        )
+        self.assertRaises(
+            ValueError,
+            numbers.enable_cache,
+            0,
+        )
+
+    def test_operators_are_only_wrapped_while_in_use(
+        self,
+    ):
+        def is_wrapped():
+            return hasattr(
+                vars(List)["first"],
+                "__wrapped__",
+            ) and hasattr(
+                vars(List)["sum"].fget,
+                "__wrapped__",
+            )
+
+        first, total = vars(List)["first"], vars(List)["sum"].fget
+        with List.profile():
+            self.assertTrue(is_wrapped())
+        numbers = List(1, 2).enable_cache()
+        self.assertTrue(is_wrapped())
+        self.assertEqual(
+            numbers.sum,
+            3,
+        )
+        del numbers
+        self.assertIs(
+            vars(List)["first"],
+            first,
+        )
+        self.assertIs(
+            vars(List)["sum"].fget,
+            total,
+        )
+
+    def test_query_cache_is_typed(
+        self,
+    ):
+        def is_big(x):
+            return x > 10
+
+        numbers = List(1, 2, 3).enable_cache()
+        for default in (0, False, 0.0):
+            self.assertIs(
+                type(
+                    numbers.first(
+                        is_big,
+                        default=default,
+                    )
+                ),
+                type(default),
+            )
+        self.assertEqual(
+            numbers.cache_info()[:2],
+            (0, 3),
+        )
+
+    def test_chunk_and_window_methods(
+        self,
+    ):
+        numbers = List(range(5))
+        self.assertEqual(
+            numbers.chunk(2).to_list(),
+            [[0, 1], [2, 3], [4]],
+        )
+        self.assertEqual(
+            numbers.window(4).select(lambda w: w.sum).to_list(),
+            [6, 10],
+        )
+
+    def test_profile(
+        self,
+    ):
+        forwarded = []
+        numbers = List(range(10))
+        with List.profile(forwarded.append) as profiles:
+            numbers.where(lambda x: x % 2).select(lambda x: x * 2).sum
+        self.assertEqual(
+            profiles,
+            forwarded,
+        )
+        self.assertEqual(
+            [
+                (
+                    profile.operator,
+                    profile.elements_in,
+                    profile.elements_out,
+                    profile.expression_calls,
+                )
+                for profile in profiles
+            ],
+            [
+                ("where", 10, 5, 10),
+                ("select", 5, 5, 5),
+                ("sum", 5, None, 0),
+            ],
+        )
+        self.assertTrue(profiles[0].result_size > 0)
+        self.assertTrue(profiles[0].seconds >= 0)
+        # Nothing is recorded outside of the block.
+        numbers.where(lambda x: x % 2)
+        self.assertEqual(
+            len(profiles),
+            3,
+        )
+
+    def test_profile_is_local_to_the_thread(
+        self,
+    ):
+        numbers = List(range(10))
+        with List.profile() as profiles:
+            other_thread = Thread(target=lambda: numbers.where(lambda x: x % 2))
+            other_thread.start()
+            other_thread.join()
+            numbers.select(lambda x: x * 2)
+        self.assertEqual(
+            profiles.operator,
+            ["select"],
+        )
+
+        in_thread = []
+
+        def profile_in_thread():
+            with List.profile() as thread_profiles:
+                numbers.where(lambda x: x % 2)
+            in_thread.extend(thread_profiles)
+
+        with List.profile() as profiles:
+            other_thread = Thread(target=profile_in_thread)
+            other_thread.start()
+            other_thread.join()
+        self.assertEqual(
+            profiles,
+            [],
+        )
+        self.assertEqual(
+            [profile.operator for profile in in_thread],
+            ["where"],
+        )
+
+    def test_profile_keeps_the_results(
+        self,
+    ):
+        handler = lambda x: x
+        items = List(
+            handler,
+            len,
+        )
+        objects = List(
+            SimpleNamespace(handler=handler),
+            SimpleNamespace(handler=None),
+        )
+        queries = [
+            lambda: items.contains(handler),
+            lambda: items.first(lambda x: False, default=handler),
+            lambda: items.last(lambda x: False, handler),
+            lambda: objects.where(handler=handler),
+            lambda: items.except_items([handler]),
+            lambda: objects.where(X.handler == handler),
+            lambda: items.select(lambda x: x is handler),
+        ]
+        expected = [query() for query in queries]
+        with List.profile() as profiles:
+            results = [query() for query in queries]
+        self.assertEqual(
+            results,
+            expected,
+        )
+        self.assertTrue(results[0])
+        self.assertIs(
+            results[1],
+            handler,
+        )
+        self.assertEqual(
+            len(results[3]),
+            1,
+        )
+        self.assertEqual(
+            profiles.operator,
+            ["contains", "first", "last", "where", "except_items", "where", "select"],
+        )
+
+    def test_profile_keeps_the_query_cache(
+        self,
+    ):
+        is_odd = lambda x: x % 2
+        numbers = List(range(10)).enable_cache()
+        with List.profile() as profiles:
+            numbers.where(is_odd)
+            numbers.where(is_odd)
+        self.assertEqual(
+            numbers.cache_info()[:2],
+            (1, 1),
+        )
+        self.assertEqual(
+            profiles.expression_calls,
+            [10, 0],
+        )
@@ -0,0 +1,167 @@
+from unittest import (
+    TestCase,
+)
+
+from linqit import (
+    List,
+    ListView,
+)
+
+
+class ListViewTests(TestCase):
+    """
+    UnitTests of the zero-copy ListView
+    """
+
+    def setUp(self):
+        self.list = List(range(10))
+        self.view = self.list.view()
+
+    def test_view_is_not_a_copy(
+        self,
+    ):
+        self.assertTrue(
+            isinstance(
+                self.view,
+                ListView,
+            )
+        )
+        self.assertTrue(self.view._parent is self.list)
+        self.assertEqual(
+            self.view,
+            self.list,
+        )
+
+    def test_view_with_range(
+        self,
+    ):
+        self.assertEqual(
+            self.list.view(2, 8, 2),
+            [2, 4, 6],
+        )
+        self.assertEqual(
+            self.list.view(step=-3),
+            [9, 6, 3, 0],
+        )
+
+    def test_slicing_skip_and_take_return_views(
+        self,
+    ):
+        window = self.view.skip(2).take(5)[1:-1]
+        self.assertTrue(window._parent is self.list)
+        self.assertEqual(
+            window,
+            [3, 4, 5],
+        )
+        self.assertEqual(
+            window[-1],
+            5,
+        )
+        self.assertEqual(
+            self.view.take(-1),
+            [],
+        )
+        self.assertRaises(
+            IndexError,
+            window.__getitem__,
+            3,
+        )
+
+    def test_first_and_last(
+        self,
+    ):
+        window = self.view.skip(3).take(4)
+        self.assertEqual(
+            window.first(),
+            3,
+        )
+        self.assertEqual(
+            window.last(),
+            6,
+        )
+        self.assertEqual(
+            window.last(lambda x: x % 2 == 1),
+            5,
+        )
+        self.assertEqual(
+            None,
+            window.last(lambda x: x > 100, None),
+        )
+        self.assertRaises(
+            IndexError,
+            window.first,
+            lambda x: x > 100,
+        )
+
+    def test_parent_changes_show_through(
+        self,
+    ):
+        window = self.view.take(3)
+        self.list[0] = 100
+        self.assertEqual(
+            window,
+            [100, 1, 2],
+        )
+
+    def test_parent_size_changes(
+        self,
+    ):
+        window = self.list.view(2, 8)
+        self.list.clear()
+        with self.assertRaises(RuntimeError):
+            list(window)
+        with self.assertRaises(RuntimeError):
+            window.first()
+        with self.assertRaises(RuntimeError):
+            window[0]
+        self.list.extend(range(20))
+        with self.assertRaises(RuntimeError):
+            window.last()
+        # Changing the view itself resizes its own list.
+        window = List(range(10)).view(2, 8)
+        window.append(8)
+        del window[0]
+        self.assertEqual(
+            window.to_list(),
+            [3, 4, 5, 6, 7, 8],
+        )
+
+    def test_copy_on_write(
+        self,
+    ):
+        window = self.view.skip(7)
+        window[0] = 70
+        window.append(10)
+        del window[1]
+        window.insert(0, 6)
+        self.assertEqual(
+            window,
+            [6, 70, 9, 10],
+        )
+        self.assertEqual(
+            self.list,
+            list(range(10)),
+        )
+
+    def test_other_operators_run_on_a_copy(
+        self,
+    ):
+        window = self.view.skip(5)
+        self.assertEqual(
+            window.where(lambda x: x % 2 == 0),
+            [6, 8],
+        )
+        self.assertEqual(
+            window.sum,
+            35,
+        )
+        self.assertEqual(
+            window.lazy().select(lambda x: x * 2).to_list(),
+            [10, 12, 14, 16, 18],
+        )
+        self.assertRaises(
+            AttributeError,
+            getattr,
+            window,
+            "_missing",
+        )
@@ -0,0 +1,135 @@
+from unittest import (
+    TestCase,
+)
+
+from linqit import (
+    List,
+)
+from linqit.ordering import (
+    OrderedList,
+)
+
+
+class Person(object):
+    def __init__(self, name, city, age):
+        self.name = name
+        self.city = city
+        self.age = age
+
+
+class OrderingTests(TestCase):
+    """
+    UnitTests of order_by, order_by_descending, then_by and then_by_descending
+    """
+
+    def setUp(self):
+        self.people = List(
+            Person("bob", "tel aviv", 41),
+            Person("avi", "tel aviv", 23),
+            Person("bill", "london", 41),
+            Person("zoe", "paris", 23),
+            Person("harry", "london", 55),
+            Person("dan", "london", 41),
+        )
+
+    def test_order_by_descending_is_stable(
+        self,
+    ):
+        ordered = self.people.order_by_descending(lambda p: p.age)
+        self.assertTrue(
+            isinstance(
+                ordered,
+                OrderedList,
+            )
+        )
+        self.assertEqual(
+            ordered.name,
+            ["harry", "bob", "bill", "dan", "avi", "zoe"],
+        )
+        self.assertEqual(
+            List(3, 1, 2).order_by_descending(),
+            [3, 2, 1],
+        )
+
+    def test_then_by(
+        self,
+    ):
+        ordered = (
+            self.people.order_by(lambda p: p.city)
+            .then_by_descending(lambda p: p.age)
+            .then_by(lambda p: p.name)
+        )
+        self.assertEqual(
+            ordered.name,
+            ["harry", "bill", "dan", "zoe", "bob", "avi"],
+        )
+        self.assertEqual(
+            ordered,
+            sorted(
+                sorted(
+                    sorted(
+                        self.people,
+                        key=lambda p: p.name,
+                    ),
+                    key=lambda p: p.age,
+                    reverse=True,
+                ),
+                key=lambda p: p.city,
+            ),
+        )
+
+    def test_keys_are_computed_once_per_object(
+        self,
+    ):
+        calls = []
+
+        def key(name):
+            return lambda p: calls.append(name) or getattr(
+                p,
+                name,
+            )
+
+        self.people.order_by(key("age")).then_by(key("city")).then_by(key("name"))
+        self.assertEqual(
+            calls.count("age"),
+            len(self.people),
+        )
+        self.assertEqual(
+            calls.count("city"),
+            len(self.people),
+        )
+        self.assertEqual(
+            calls.count("name"),
+            len(self.people),
+        )
+
+    def test_then_by_on_the_same_list(
+        self,
+    ):
+        by_age = self.people.order_by(lambda p: p.age)
+        self.assertEqual(
+            by_age.then_by(lambda p: p.name).name,
+            ["avi", "zoe", "bill", "bob", "dan", "harry"],
+        )
+        self.assertEqual(
+            by_age.then_by_descending(lambda p: p.city).name,
+            ["avi", "zoe", "bob", "bill", "dan", "harry"],
+        )
+        self.assertEqual(
+            List(2, 1, 2, 1).order_by().then_by(),
+            [1, 1, 2, 2],
+        )
+        self.assertEqual(
+            List("b", "a", "B").order_by(lambda s: s.lower()).then_by_descending(),
+            ["a", "b", "B"],
+        )
+
+    def test_then_by_after_change_sorts_again(
+        self,
+    ):
+        ordered = self.people.order_by(lambda p: p.age)
+        ordered.append(Person("amy", "paris", 30))
+        self.assertEqual(
+            ordered.then_by(lambda p: p.name).name,
+            ["avi", "zoe", "amy", "bill", "bob", "dan", "harry"],
+        )
@@ -0,0 +1,179 @@
+import threading
+import time
+from unittest import (
+    TestCase,
+)
+
+from linqit import (
+    List,
+)
+
+
+class Mock(object):
+    pass
+
+
+class ParallelListTests(TestCase):
+    """
+    UnitTests of the ParallelList operators
+    """
+
+    def setUp(self):
+        self.list = List(range(1000))
+        self.parallel = self.list.parallel(
+            workers=4,
+            chunk_size=64,
+        )
+
+    def test_select_keeps_order(
+        self,
+    ):
+        self.assertEqual(
+            self.parallel.select(lambda x: x * 2),
+            self.list.select(lambda x: x * 2),
+        )
+
+    def test_select_runs_on_several_threads(
+        self,
+    ):
+        threads = set()
+
+        def expression(
+            x,
+        ):
+            threads.add(threading.current_thread().ident)
+            return x
+
+        self.list.parallel(
+            workers=2,
+            chunk_size=1,
+        ).select(expression)
+        self.assertFalse(threading.main_thread().ident in threads)
+
+    def test_where_keeps_order(
+        self,
+    ):
+        self.assertEqual(
+            self.parallel.where(lambda x: x % 7 == 0),
+            self.list.where(lambda x: x % 7 == 0),
+        )
+
+    def test_where_with_filter_kwargs(
+        self,
+    ):
+        a, b = (
+            Mock(),
+            Mock(),
+        )
+        a.age = 20
+        b.age = 30
+        people = List(a, b) * 100
+        self.assertEqual(
+            people.parallel(chunk_size=7).where(age__gt=25),
+            people.where(age__gt=25),
+        )
+
+    def test_any_and_all(
+        self,
+    ):
+        self.assertTrue(self.parallel.any(lambda x: x == 999))
+        self.assertFalse(self.parallel.any(lambda x: x > 1000))
+        self.assertTrue(self.parallel.all(lambda x: x >= 0))
+        self.assertFalse(self.parallel.all(lambda x: x != 500))
+        self.assertTrue(self.parallel.any())
+        self.assertFalse(self.parallel.all())  # 0 is falsy
+        self.assertFalse(List().parallel().any())
+
+    def test_first_is_first_in_order(
+        self,
+    ):
+        self.assertEqual(
+            self.parallel.first(lambda x: x % 100 == 99),
+            99,
+        )
+        self.assertEqual(
+            None,
+            self.parallel.first(lambda x: x < 0, None),
+        )
+        self.assertRaises(
+            IndexError,
+            self.parallel.first,
+            lambda x: x < 0,
+        )
+
+    def test_first_cancels_remaining_chunks(
+        self,
+    ):
+        calls = []
+
+        def expression(
+            x,
+        ):
+            calls.append(x)
+            time.sleep(0.001)
+            return x == 0
+
+        self.assertEqual(
+            self.list.parallel(
+                workers=1,
+                chunk_size=1,
+            ).first(expression),
+            0,
+        )
+        self.assertTrue(len(calls) < len(self.list))
+
+    def test_aggregates(
+        self,
+    ):
+        self.assertEqual(
+            self.parallel.sum,
+            self.list.sum,
+        )
+        self.assertEqual(
+            self.parallel.min,
+            0,
+        )
+        self.assertEqual(
+            self.parallel.max,
+            999,
+        )
+        self.assertAlmostEqual(
+            self.parallel.avg,
+            self.list.avg,
+        )
+        stats = self.parallel.stats()
+        expected = self.list.stats()
+        self.assertEqual(
+            stats[:4],
+            expected[:4],
+        )
+        self.assertAlmostEqual(
+            stats.variance,
+            expected.variance,
+        )
+
+    def test_process_backend(
+        self,
+    ):
+        parallel = self.list.parallel(
+            workers=2,
+            backend="process",
+        )
+        self.assertEqual(
+            parallel.select(abs),
+            self.list,
+        )
+        self.assertTrue(parallel.any())
+        self.assertEqual(
+            parallel.first(),
+            1,
+        )
+
+    def test_unknown_backend_raises_value_error(
+        self,
+    ):
+        self.assertRaises(
+            ValueError,
+            self.list.parallel,
+            backend="gpu",
+        )
@@ -0,0 +1,166 @@
+import os
+import shutil
+import tempfile
+from types import (
+    SimpleNamespace,
+)
+from unittest import (
+    TestCase,
+)
+
+from linqit import (
+    Enumerable,
+    List,
+)
+
+
+class FileSourceTests(TestCase):
+    """
+    UnitTests of from_lines, from_jsonl and from_csv
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write(self, name, text):
+        path = os.path.join(
+            self.directory,
+            name,
+        )
+        with open(
+            path,
+            "w",
+            encoding="utf-8",
+            newline="",
+        ) as f:
+            f.write(text)
+        return path
+
+    def test_from_lines(
+        self,
+    ):
+        path = self._write(
+            "log.txt",
+            "first\nsecond\r\nthird",
+        )
+        lines = List.from_lines(path)
+        self.assertTrue(
+            isinstance(
+                lines,
+                Enumerable,
+            )
+        )
+        self.assertEqual(
+            lines.to_list(),
+            ["first", "second", "third"],
+        )
+        # The file is read again on each run.
+        self.assertEqual(
+            lines.where(lambda line: line.startswith("s")).to_list(),
+            ["second"],
+        )
+        self.assertEqual(
+            lines.chunk(2).to_list(),
+            [["first", "second"], ["third"]],
+        )
+
+    def test_from_jsonl(
+        self,
+    ):
+        path = self._write(
+            "log.jsonl",
+            '{"level": "info", "ms": 3}\n\n{"level": "error", "ms": 40}\n',
+        )
+        self.assertEqual(
+            List.from_jsonl(path).select(lambda r: r["ms"]).sum,
+            43,
+        )
+        self.assertEqual(
+            List.from_jsonl(
+                path,
+                record=SimpleNamespace,
+            )
+            .where(level="error")
+            .first()
+            .ms,
+            40,
+        )
+
+    def test_from_jsonl_stops_reading_early(
+        self,
+    ):
+        path = self._write(
+            "log.jsonl",
+            '{"id": 1}\n{"id": 2}\nnot json\n',
+        )
+        records = List.from_jsonl(path)
+        self.assertEqual(
+            records.first(),
+            {"id": 1},
+        )
+        self.assertEqual(
+            records.take(2).to_list(),
+            [{"id": 1}, {"id": 2}],
+        )
+        with self.assertRaises(ValueError):
+            records.to_list()
+
+    def test_from_csv(
+        self,
+    ):
+        path = self._write(
+            "people.csv",
+            "name,age\r\navi,23\r\n\"smith, bob\",41\r\n",
+        )
+        people = List.from_csv(path)
+        self.assertEqual(
+            people.select(lambda p: p.name).to_list(),
+            ["avi", "smith, bob"],
+        )
+        self.assertEqual(
+            people.where(age="41").first().name,
+            "smith, bob",
+        )
+        self.assertEqual(
+            List.from_csv(
+                path,
+                fieldnames=["a", "b"],
+            ).first(),
+            ("name", "age"),
+        )
+
+    def test_from_csv_ragged_rows(
+        self,
+    ):
+        path = self._write(
+            "people.csv",
+            "\r\nname,age,city\r\navi,23,london\r\n\r\nbill,41\r\n",
+        )
+        self.assertEqual(
+            List.from_csv(path).to_list(),
+            [("avi", "23", "london"), ("bill", "41", None)],
+        )
+        self.assertEqual(
+            List.from_csv(
+                path,
+                restval="",
+            ).last(),
+            ("bill", "41", ""),
+        )
+        path = self._write(
+            "long.csv",
+            "name,age\r\navi,23\r\nbill,41,london\r\n",
+        )
+        people = List.from_csv(path)
+        self.assertEqual(
+            people.first(),
+            ("avi", "23"),
+        )
+        with self.assertRaisesRegex(
+            ValueError,
+            "Line 3: expected 2 fields, found 3",
+        ):
+            people.to_list()